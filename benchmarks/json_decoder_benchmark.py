@@ -0,0 +1,51 @@
+"""
+Compares the time taken to decode the companyfacts and submissions test fixtures w/ each installed JsonDecoder backend.
+Run from the root of the repository:
+
+    python benchmarks/json_decoder_benchmark.py --repeat 50
+"""
+import argparse
+import os
+import sys
+import timeit
+from zipfile import ZipFile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from secpy.core.json_decoder import JsonDecoder
+
+RESOURCES = os.path.join(os.path.dirname(__file__), "..", "tests", "resources")
+
+
+def load_documents():
+    documents = {}
+    for filename in ("company_facts.json", "submissions.json"):
+        with open(os.path.join(RESOURCES, filename), "rb") as f:
+            documents[filename] = [f.read()]
+    with ZipFile(os.path.join(RESOURCES, "bulk_submissions.zip")) as zip_file:
+        documents["bulk_submissions.zip"] = [zip_file.read(filename) for filename in zip_file.namelist()]
+    return documents
+
+
+def benchmark(decoder, contents, repeat):
+    timer = timeit.Timer(lambda: [decoder.loads(content) for content in contents])
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="number of times each document is decoded, the fastest run is reported")
+    args = parser.parse_args()
+
+    backends = JsonDecoder.get_available_backends()
+    print("{:<24}{:>10}{:>10}{:>10}{:>10}".format("document", "MB", "backend", "ms", "speedup"))
+    for name, contents in load_documents().items():
+        size = sum(len(content) for content in contents) / 1e6
+        baseline = benchmark(JsonDecoder("json"), contents, args.repeat)
+        for backend in backends:
+            elapsed = baseline if backend == "json" else benchmark(JsonDecoder(backend), contents, args.repeat)
+            print("{:<24}{:>10.2f}{:>10}{:>10.2f}{:>9.1f}x".format(name, size, backend, elapsed * 1000, baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main()
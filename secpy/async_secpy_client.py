@@ -0,0 +1,78 @@
+from secpy.company_concept import CompanyConcept
+from secpy.company_facts import CompanyFacts
+from secpy.core.async_network_client import AsyncNetworkClient
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.utils.period_format_opts import PeriodFormatOpts
+from secpy.frames import Frames
+from secpy.submissions import Submissions
+
+
+class AsyncSECPyClient:
+    def __init__(self, user_agent, **kwargs):
+        """
+        asyncio counterpart to SECPyClient. Each method is awaitable, so many requests can be scheduled at once
+        (ie w/ asyncio.gather) and are fetched concurrently over a pooled connection at the rate allowed by the SEC.
+        Should be used as an async context manager or closed w/ close() once done
+        @param user_agent: unique identifiers to use in headers when making requests to SEC REST API
+        @param kwargs: passed to AsyncNetworkClient, ie max_requests_per_sec, max_retries, max_connections, json_decoder
+        """
+        self.user_agent = user_agent
+        self._network_client = AsyncNetworkClient(user_agent, **kwargs)
+
+    async def get_company_facts_for_cik(self, cik, lazy=False):
+        """
+        Request company facts data from SEC REST API for a given CIK
+        @param cik: str
+        @param lazy: bool, parse concepts on first access. See CompanyFacts
+        @return: CompanyFacts
+        """
+        response = await self._network_client.make_request_json(EndpointEnum.COMPANY_FACTS, CIK=cik)
+        return CompanyFacts(response, lazy)
+
+    async def get_submission_for_cik(self, cik):
+        """
+        Request submissions data from SEC REST API for a given CIK
+        @param cik: str
+        @return: Submissions
+        """
+        response = await self._network_client.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK=cik)
+        return Submissions(response)
+
+    async def get_company_concept_for_cik(self, cik, taxonomy, concept):
+        """
+        Request a single concept from SEC REST API for a given CIK
+        @param cik: str
+        @param taxonomy: str
+        @param concept: str
+        @return: CompanyConcept
+        """
+        response = await self._network_client.make_request_json(EndpointEnum.COMPANY_CONCEPT, CIK=cik, TAXONOMY=taxonomy, CONCEPT=concept)
+        return CompanyConcept(response)
+
+    async def get_frames(self, taxonomy, concept, unit, period_format, use_instantaneous=False):
+        """
+        Request frames data from SEC REST API for a given taxonomy/concept/unit/period
+        @param taxonomy: str
+        @param concept: str
+        @param unit: str
+        @param period_format: str, int or datetime.date. See PeriodFormatOpts.format_period_format_arg
+        @param use_instantaneous: bool
+        @return: Frames
+        """
+        period_format_arg = PeriodFormatOpts.format_period_format_arg(period_format, use_instantaneous)
+        response = await self._network_client.make_request_json(EndpointEnum.FRAMES,
+                                                                 TAXONOMY=taxonomy,
+                                                                 CONCEPT=concept,
+                                                                 UNIT=unit,
+                                                                 PERIOD_FORMAT=period_format_arg
+                                                                 )
+        return Frames(response)
+
+    async def close(self):
+        await self._network_client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,496 @@
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from zipfile import ZipFile
+
+import numpy as np
+
+from secpy.company_facts import CompanyFacts
+from secpy.core.json_decoder import JsonDecoder
+from secpy.core.utils.cik_opts import CIKOpts
+from secpy.core.utils.zip_opts import ZipOpts
+from secpy.submissions import Filing, Submissions
+
+
+class BulkDataStore:
+    # json key of each filing field -> column of the filings table, in the order of Filing.FilingSchemaEnum
+    FILING_COLUMNS = [
+        (Filing.FilingSchemaEnum.ACCESSION_NUMBER.value, "accession_number"),
+        (Filing.FilingSchemaEnum.FILING_DATE.value, "filing_date"),
+        (Filing.FilingSchemaEnum.REPORT_DATE.value, "report_date"),
+        (Filing.FilingSchemaEnum.ACCEPTANCE_DATE_TIME.value, "acceptance_date_time"),
+        (Filing.FilingSchemaEnum.ACT.value, "act"),
+        (Filing.FilingSchemaEnum.FORM.value, "form"),
+        (Filing.FilingSchemaEnum.FILE_NUMBER.value, "file_number"),
+        (Filing.FilingSchemaEnum.FILM_NUMBER.value, "film_number"),
+        (Filing.FilingSchemaEnum.ITEMS.value, "items"),
+        (Filing.FilingSchemaEnum.SIZE.value, "size"),
+        (Filing.FilingSchemaEnum.IS_XBRL.value, "is_xbrl"),
+        (Filing.FilingSchemaEnum.IS_INLINE_XBRL.value, "is_inline_xbrl"),
+        (Filing.FilingSchemaEnum.PRIMARY_DOCUMENT.value, "primary_document"),
+        (Filing.FilingSchemaEnum.PRIMARY_DOCUMENT_DESCRIPTION.value, "primary_document_description"),
+    ]
+
+    # keys of the bulk archives in the archive_members table
+    COMPANY_FACTS_ARCHIVE = "company_facts"
+    SUBMISSIONS_ARCHIVE = "submissions"
+
+    # fiscal_year of facts that don't report one in the arrays returned by query_facts
+    MISSING_FISCAL_YEAR = 0
+
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS companies (
+            cik TEXT PRIMARY KEY,
+            entity_name TEXT
+        );
+        CREATE TABLE IF NOT EXISTS concepts (
+            concept_id INTEGER PRIMARY KEY,
+            cik TEXT NOT NULL,
+            taxonomy TEXT NOT NULL,
+            concept TEXT NOT NULL,
+            label TEXT,
+            description TEXT
+        );
+        CREATE INDEX IF NOT EXISTS concepts_cik_idx ON concepts (cik);
+        CREATE INDEX IF NOT EXISTS concepts_taxonomy_concept_idx ON concepts (taxonomy, concept);
+        -- val has no declared type so ints and floats are stored as reported rather than coerced by column affinity
+        CREATE TABLE IF NOT EXISTS facts (
+            concept_id INTEGER NOT NULL,
+            unit TEXT NOT NULL,
+            start TEXT,
+            "end" TEXT NOT NULL,
+            val,
+            accn TEXT,
+            fy INTEGER,
+            fp TEXT,
+            form TEXT,
+            filed TEXT,
+            frame TEXT
+        );
+        CREATE INDEX IF NOT EXISTS facts_concept_id_idx ON facts (concept_id, unit, "end");
+        CREATE INDEX IF NOT EXISTS facts_frame_idx ON facts (frame);
+        CREATE TABLE IF NOT EXISTS submissions (
+            cik TEXT PRIMARY KEY,
+            metadata TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS filings (
+            cik TEXT NOT NULL,
+            accession_number TEXT NOT NULL,
+            filing_date TEXT,
+            report_date TEXT,
+            acceptance_date_time TEXT,
+            act TEXT,
+            form TEXT,
+            file_number TEXT,
+            film_number TEXT,
+            items TEXT,
+            size INTEGER,
+            is_xbrl INTEGER,
+            is_inline_xbrl INTEGER,
+            primary_document TEXT,
+            primary_document_description TEXT,
+            PRIMARY KEY (cik, accession_number)
+        );
+        CREATE INDEX IF NOT EXISTS filings_cik_filing_date_idx ON filings (cik, filing_date);
+        CREATE INDEX IF NOT EXISTS filings_form_filing_date_idx ON filings (form, filing_date);
+        -- CRC/size of the archive files each company was loaded from, used to only reload companies whose files changed
+        CREATE TABLE IF NOT EXISTS archive_members (
+            archive TEXT NOT NULL,
+            cik TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            crc INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            PRIMARY KEY (archive, filename)
+        );
+        CREATE INDEX IF NOT EXISTS archive_members_cik_idx ON archive_members (archive, cik);
+    """
+
+    def __init__(self, path, json_decoder=None):
+        """
+        Local SQLite store of the bulk company facts and submissions archives.
+        Converting an archive is a one-time step (see ingest_company_facts/ingest_submissions or BulkDataEndpoint.convert_to_store),
+        after which companies can be loaded w/o decompressing and parsing the archive again and facts/filings are indexed by CIK,
+        taxonomy/concept, frame and period so cross-sectional queries only read the rows they need
+        @param path: str, path of the SQLite database file, created if it doesn't exist
+        @param json_decoder: JsonDecoder, used to decode archive members and stored metadata. Defaults to the process-wide JsonDecoder
+        """
+        self.path = path
+        self.__json_decoder = json_decoder or JsonDecoder.shared()
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        self.__connection.executescript(self.__SCHEMA)
+
+    def close(self):
+        self.__connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def ingest_company_facts(self, archive_path, ciks=None):
+        """
+        Loads the companies in a bulk company facts archive into the store, replacing any data already stored for those companies
+        @param archive_path: str, full path of companyfacts.zip
+        @param ciks: set of 10 digit CIKs to load, all companies in the archive if None
+        @return: int, number of companies loaded
+        """
+        count = 0
+        with ZipFile(archive_path) as zip_file, self.__transaction():
+            for info in zip_file.infolist():
+                cik = ZipOpts.parse_cik_from_member_name(info.filename)
+                if cik and not ZipOpts.is_submissions_page_member(info.filename) and (ciks is None or cik in ciks):
+                    cik = self.__replace_company_facts(self.__json_decoder.loads(zip_file.read(info)))
+                    self.__insert_archive_members(self.COMPANY_FACTS_ARCHIVE, cik, [info])
+                    count += 1
+        return count
+
+    def ingest_submissions(self, archive_path, ciks=None):
+        """
+        Loads the companies in a bulk submissions archive into the store, replacing any data already stored for those companies.
+        The additional filings pages of a company (CIK##########-submissions-###.json) are merged into its filings
+        @param archive_path: str, full path of submissions.zip
+        @param ciks: set of 10 digit CIKs to load, all companies in the archive if None
+        @return: int, number of companies loaded
+        """
+        company_infos, page_infos = {}, {}
+        with ZipFile(archive_path) as zip_file:
+            for info in zip_file.infolist():
+                cik = ZipOpts.parse_cik_from_member_name(info.filename)
+                if cik is None or (ciks is not None and cik not in ciks):
+                    continue
+                if ZipOpts.is_submissions_page_member(info.filename):
+                    page_infos.setdefault(cik, []).append(info)
+                else:
+                    company_infos[cik] = info
+            with self.__transaction():
+                for cik, info in company_infos.items():
+                    cik_page_infos = sorted(page_infos.get(cik, []), key=lambda page_info: page_info.filename)
+                    pages = [self.__json_decoder.loads(zip_file.read(page_info)) for page_info in cik_page_infos]
+                    cik = self.__replace_submissions(self.__json_decoder.loads(zip_file.read(info)), pages)
+                    self.__insert_archive_members(self.SUBMISSIONS_ARCHIVE, cik, [info] + cik_page_infos)
+        return len(company_infos)
+
+    def put_company_facts(self, data):
+        """
+        Stores the company facts of a single company, replacing any facts already stored for it
+        @param data: dict, as returned by the company facts endpoint
+        @return: None
+        """
+        with self.__transaction():
+            self.__replace_company_facts(data)
+
+    def put_submissions(self, data, pages=None):
+        """
+        Stores the submissions of a single company, replacing any submissions already stored for it
+        @param data: dict, as returned by the submissions endpoint
+        @param pages: List[dict], additional filings pages of the company
+        @return: None
+        """
+        with self.__transaction():
+            self.__replace_submissions(data, pages or [])
+
+    def list_ciks(self):
+        """
+        Lists the CIKs of all companies w/ facts in the store
+        @return: List[str]
+        """
+        return [row[0] for row in self.__connection.execute("SELECT cik FROM companies ORDER BY cik")]
+
+    def list_submissions_ciks(self):
+        """
+        Lists the CIKs of all companies w/ submissions in the store
+        @return: List[str]
+        """
+        return [row[0] for row in self.__connection.execute("SELECT cik FROM submissions ORDER BY cik")]
+
+    def get_company_facts(self, cik, lazy=False, columnar=False):
+        """
+        Loads the company facts of a single company from the store
+        @param cik: str or int
+        @param lazy: bool, see CompanyFacts
+        @param columnar: bool, see CompanyFacts
+        @return: CompanyFacts
+        """
+        cik = CIKOpts.format_cik(cik)
+        company = self.__connection.execute("SELECT entity_name FROM companies WHERE cik = ?", (cik,)).fetchone()
+        if company is None:
+            raise KeyError("CIK {} is not in the store!".format(cik))
+        facts = {}
+        concepts = {}
+        for concept_id, taxonomy, concept, label, description in self.__connection.execute(
+                "SELECT concept_id, taxonomy, concept, label, description FROM concepts WHERE cik = ? ORDER BY concept_id", (cik,)):
+            concept_data = {"label": label, "description": description, "units": {}}
+            facts.setdefault(taxonomy, {})[concept] = concept_data
+            concepts[concept_id] = concept_data
+        for row in self.__connection.execute(
+                """SELECT f.concept_id, f.unit, f.start, f."end", f.val, f.accn, f.fy, f.fp, f.form, f.filed, f.frame
+                   FROM facts f JOIN concepts c ON c.concept_id = f.concept_id
+                   WHERE c.cik = ? ORDER BY f.rowid""", (cik,)):
+            concept_id, unit, start, end, val, accn, fy, fp, form, filed, frame = row
+            fact = {"end": end, "val": val, "accn": accn, "fy": fy, "fp": fp, "form": form, "filed": filed}
+            if start is not None:
+                fact["start"] = start
+            if frame is not None:
+                fact["frame"] = frame
+            concepts[concept_id]["units"].setdefault(unit, []).append(fact)
+        return CompanyFacts({"cik": cik, "entityName": company[0], "facts": facts}, lazy, columnar)
+
+    def get_submissions(self, cik):
+        """
+        Loads the submissions of a single company from the store.
+        All stored filings (including those from additional filings pages) are in the recent filings, newest first
+        @param cik: str or int
+        @return: Submissions
+        """
+        cik = CIKOpts.format_cik(cik)
+        submissions = self.__connection.execute("SELECT metadata FROM submissions WHERE cik = ?", (cik,)).fetchone()
+        if submissions is None:
+            raise KeyError("CIK {} is not in the store!".format(cik))
+        data = self.__json_decoder.loads(submissions[0])
+        columns = [column for _, column in self.FILING_COLUMNS]
+        rows = self.__connection.execute(
+            "SELECT {} FROM filings WHERE cik = ? ORDER BY filing_date DESC, acceptance_date_time DESC".format(", ".join(columns)), (cik,)
+        ).fetchall()
+        recent = {key: [row[i] for row in rows] for i, (key, _) in enumerate(self.FILING_COLUMNS)}
+        data["filings"] = {"recent": recent, "files": []}
+        return Submissions(data)
+
+    def query_facts(self,
+                    taxonomy,
+                    concept,
+                    unit=None,
+                    ciks=None,
+                    frame=None,
+                    fiscal_year=None,
+                    fiscal_period=None,
+                    form=None,
+                    start_date=None,
+                    end_date=None):
+        """
+        Queries the facts of a concept across all (or a subset of) companies in the store, ie Assets for every filer in CY2022Q4:
+            store.query_facts("us-gaap", "Assets", unit="USD", frame="CY2022Q4I")
+        Date bounds are inclusive ISO formatted strings compared against the end of the period of each fact
+        @param taxonomy: str, ie us-gaap
+        @param concept: str, ie Assets
+        @param unit: str, ie USD, or an iterable of units
+        @param ciks: iterable of CIKs (str or int) to restrict the query to
+        @param frame: str, ie CY2022Q4I, or an iterable of frames
+        @param fiscal_year: int
+        @param fiscal_period: str, ie FY, Q1
+        @param form: str, ie 10-K
+        @param start_date: str, only keep facts w/ a period ending on or after start_date
+        @param end_date: str, only keep facts w/ a period ending on or before end_date
+        @return: dict of column name -> numpy array w/ the columns cik, entity_name, unit, start, end, value, accn, fiscal_year,
+                 fiscal_period, form, filed and frame. Dates are datetime64[D] (NaT when missing) and a missing fiscal_year is 0
+        """
+        conditions = ["c.taxonomy = ?", "c.concept = ?"]
+        params = [taxonomy, concept]
+        for column, values in [("f.unit", unit), ("f.frame", frame)]:
+            if values is not None:
+                values = [values] if isinstance(values, str) else list(values)
+                conditions.append("{} IN ({})".format(column, ", ".join("?" * len(values))))
+                params.extend(values)
+        for condition, param in [("f.fy = ?", fiscal_year),
+                                 ("f.fp = ?", fiscal_period),
+                                 ("f.form = ?", form),
+                                 ('f."end" >= ?', start_date),
+                                 ('f."end" <= ?', end_date)]:
+            if param is not None:
+                conditions.append(condition)
+                params.append(param)
+        if ciks is not None:
+            ciks = [CIKOpts.format_cik(cik) for cik in ciks]
+            conditions.append("c.cik IN ({})".format(", ".join("?" * len(ciks))))
+            params.extend(ciks)
+        rows = self.__connection.execute(
+            """SELECT c.cik, co.entity_name, f.unit, f.start, f."end", f.val, f.accn, f.fy, f.fp, f.form, f.filed, f.frame
+               FROM facts f
+               JOIN concepts c ON c.concept_id = f.concept_id
+               JOIN companies co ON co.cik = c.cik
+               WHERE {} ORDER BY c.cik, f.rowid""".format(" AND ".join(conditions)), params
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * 12
+        cik, entity_name, unit, start, end, val, accn, fy, fp, form, filed, frame = columns
+        return {
+            "cik": self.__to_strings(cik),
+            "entity_name": self.__to_strings(entity_name),
+            "unit": self.__to_strings(unit),
+            "start": self.__to_dates(start),
+            "end": self.__to_dates(end),
+            "value": np.array(val, dtype=np.float64),
+            "accn": self.__to_strings(accn),
+            "fiscal_year": np.array([year or self.MISSING_FISCAL_YEAR for year in fy], dtype=np.int32),
+            "fiscal_period": self.__to_strings(fp),
+            "form": self.__to_strings(form),
+            "filed": self.__to_dates(filed),
+            "frame": self.__to_strings(frame)
+        }
+
+    def get_concept_labels(self, taxonomy, concept):
+        """
+        Gets the label and description each company in the store reported a concept w/
+        @param taxonomy: str, ie us-gaap
+        @param concept: str, ie Assets
+        @return: dict of 10 digit CIK -> (label, description)
+        """
+        rows = self.__connection.execute(
+            "SELECT cik, label, description FROM concepts WHERE taxonomy = ? AND concept = ?", (taxonomy, concept))
+        return {cik: (label, description) for cik, label, description in rows}
+
+    def query_filings(self, ciks=None, form=None, filed_after=None, filed_before=None):
+        """
+        Queries filings across all (or a subset of) companies in the store
+        @param ciks: iterable of CIKs (str or int) to restrict the query to
+        @param form: str, ie 10-K
+        @param filed_after: str, only keep filings filed on or after filed_after
+        @param filed_before: str, only keep filings filed on or before filed_before
+        @return: dict of column name -> numpy array w/ cik and the columns of FILING_COLUMNS.
+                 filing_date and report_date are datetime64[D] (NaT when missing)
+        """
+        conditions = []
+        params = []
+        for condition, param in [("form = ?", form), ("filing_date >= ?", filed_after), ("filing_date <= ?", filed_before)]:
+            if param is not None:
+                conditions.append(condition)
+                params.append(param)
+        if ciks is not None:
+            ciks = [CIKOpts.format_cik(cik) for cik in ciks]
+            conditions.append("cik IN ({})".format(", ".join("?" * len(ciks))))
+            params.extend(ciks)
+        column_names = ["cik"] + [column for _, column in self.FILING_COLUMNS]
+        rows = self.__connection.execute(
+            "SELECT {} FROM filings {} ORDER BY cik, filing_date DESC, acceptance_date_time DESC".format(
+                ", ".join(column_names), "WHERE " + " AND ".join(conditions) if conditions else ""), params
+        ).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(column_names)
+        result = {}
+        for column_name, column in zip(column_names, columns):
+            if column_name in ("filing_date", "report_date"):
+                result[column_name] = self.__to_dates(column)
+            elif column_name in ("size", "is_xbrl", "is_inline_xbrl"):
+                result[column_name] = np.array(column, dtype=np.int64)
+            else:
+                result[column_name] = self.__to_strings(column)
+        return result
+
+    def get_archive_members(self, archive):
+        """
+        Gets the CRC and uncompressed size of the archive files the stored companies were loaded from
+        @param archive: str, COMPANY_FACTS_ARCHIVE or SUBMISSIONS_ARCHIVE
+        @return: dict of filename -> (crc, size)
+        """
+        rows = self.__connection.execute("SELECT filename, crc, size FROM archive_members WHERE archive = ?", (archive,))
+        return {filename: (crc, size) for filename, crc, size in rows}
+
+    def delete_company_facts(self, cik):
+        """
+        Removes the facts stored for a company
+        @param cik: str or int
+        @return: None
+        """
+        with self.__transaction():
+            self.__delete_company_facts(CIKOpts.format_cik(cik))
+
+    def delete_submissions(self, cik):
+        """
+        Removes the submissions stored for a company
+        @param cik: str or int
+        @return: None
+        """
+        with self.__transaction():
+            self.__delete_submissions(CIKOpts.format_cik(cik))
+
+    def delete_company(self, cik):
+        """
+        Removes all facts and submissions stored for a company
+        @param cik: str or int
+        @return: None
+        """
+        with self.__transaction():
+            self.__delete_company_facts(CIKOpts.format_cik(cik))
+            self.__delete_submissions(CIKOpts.format_cik(cik))
+
+    @contextmanager
+    def __transaction(self):
+        # serializes writes to the store and commits them as a single transaction, rolled back if an exception is raised
+        with self.__lock:
+            self.__connection.execute("BEGIN")
+            try:
+                yield self.__connection
+            except BaseException:
+                self.__connection.rollback()
+                raise
+            self.__connection.commit()
+
+    def __replace_company_facts(self, data):
+        cik = CIKOpts.format_cik(data[CompanyFacts.CompanyFactsSchemaEnum.CIK.value])
+        self.__delete_company_facts(cik)
+        self.__connection.execute("INSERT INTO companies (cik, entity_name) VALUES (?, ?)",
+                                  (cik, data[CompanyFacts.CompanyFactsSchemaEnum.ENTITY_NAME.value]))
+        fact_rows = []
+        for taxonomy, concepts in data[CompanyFacts.CompanyFactsSchemaEnum.FACTS.value].items():
+            for concept, concept_data in concepts.items():
+                cursor = self.__connection.execute(
+                    "INSERT INTO concepts (cik, taxonomy, concept, label, description) VALUES (?, ?, ?, ?, ?)",
+                    (cik, taxonomy, concept, concept_data.get("label"), concept_data.get("description")))
+                concept_id = cursor.lastrowid
+                for unit, facts in concept_data["units"].items():
+                    fact_rows.extend((concept_id, unit, fact.get("start"), fact["end"], fact["val"], fact.get("accn"), fact.get("fy"),
+                                      fact.get("fp"), fact.get("form"), fact.get("filed"), fact.get("frame")) for fact in facts)
+        self.__connection.executemany(
+            'INSERT INTO facts (concept_id, unit, start, "end", val, accn, fy, fp, form, filed, frame) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            fact_rows)
+        return cik
+
+    def __delete_company_facts(self, cik):
+        self.__connection.execute("DELETE FROM facts WHERE concept_id IN (SELECT concept_id FROM concepts WHERE cik = ?)", (cik,))
+        self.__connection.execute("DELETE FROM concepts WHERE cik = ?", (cik,))
+        self.__connection.execute("DELETE FROM companies WHERE cik = ?", (cik,))
+        self.__delete_archive_members(self.COMPANY_FACTS_ARCHIVE, cik)
+
+    def __replace_submissions(self, data, pages):
+        cik = CIKOpts.format_cik(data[Submissions.SubmissionsSchemaEnum.CIK.value])
+        self.__delete_submissions(cik)
+        metadata = {k: v for k, v in data.items() if k != Submissions.SubmissionsSchemaEnum.FILINGS.value}
+        self.__connection.execute("INSERT INTO submissions (cik, metadata) VALUES (?, ?)", (cik, json.dumps(metadata)))
+        recent = data[Submissions.SubmissionsSchemaEnum.FILINGS.value]["recent"]
+        for filings in [recent] + pages:
+            self.__insert_filings(cik, filings)
+        return cik
+
+    def __insert_filings(self, cik, filings):
+        num_filings = len(filings[Filing.FilingSchemaEnum.ACCESSION_NUMBER.value])
+        columns = [filings.get(key, [None] * num_filings) for key, _ in self.FILING_COLUMNS]
+        # the first filing of a page can repeat the last filing of the previous one, only the first copy is kept
+        self.__connection.executemany(
+            "INSERT OR IGNORE INTO filings (cik, {}) VALUES (?, {})".format(
+                ", ".join(column for _, column in self.FILING_COLUMNS), ", ".join("?" * len(self.FILING_COLUMNS))),
+            ((cik,) + row for row in zip(*columns)))
+
+    def __delete_submissions(self, cik):
+        self.__connection.execute("DELETE FROM filings WHERE cik = ?", (cik,))
+        self.__connection.execute("DELETE FROM submissions WHERE cik = ?", (cik,))
+        self.__delete_archive_members(self.SUBMISSIONS_ARCHIVE, cik)
+
+    def __insert_archive_members(self, archive, cik, infos):
+        self.__connection.executemany("INSERT INTO archive_members (archive, cik, filename, crc, size) VALUES (?, ?, ?, ?, ?)",
+                                      [(archive, cik, info.filename, info.CRC, info.file_size) for info in infos])
+
+    def __delete_archive_members(self, archive, cik):
+        self.__connection.execute("DELETE FROM archive_members WHERE archive = ? AND cik = ?", (archive, cik))
+
+    @staticmethod
+    def __to_strings(values):
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+        return array
+
+    @staticmethod
+    def __to_dates(values):
+        return np.array([value if value else "NaT" for value in values], dtype="datetime64[D]")
+
@@ -19,6 +19,28 @@ class CompanyConceptEndpoint(BaseEndpointMixin):
         response = self._validate_args_and_make_request(self._endpoint, CIK=cik, TAXONOMY=taxonomy, CONCEPT=concept)
         return CompanyConcept(response)
 
+    def get_company_concept_for_tickers(self, tickers, taxonomy, concept, max_workers=None):
+        """
+        Request a single concept for several tickers concurrently
+        @param tickers: iterable of str
+        @param taxonomy: str
+        @param concept: str
+        @param max_workers: int, number of worker threads to use
+        @return: generator of BatchResult keyed by ticker, yielded in the order that requests finish
+        """
+        return self._run_batch(lambda ticker: self.get_company_concept_for_ticker(ticker, taxonomy, concept), tickers, max_workers)
+
+    def get_company_concept_for_ciks(self, ciks, taxonomy, concept, max_workers=None):
+        """
+        Request a single concept for several CIKs concurrently
+        @param ciks: iterable of str
+        @param taxonomy: str
+        @param concept: str
+        @param max_workers: int, number of worker threads to use
+        @return: generator of BatchResult keyed by CIK, yielded in the order that requests finish
+        """
+        return self._run_batch(lambda cik: self.get_company_concept_for_cik(cik, taxonomy, concept), ciks, max_workers)
+
 
 class CompanyConcept(HasFactMixin):
     class CompanyConceptSchema(Enum):
@@ -30,12 +52,13 @@ class CompanyConcept(HasFactMixin):
         ENTITY_NAME = "entityName"
         UNITS = "units"
 
-    def __init__(self, data):
+    def __init__(self, data, columnar=False):
         """
         Container class for CompanyConcept data
         @param data: dict
+        @param columnar: bool, store the facts of each unit in a FactTable instead of a list of Fact instances
         """
-        super().__init__(data, data[self.CompanyConceptSchema.TAG.value])
+        super().__init__(data, data[self.CompanyConceptSchema.TAG.value], columnar=columnar)
         self.cik = data[self.CompanyConceptSchema.CIK.value]
         self.taxonomy = data[self.CompanyConceptSchema.TAXONOMY.value]
         self.label = data.get(self.CompanyConceptSchema.LABEL.value)
@@ -1,12 +1,22 @@
 from enum import Enum
-from datetime import datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from functools import partial
 
+import numpy as np
+
+from secpy.core.as_of_index import AsOfIndex
 from secpy.core.bulk_data import BulkDataEndpoint
 from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.fact_table import FactTable
+from secpy.core.json_stream_reader import JsonStreamReader
+from secpy.core.lazy_namespace import LazyNamespace
 from secpy.core.mixins.base_endpoint_mixin import BaseEndpointMixin
+from secpy.core.mixins.slots_data_object_mixin import SlotsDataObjectMixin
 from types import SimpleNamespace
 
 from secpy.core.utils.cik_opts import CIKOpts
+from secpy.core.utils.namespace_opts import NamespaceOpts
 
 
 class CompanyFactsEndpoint(BaseEndpointMixin):
@@ -15,13 +25,35 @@ class CompanyFactsEndpoint(BaseEndpointMixin):
     """
     _endpoint = EndpointEnum.COMPANY_FACTS
 
-    def get_company_facts_for_ticker(self, ticker):
+    def get_company_facts_for_ticker(self, ticker, lazy=False, columnar=False):
         cte_object = self._ticker_cte_map.lookup_ticker(ticker)
-        return self.get_company_facts_for_cik(cte_object.cik)
+        return self.get_company_facts_for_cik(cte_object.cik, lazy, columnar)
 
-    def get_company_facts_for_cik(self, cik):
+    def get_company_facts_for_cik(self, cik, lazy=False, columnar=False):
         response = self._validate_args_and_make_request(self._endpoint, CIK=cik)
-        return CompanyFacts(response)
+        return CompanyFacts(response, lazy, columnar)
+
+    def get_company_facts_for_tickers(self, tickers, max_workers=None, lazy=False, columnar=False):
+        """
+        Request company facts data for several tickers concurrently
+        @param tickers: iterable of str
+        @param max_workers: int, number of worker threads to use
+        @param lazy: bool, parse concepts on first access. See CompanyFacts
+        @param columnar: bool, store facts in FactTables. See CompanyFacts
+        @return: generator of BatchResult keyed by ticker, yielded in the order that requests finish
+        """
+        return self._run_batch(partial(self.get_company_facts_for_ticker, lazy=lazy, columnar=columnar), tickers, max_workers)
+
+    def get_company_facts_for_ciks(self, ciks, max_workers=None, lazy=False, columnar=False):
+        """
+        Request company facts data for several CIKs concurrently
+        @param ciks: iterable of str
+        @param max_workers: int, number of worker threads to use
+        @param lazy: bool, parse concepts on first access. See CompanyFacts
+        @param columnar: bool, store facts in FactTables. See CompanyFacts
+        @return: generator of BatchResult keyed by CIK, yielded in the order that requests finish
+        """
+        return self._run_batch(partial(self.get_company_facts_for_cik, lazy=lazy, columnar=columnar), ciks, max_workers)
 
 
 class CompanyFactsBulkEndpoint(BulkDataEndpoint):
@@ -30,8 +62,59 @@ class CompanyFactsBulkEndpoint(BulkDataEndpoint):
     """
     _endpoint = EndpointEnum.BULK_COMPANY_FACTS
 
-    def _parse_data(self, data):
-        return CompanyFacts(data)
+    def __init__(self, user_agent, existing_archive=None, lazy=False, columnar=False, **kwargs):
+        """
+        @param lazy: bool, parse concepts of each company on first access. See CompanyFacts
+        @param columnar: bool, store facts of each company in FactTables. See CompanyFacts
+        """
+        super().__init__(user_agent, existing_archive, **kwargs)
+        self.lazy = lazy
+        self.columnar = columnar
+
+    def _get_parser(self):
+        return partial(CompanyFacts, lazy=self.lazy, columnar=self.columnar)
+
+    def iter_concept_facts(self, concepts, ciks=None, tickers=None, exchanges=None):
+        """
+        Streams the facts of a handful of concepts out of every (selected) company in the archive.
+        Each company file is parsed incrementally as it is decompressed, so only the facts of one concept/unit are held in
+        memory at a time and the concepts that weren't asked for are skipped w/o being decoded. See CompanyFactsStreamParser
+        @param concepts: iterable of concept names (ie Assets) or taxonomy qualified concept names (ie us-gaap:Assets)
+        @param ciks: iterable of CIKs to include. See iter_companies
+        @param tickers: iterable of tickers to include. See iter_companies
+        @param exchanges: iterable of ExchangeEnum values to include. See iter_companies
+        @return: generator of ConceptUnitFacts
+        """
+        for stream in self.__iter_streams(ciks, tickers, exchanges):
+            with stream:
+                yield from CompanyFactsStreamParser(stream, concepts).iter_units()
+
+    def iter_partial_company_facts(self, concepts, ciks=None, tickers=None, exchanges=None):
+        """
+        Parses each (selected) company in the archive into a CompanyFacts that only holds the given concepts.
+        Like iter_concept_facts, the concepts that weren't asked for are skipped w/o being decoded
+        @param concepts: iterable of concept names (ie Assets) or taxonomy qualified concept names (ie us-gaap:Assets)
+        @param ciks: iterable of CIKs to include. See iter_companies
+        @param tickers: iterable of tickers to include. See iter_companies
+        @param exchanges: iterable of ExchangeEnum values to include. See iter_companies
+        @return: generator of CompanyFacts
+        """
+        for stream in self.__iter_streams(ciks, tickers, exchanges):
+            with stream:
+                yield CompanyFactsStreamParser(stream, concepts).parse(self.lazy, self.columnar)
+
+    def __iter_streams(self, ciks, tickers, exchanges):
+        for filename in self._get_company_filenames(ciks, tickers, exchanges):
+            yield self.bulk_data_file_object.open_file(filename)
+
+    def _ingest_archive(self, store, archive_path, ciks=None):
+        return store.ingest_company_facts(archive_path, ciks)
+
+    def _get_store_members(self, store):
+        return store.get_archive_members(store.COMPANY_FACTS_ARCHIVE)
+
+    def _delete_from_store(self, store, cik):
+        store.delete_company_facts(cik)
 
 
 class CompanyFacts:
@@ -40,17 +123,25 @@ class CompanyFacts:
         ENTITY_NAME = "entityName"
         FACTS = "facts"
 
-    def __init__(self, data):
+    def __init__(self, data, lazy=False, columnar=False):
         """
         Container class for company facts data.
         Data is divided between one or more accounting standards (AKA taxonomies) and then is further broken down into the individual
         concepts that describe various components of reported financial data for a given company.
         Each concept contains an array of data where each element represents the value of that fact for a given filing
+        In lazy mode the raw data is kept and each taxonomy, concept and unit is only parsed the first time it is accessed,
+        so looking up a handful of concepts doesn't pay for parsing every fact reported by the company.
+        In columnar mode the facts of each unit are stored in a FactTable instead of a list of Fact instances
         @param data: dict
+        @param lazy: bool, parse taxonomies/concepts/units on first access instead of up front
+        @param columnar: bool, store the facts of each unit in a FactTable
         """
         self.cik = self.__set_cik(data)
         self.entity_name = data[self.CompanyFactsSchemaEnum.ENTITY_NAME.value]
-        self.taxonomies = self.__parse_taxonomies(data)
+        self.lazy = lazy
+        self.columnar = columnar
+        self.taxonomies = self.__parse_taxonomies_lazily(data) if lazy else self.__parse_taxonomies(data)
+        self.__statement_history = None
 
     def __set_cik(self, data):
         cik = data[self.CompanyFactsSchemaEnum.CIK.value]
@@ -59,55 +150,128 @@ class CompanyFacts:
     def __parse_taxonomies(self, data):
         return SimpleNamespace(**{
             taxonomy_name.replace("-", "_"): SimpleNamespace(**{
-                concept_name:  Concept(concept_value, concept_name) for concept_name, concept_value in taxonomy_concepts.items()
+                concept_name:  Concept(concept_value, concept_name, columnar=self.columnar) for concept_name, concept_value in taxonomy_concepts.items()
             })
             for taxonomy_name, taxonomy_concepts in data[self.CompanyFactsSchemaEnum.FACTS.value].items()
         })
 
+    def __parse_taxonomies_lazily(self, data):
+        # module level functions rather than lambdas/bound methods, so lazily parsed CompanyFacts can be pickled,
+        # ie returned from the worker processes of BulkDataEndpoint.map_companies
+        return LazyNamespace(data[self.CompanyFactsSchemaEnum.FACTS.value],
+                             partial(_parse_taxonomy_lazily, self.columnar),
+                             key_func=_to_taxonomy_attribute_name)
+
     def list_taxonomies(self):
-        return list(self.taxonomies.__dict__.keys())
+        return NamespaceOpts.list_keys(self.taxonomies)
 
     def get_taxonomy(self, taxonomy):
-        return self.taxonomies.__dict__[taxonomy]
+        return NamespaceOpts.get(self.taxonomies, taxonomy)
+
+    def list_concepts(self, taxonomy):
+        return NamespaceOpts.list_keys(self.get_taxonomy(taxonomy))
 
     def get_concept(self, taxonomy, fact):
         taxonomy_data = self.get_taxonomy(taxonomy)
-        return taxonomy_data.__dict__[fact]
+        return NamespaceOpts.get(taxonomy_data, fact)
 
-    def get_statement_history(self):
+    def get_as_of_index(self, taxonomy, concept, unit, form=None, fiscal_period=None):
         """
-        Groups facts together by the form type, financial year, and financial period to form a Statment instance
-        @return: List[Statement]
+        Gets the point-in-time index over the facts of a concept in a single unit. See AsOfIndex
+        @param taxonomy: str, ie us_gaap
+        @param concept: str, ie Assets
+        @param unit: str, ie USD
+        @param form: str, only index facts reported on this form type, ie 10-K
+        @param fiscal_period: str, only index facts reported for this fiscal period, ie FY
+        @return: AsOfIndex
         """
-        filing_map = {}
-        for concepts in self.taxonomies.__dict__.values():
-            for concept_name, concept in concepts.__dict__.items():
-                form_period_unit_map = self.__get_form_period_map_for_concept(concept)
-                for form_period, facts in form_period_unit_map.items():
-                    if form_period not in filing_map:
-                        filing_map[form_period] = Statement(facts)
-                    else:
-                        existing_filing_map = filing_map[form_period]
-                        existing_filing_map.add_fact_to_map(concept_name, facts)
-        return StatementHistory(filing_map)
+        return self.get_concept(taxonomy, concept).get_as_of_index(unit, form, fiscal_period)
 
-    @staticmethod
-    def __get_form_period_map_for_concept(concept):
-        form_period_unit_map = {}
-        for unit_name, facts in concept.units.__dict__.items():
-            for fact in facts:
-                form_period = fact.get_form_frame()
-                if form_period not in form_period_unit_map:
-                    form_period_unit_map[form_period] = {unit_name: fact}
-                else:
-                    existing_form_period_unit_mapping = form_period_unit_map[form_period]
-                    existing_form_period_unit_mapping[unit_name] = fact
-        return form_period_unit_map
+    def get_value_as_of(self, taxonomy, concept, unit, as_of, form=None, fiscal_period=None):
+        """
+        Gets the latest reported value of a concept as known on a date, w/o looking ahead at facts filed after as_of
+        @param as_of: str, datetime.date or numpy.datetime64. Pass a list of dates to look up several at once
+        @return: int or float (None if nothing was filed by as_of), or a numpy array of float64 (NaN where nothing was filed) for a list of dates
+        """
+        index = self.get_as_of_index(taxonomy, concept, unit, form, fiscal_period)
+        return index.values_as_of(as_of) if isinstance(as_of, (list, tuple, np.ndarray)) else index.value_as_of(as_of)
+
+    def get_statement_history(self):
+        """
+        Groups facts together by the form type, financial year, and financial period to form a Statment instance.
+        The grouping is built in a single pass over the facts the first time it is requested and kept on the object,
+        so later calls are free
+        @return: StatementHistory
+        """
+        if self.__statement_history is None:
+            self.__statement_history = StatementHistory(self.__group_facts_by_statement())
+        return self.__statement_history
+
+    def __group_facts_by_statement(self):
+        statements = {}
+        # frame string of facts w/o a frame, formatted once per fiscal year/period rather than once per fact
+        periods = {}
+        for _, concepts in NamespaceOpts.items(self.taxonomies):
+            for concept_name, concept in NamespaceOpts.items(concepts):
+                for unit_name, facts in NamespaceOpts.items(concept.units):
+                    for fact in facts:
+                        period = fact.frame
+                        if not period:
+                            fiscal_year_period = (fact.fiscal_year, fact.fiscal_period)
+                            period = periods.get(fiscal_year_period)
+                            if period is None:
+                                period = periods[fiscal_year_period] = "CY{}{}".format(*fiscal_year_period)
+                        key = (fact.form, period)
+                        statement = statements.get(key)
+                        if statement is None:
+                            statement = statements[key] = Statement(period=period)
+                        statement._add_fact(concept_name, unit_name, fact)
+        return statements
 
 
 class StatementHistory:
+    FILED = "filed"
+    END = "end"
+
     def __init__(self, form_period_filing_map):
+        """
+        Statements of a company keyed by (form, period), where period is the frame of the facts in the statement, or
+        CY<fiscal year><fiscal period> for facts w/o a frame.
+        Statements are also indexed by form and by fiscal year/period, and their filed and period end dates are parsed
+        into ordinals once, sorted, so that date range, latest and as-of queries are binary searches
+        @param form_period_filing_map: dict, (form, period) -> Statement
+        """
         self.__form_period_filing_map = form_period_filing_map
+        self.__form_index = {}
+        self.__fiscal_period_index = {}
+        for (form, _), statement in form_period_filing_map.items():
+            self.__form_index.setdefault(form, []).append(statement)
+            self.__fiscal_period_index.setdefault((statement.fiscal_year, statement.fiscal_period), []).append(statement)
+        self.__date_indexes = {
+            self.FILED: self.__build_date_index(form_period_filing_map.values(), self.FILED),
+            self.END: self.__build_date_index(form_period_filing_map.values(), self.END)
+        }
+        self.__form_filed_indexes = {form: self.__build_date_index(statements, self.FILED) for form, statements in self.__form_index.items()}
+
+    @staticmethod
+    def __build_date_index(statements, date_field):
+        """
+        @return: tuple of (sorted list of date ordinals, list of Statement in the same order). Ties on date_field are
+                 ordered by period end date so the last statement of a day is the one covering the latest period
+        """
+        dated = [(date.fromisoformat(getattr(statement, date_field)).toordinal(),
+                  date.fromisoformat(statement.end).toordinal() if statement.end else 0,
+                  i,
+                  statement)
+                 for i, statement in enumerate(statements) if getattr(statement, date_field)]
+        dated.sort()
+        return [ordinal for ordinal, _, _, _ in dated], [statement for _, _, _, statement in dated]
+
+    @staticmethod
+    def __to_ordinal(value, date_format):
+        if isinstance(value, str):
+            value = datetime.strptime(value, date_format)
+        return value.toordinal()
 
     def get_all_statements(self):
         """
@@ -120,92 +284,192 @@ class StatementHistory:
         """
         Gets a Statement instance for a particular form and period if it exists
         @param form: str
-        @param period: str
+        @param period: str, ie CY2021Q4I or CY2021FY
         @return: Statement
         """
-        key = "{}_{}".format(form, period)
-        return self.__form_period_filing_map[key]
+        return self.__form_period_filing_map[(form, period)]
 
-    def get_statements_for_form(self, form):
+    def get_statements_for_form(self, form, exact=False):
         """
         Gets all statements for a particular form type
         @param form: str
+        @param exact: bool, only match form exactly. By default form types starting w/ form are matched too, ie 10-K also
+                      matches amendments (10-K/A)
+        @return: List[Statement], grouped by form type
+        """
+        if exact:
+            return list(self.__form_index.get(form, []))
+        # only the handful of distinct form types are compared, not every statement
+        return [statement
+                for indexed_form, statements in self.__form_index.items() if indexed_form.startswith(form)
+                for statement in statements]
+
+    def get_statements_for_fiscal_period(self, fiscal_year, fiscal_period=None):
+        """
+        Gets all statements for a particular fiscal year, and optionally fiscal period
+        @param fiscal_year: int
+        @param fiscal_period: str, ie FY, Q1
         @return: List[Statement]
         """
-        return [statement for key, statement in self.__form_period_filing_map.items() if key.startswith(form)]
+        if fiscal_period is not None:
+            return list(self.__fiscal_period_index.get((fiscal_year, fiscal_period), []))
+        return [statement for (year, _), statements in self.__fiscal_period_index.items() if year == fiscal_year for statement in statements]
 
-    def get_statements_for_date_range(self, start_date=None, end_date=None, date_format="%y/%m/%d"):
+    def get_statements_for_date_range(self, start_date=None, end_date=None, date_format="%y/%m/%d", date_field=FILED):
         """
-        Gets all statements that were filed w/in a given date range.
+        Gets all statements that were filed w/in a given date range, ordered by date. Bounds are exclusive.
         If start_date but not end_date is specified, all statements filed after start_date will be returned
         If end_date but not start_date is specified, all statements filed before end_date will be returned
-        @param start_date: str or datetime instance
-        @param end_date: str or datetime instance
+        @param start_date: str or datetime/date instance
+        @param end_date: str or datetime/date instance
         @param date_format: str, the date format of any string start_time/end_time args
+        @param date_field: str, FILED to select statements by the date they were filed or END by the end of their period
         @return: List[Statement]
         """
         assert start_date or end_date, "At least one of start_date or end_date arguments must be populated!"
-        if isinstance(start_date, str):
-            start_date = datetime.strptime(start_date, date_format)
-        if isinstance(end_date, str):
-            end_date = datetime.strptime(end_date, date_format)
+        assert date_field in self.__date_indexes, "date_field arg {} must be one of {}!".format(date_field, list(self.__date_indexes))
+        start_ordinal = self.__to_ordinal(start_date, date_format) if start_date else None
+        end_ordinal = self.__to_ordinal(end_date, date_format) if end_date else None
         if start_date and end_date:
-            assert start_date < end_date, "start_date cannot be greater than end_date!"
+            assert start_ordinal < end_ordinal, "start_date cannot be greater than end_date!"
+
+        ordinals, statements = self.__date_indexes[date_field]
+        lo = bisect_right(ordinals, start_ordinal) if start_date else 0
+        hi = bisect_left(ordinals, end_ordinal) if end_date else len(ordinals)
+        return statements[lo:hi]
 
-        result = []
-        for statement in self.__form_period_filing_map.values():
-            statement_filed_date = datetime.strptime(statement.filed, "%Y-%m-%d")
-            if start_date and end_date and start_date < statement_filed_date < end_date:
-                result.append(statement)
-                continue
-            if start_date and not end_date and statement_filed_date > start_date:
-                result.append(statement)
-            if end_date and not start_date and statement_filed_date < end_date:
-                result.append(statement)
-        return result
+    def get_latest_statements(self, n=1, as_of=None, form=None, date_format="%y/%m/%d"):
+        """
+        Gets the most recently filed statements, ie those that were known at a point in time
+        @param n: int, maximum number of statements to return
+        @param as_of: str or datetime/date instance, only consider statements filed on or before as_of. Defaults to all statements
+        @param form: str, only consider statements of this form type
+        @param date_format: str, the date format of a string as_of arg
+        @return: List[Statement], newest first
+        """
+        assert isinstance(n, int) and n > 0, "n arg {} must be a positive integer!".format(n)
+        if form is not None:
+            ordinals, statements = self.__form_filed_indexes.get(form, ([], []))
+        else:
+            ordinals, statements = self.__date_indexes[self.FILED]
+        hi = bisect_right(ordinals, self.__to_ordinal(as_of, date_format)) if as_of else len(ordinals)
+        return statements[max(hi - n, 0):hi][::-1]
+
+    def get_statement_as_of(self, as_of, form=None, date_format="%y/%m/%d"):
+        """
+        Gets the most recent statement filed on or before a point in time. Statements filed on the same day are ordered
+        by the end of their period
+        @param as_of: str or datetime/date instance
+        @param form: str, only consider statements of this form type
+        @param date_format: str, the date format of a string as_of arg
+        @return: Statement, None if no statement was filed by as_of
+        """
+        statements = self.get_latest_statements(1, as_of, form, date_format)
+        return statements[0] if statements else None
 
 
 class Statement:
-    def __init__(self, facts):
+    def __init__(self, facts=None, period=None):
         """
-        Contains an aggregation of all facts available for a company for a particular form type, fiscal year, and fiscal period
-        @facts: Initial Fact instance to initialize object attributes
+        Contains an aggregation of all facts available for a company for a particular form type, fiscal year, and fiscal period.
+        The statement's attributes are those of the fact of the first concept/unit added to it
+        @param facts: dict, unit -> Fact of a single concept to initialize the statement w/
+        @param period: str, frame of the statement, ie CY2021Q4I or CY2021FY
         """
-        fact = facts[list(facts.keys())[0]]
-        self.start = fact.start
-        self.end = fact.end
-        self.accn = fact.accn
-        self.fiscal_year = fact.fiscal_year
-        self.fiscal_period = fact.fiscal_period
-        self.form = fact.form
-        self.filed = fact.filed
-        self.__facts_map = facts
+        self.period = period
+        self.start = None
+        self.end = None
+        self.accn = None
+        self.fiscal_year = None
+        self.fiscal_period = None
+        self.form = None
+        self.filed = None
+        self.__facts_map = {}
+        self.__primary_concept_unit = None
+        for unit, fact in (facts or {}).items():
+            self._add_fact(fact.concept_name, unit, fact)
+
+    def _add_fact(self, concept_name, unit, fact):
+        self.__facts_map.setdefault(concept_name, {})[unit] = fact
+        if self.__primary_concept_unit is None:
+            self.__primary_concept_unit = (concept_name, unit)
+        if self.__primary_concept_unit == (concept_name, unit):
+            self.start = fact.start
+            self.end = fact.end
+            self.accn = fact.accn
+            self.fiscal_year = fact.fiscal_year
+            self.fiscal_period = fact.fiscal_period
+            self.form = fact.form
+            self.filed = fact.filed
 
     def add_fact_to_map(self, fact_name, unit_to_val_map):
         self.__facts_map[fact_name] = unit_to_val_map
 
+    def list_concepts(self):
+        return list(self.__facts_map.keys())
+
     def get_facts_for_unit(self, fact_name, unit):
         return self.__facts_map[fact_name][unit]
 
 
+def _to_taxonomy_attribute_name(taxonomy_name):
+    return taxonomy_name.replace("-", "_")
+
+
+def _to_unit_attribute_name(unit_name):
+    return unit_name.replace("/", "_")
+
+
+def _parse_taxonomy_lazily(columnar, taxonomy_name, taxonomy_concepts):
+    return LazyNamespace(taxonomy_concepts, partial(_parse_concept_lazily, columnar))
+
+
+def _parse_concept_lazily(columnar, concept_name, concept_value):
+    return Concept(concept_value, concept_name, lazy=True, columnar=columnar)
+
+
+def _parse_facts(tag, columnar, unit_name, unit_value):
+    if columnar:
+        return FactTable(unit_value, tag, unit_name)
+    return [Fact(fact_data, tag, unit_name) for fact_data in unit_value]
+
+
 class HasFactMixin:
     UNITS = "units"
 
-    def __init__(self, data, tag):
+    def __init__(self, data, tag, lazy=False, columnar=False):
         self.tag = tag
-        self.units = self.__parse_units(data)
+        self.columnar = columnar
+        self.units = self.__parse_units_lazily(data) if lazy else self.__parse_units(data)
+        self.__as_of_indexes = {}
 
     def __parse_units(self, data):
         return SimpleNamespace(**{
-            unit_name.replace("/", "_"): [Fact(fact_data, self.tag, unit_name) for fact_data in unit_value]
+            _to_unit_attribute_name(unit_name): _parse_facts(self.tag, self.columnar, unit_name, unit_value)
             for unit_name, unit_value in data[self.UNITS].items()
         })
 
+    def __parse_units_lazily(self, data):
+        return LazyNamespace(data[self.UNITS], partial(_parse_facts, self.tag, self.columnar), key_func=_to_unit_attribute_name)
+
     def get_unit(self, key):
-        return self.units.__dict__[key]
+        return NamespaceOpts.get(self.units, key)
 
     def list_units(self):
-        return list(self.units.__dict__.keys())
+        return NamespaceOpts.list_keys(self.units)
+
+    def get_as_of_index(self, unit, form=None, fiscal_period=None):
+        """
+        Gets the point-in-time index over the facts of a unit, building it the first time it is requested
+        @param unit: str
+        @param form: str, only index facts reported on this form type, ie 10-K
+        @param fiscal_period: str, only index facts reported for this fiscal period, ie FY
+        @return: AsOfIndex
+        """
+        key = (unit, form, fiscal_period)
+        if key not in self.__as_of_indexes:
+            self.__as_of_indexes[key] = AsOfIndex(self.get_unit(unit), form, fiscal_period)
+        return self.__as_of_indexes[key]
 
 
 class Concept(HasFactMixin):
@@ -214,18 +478,20 @@ class Concept(HasFactMixin):
         DESCRIPTION = "description"
         UNITS = "units"
 
-    def __init__(self, data, concept_name):
+    def __init__(self, data, concept_name, lazy=False, columnar=False):
         """
         Represents a single financial concept for a particular company (Ex. AccountsPayable, AccountsReceivable, etc)
         The measurement of a concept is broken down by units (Ex. USD, USD/share, shares, etc) which are parsed into Fact instances
         @param data: dict
+        @param lazy: bool, parse the facts of each unit the first time the unit is accessed
+        @param columnar: bool, store the facts of each unit in a FactTable instead of a list of Fact instances
         """
-        super().__init__(data, concept_name)
+        super().__init__(data, concept_name, lazy, columnar)
         self.label = data.get(self.ConceptSchemaEnum.LABEL.value)
         self.description = data.get(self.ConceptSchemaEnum.DESCRIPTION.value)
 
 
-class Fact:
+class Fact(SlotsDataObjectMixin):
     class FactSchemaEnum(Enum):
         START = "start"
         END = "end"
@@ -237,6 +503,18 @@ class Fact:
         FILED = "filed"
         FRAME = "frame"
 
+    __slots__ = ("concept_name", "unit", "start", "end", "value", "accn", "fiscal_year", "fiscal_period", "form", "filed", "frame")
+
+    _START_KEY = FactSchemaEnum.START.value
+    _END_KEY = FactSchemaEnum.END.value
+    _VAL_KEY = FactSchemaEnum.VAL.value
+    _ACCN_KEY = FactSchemaEnum.ACCN.value
+    _FY_KEY = FactSchemaEnum.FY.value
+    _FP_KEY = FactSchemaEnum.FP.value
+    _FORM_KEY = FactSchemaEnum.FORM.value
+    _FILED_KEY = FactSchemaEnum.FILED.value
+    _FRAME_KEY = FactSchemaEnum.FRAME.value
+
     def __init__(self, data, concept_name, unit):
         """
         Represents the state of a single concept for a given company as measured by some unit at a given time for some form type
@@ -244,15 +522,15 @@ class Fact:
         """
         self.concept_name = concept_name
         self.unit = unit
-        self.start = data.get(self.FactSchemaEnum.START.value)
-        self.end = data[self.FactSchemaEnum.END.value]
-        self.value = data[self.FactSchemaEnum.VAL.value]
-        self.accn = data[self.FactSchemaEnum.ACCN.value]
-        self.fiscal_year = data[self.FactSchemaEnum.FY.value]
-        self.fiscal_period = data[self.FactSchemaEnum.FP.value]
-        self.form = data[self.FactSchemaEnum.FORM.value]
-        self.filed = data[self.FactSchemaEnum.FILED.value]
-        self.frame = data.get(self.FactSchemaEnum.FRAME.value)
+        self.start = data.get(self._START_KEY)
+        self.end = data[self._END_KEY]
+        self.value = data[self._VAL_KEY]
+        self.accn = data[self._ACCN_KEY]
+        self.fiscal_year = data[self._FY_KEY]
+        self.fiscal_period = data[self._FP_KEY]
+        self.form = data[self._FORM_KEY]
+        self.filed = data[self._FILED_KEY]
+        self.frame = data.get(self._FRAME_KEY)
 
     def get_form_frame(self):
         """
@@ -262,3 +540,112 @@ class Fact:
         """
         frame = self.frame or "CY{}{}".format(self.fiscal_year, self.fiscal_period)
         return "{}_{}".format(self.form, frame)
+
+
+class CompanyFactsStreamParser:
+    __FACTS_KEY = CompanyFacts.CompanyFactsSchemaEnum.FACTS.value
+    __CIK_KEY = CompanyFacts.CompanyFactsSchemaEnum.CIK.value
+    __ENTITY_NAME_KEY = CompanyFacts.CompanyFactsSchemaEnum.ENTITY_NAME.value
+    __LABEL_KEY = Concept.ConceptSchemaEnum.LABEL.value
+    __DESCRIPTION_KEY = Concept.ConceptSchemaEnum.DESCRIPTION.value
+    __UNITS_KEY = Concept.ConceptSchemaEnum.UNITS.value
+
+    def __init__(self, stream, concepts=None, chunk_size=JsonStreamReader.DEFAULT_CHUNK_SIZE):
+        """
+        Incrementally parses a company facts document, ie a file in companyfacts.zip opened w/ ZipFile.open, emitting the
+        facts of one concept/unit at a time once the concept they belong to is decoded. Concepts that are not in the concepts allowlist are skipped
+        over w/o being decoded, so extracting a few concepts from a large document takes a fraction of the memory and time
+        of json.loads. cik and entity_name are only populated on emitted facts if they come before facts in the document,
+        as they do in the documents published by the SEC
+        @param stream: file-like object, opened in binary or text mode
+        @param concepts: iterable of concept names (ie Assets) or taxonomy qualified concept names (ie us-gaap:Assets) to parse, all concepts if None
+        @param chunk_size: int, number of characters to read from the stream at a time
+        """
+        self.__reader = JsonStreamReader(stream, chunk_size)
+        self.__concepts = set(concepts) if concepts is not None else None
+        self.cik = None
+        self.entity_name = None
+
+    def __is_selected(self, taxonomy, concept_name):
+        if self.__concepts is None:
+            return True
+        return concept_name in self.__concepts or "{}:{}".format(taxonomy, concept_name) in self.__concepts
+
+    def __iter_raw_units(self):
+        reader = self.__reader
+        for key in reader.iter_object():
+            if key == self.__CIK_KEY:
+                self.cik = CIKOpts.format_cik(reader.read_value())
+            elif key == self.__ENTITY_NAME_KEY:
+                self.entity_name = reader.read_value()
+            elif key == self.__FACTS_KEY:
+                for taxonomy in reader.iter_object():
+                    for concept_name in reader.iter_object():
+                        if not self.__is_selected(taxonomy, concept_name):
+                            reader.skip_value()
+                            continue
+                        label = description = None
+                        units = []
+                        # units are held until the concept closes since label and description may come after them
+                        for concept_key in reader.iter_object():
+                            if concept_key == self.__LABEL_KEY:
+                                label = reader.read_value()
+                            elif concept_key == self.__DESCRIPTION_KEY:
+                                description = reader.read_value()
+                            elif concept_key == self.__UNITS_KEY:
+                                units.extend((unit, reader.read_value()) for unit in reader.iter_object())
+                            else:
+                                reader.skip_value()
+                        for unit, raw_facts in units:
+                            yield taxonomy, concept_name, label, description, unit, raw_facts
+            else:
+                reader.skip_value()
+
+    def iter_units(self):
+        """
+        Parses the facts of each selected concept/unit in the document
+        @return: generator of ConceptUnitFacts
+        """
+        for taxonomy, concept_name, label, description, unit, raw_facts in self.__iter_raw_units():
+            facts = [Fact(fact_data, concept_name, unit) for fact_data in raw_facts]
+            yield ConceptUnitFacts(self.cik, self.entity_name, taxonomy, concept_name, label, description, unit, facts)
+
+    def parse(self, lazy=False, columnar=False):
+        """
+        Parses the selected concepts of the document into a CompanyFacts
+        @param lazy: bool, see CompanyFacts
+        @param columnar: bool, see CompanyFacts
+        @return: CompanyFacts
+        """
+        facts = {}
+        for taxonomy, concept_name, label, description, unit, raw_facts in self.__iter_raw_units():
+            concept = facts.setdefault(taxonomy, {}).setdefault(concept_name, {self.__UNITS_KEY: {}})
+            concept[self.__LABEL_KEY] = label
+            concept[self.__DESCRIPTION_KEY] = description
+            concept[self.__UNITS_KEY][unit] = raw_facts
+        return CompanyFacts({self.__CIK_KEY: self.cik, self.__ENTITY_NAME_KEY: self.entity_name, self.__FACTS_KEY: facts}, lazy, columnar)
+
+
+class ConceptUnitFacts(SlotsDataObjectMixin):
+    __slots__ = ("cik", "entity_name", "taxonomy", "concept_name", "label", "description", "unit", "facts")
+
+    def __init__(self, cik, entity_name, taxonomy, concept_name, label, description, unit, facts):
+        """
+        Facts of a single concept in a single unit, as emitted by CompanyFactsStreamParser
+        @param cik: str
+        @param entity_name: str
+        @param taxonomy: str, ie us-gaap
+        @param concept_name: str, ie Assets
+        @param label: str
+        @param description: str
+        @param unit: str, ie USD
+        @param facts: List[Fact]
+        """
+        self.cik = cik
+        self.entity_name = entity_name
+        self.taxonomy = taxonomy
+        self.concept_name = concept_name
+        self.label = label
+        self.description = description
+        self.unit = unit
+        self.facts = facts
@@ -0,0 +1,137 @@
+from bisect import bisect_right
+from datetime import date
+
+import numpy as np
+
+
+class AsOfIndex:
+    # position returned by positions_as_of for dates before the first fact was filed
+    MISSING = -1
+    __EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+    def __init__(self, facts, form=None, fiscal_period=None):
+        """
+        Point-in-time index over the facts reported for a concept in a single unit. Answers "what was the latest reported
+        value as known on date D" w/o looking ahead: only facts filed on or before D are considered, the one w/ the latest
+        period end wins, and if that period was reported more than once (ie restated) the most recently filed report wins.
+        The answer for every distinct filed date is precomputed when the index is built, so each lookup is a binary search
+        and a vector of dates is looked up in a single np.searchsorted call
+        @param facts: List[Fact] or FactTable, facts of a single concept/unit
+        @param form: str, only index facts reported on this form type, ie 10-K
+        @param fiscal_period: str, only index facts reported for this fiscal period, ie FY
+        """
+        self.__facts = facts
+        end, filed, value, positions, self._integer_values = self.__get_columns(facts, form, fiscal_period)
+        # (filed, end) order, so later reports of the same period end come after earlier ones
+        order = np.lexsort((end, filed))
+        self.__positions = positions[order]
+        self.end = end[order]
+        self.filed = filed[order]
+        self.value = value[order]
+
+        # running argmax of the period end where ties go to the later report, encoded as end * n + position
+        n = max(len(order), 1)
+        keys = self.end.astype(np.int64) * n + np.arange(len(order), dtype=np.int64)
+        best = np.maximum.accumulate(keys) % n
+        # only the state after the last fact filed on each date is kept
+        last_of_date = self.__is_last_of_run(self.filed)
+        self.__filed_dates = self.filed[last_of_date]
+        self.__best = best[last_of_date]
+        # plain lists for single lookups, which bisect faster than numpy can search a scalar
+        self.__filed_days = self.__filed_dates.astype(np.int64).tolist()
+        self.__best_list = self.__best.tolist()
+
+    @staticmethod
+    def __get_columns(facts, form, fiscal_period):
+        if hasattr(facts, "mask"):
+            # FactTable, whose columns are already arrays
+            mask = facts.mask(form=form, fiscal_period=fiscal_period)
+            return facts.end[mask], facts.filed[mask], facts.value[mask], np.flatnonzero(mask), facts._integer_values
+        positions = np.array([i for i, fact in enumerate(facts)
+                              if (form is None or fact.form == form) and (fiscal_period is None or fact.fiscal_period == fiscal_period)],
+                             dtype=np.int64)
+        selected = [facts[i] for i in positions]
+        end = np.array([fact.end for fact in selected], dtype="datetime64[D]")
+        filed = np.array([fact.filed for fact in selected], dtype="datetime64[D]")
+        value = np.array([fact.value for fact in selected], dtype=np.float64)
+        return end, filed, value, positions, all(isinstance(fact.value, int) for fact in selected)
+
+    @staticmethod
+    def __is_last_of_run(sorted_values):
+        return np.append(sorted_values[1:] != sorted_values[:-1], True) if len(sorted_values) else np.empty(0, dtype=bool)
+
+    @staticmethod
+    def __to_dates(dates):
+        return np.asarray(dates, dtype="datetime64[D]")
+
+    def __len__(self):
+        return len(self.value)
+
+    def positions_as_of(self, dates):
+        """
+        @param dates: date or array-like of dates (ISO formatted strings, datetime.date instances or numpy.datetime64 values)
+        @return: int or numpy array of int, position in the sorted index of the fact known as of each date, MISSING if none
+        """
+        dates = self.__to_dates(dates)
+        slots = np.searchsorted(self.__filed_dates, dates, side="right") - 1
+        if len(self.__best):
+            positions = np.where(slots >= 0, self.__best[np.maximum(slots, 0)], self.MISSING)
+        else:
+            positions = np.full(slots.shape, self.MISSING)
+        return int(positions) if positions.ndim == 0 else positions
+
+    def __position_as_of(self, as_of):
+        if isinstance(as_of, str):
+            days = date.fromisoformat(as_of).toordinal() - self.__EPOCH_ORDINAL
+        elif isinstance(as_of, date):
+            days = as_of.toordinal() - self.__EPOCH_ORDINAL
+        else:
+            days = int(np.datetime64(as_of, "D").astype(np.int64))
+        slot = bisect_right(self.__filed_days, days) - 1
+        return self.__best_list[slot] if slot >= 0 else self.MISSING
+
+    def values_as_of(self, dates):
+        """
+        Looks up the latest reported value as known on each of several dates
+        @param dates: array-like of dates, see positions_as_of
+        @return: numpy array of float64, NaN for dates before the first fact was filed
+        """
+        positions = np.atleast_1d(self.positions_as_of(dates))
+        values = np.full(len(positions), np.nan)
+        found = positions != self.MISSING
+        values[found] = self.value[positions[found]]
+        return values
+
+    def value_as_of(self, as_of):
+        """
+        Looks up the latest reported value as known on a date
+        @param as_of: date, see positions_as_of
+        @return: int or float, None if no fact was filed by as_of
+        """
+        position = self.__position_as_of(as_of)
+        if position == self.MISSING:
+            return None
+        value = self.value[position].item()
+        return int(value) if self._integer_values else value
+
+    def fact_as_of(self, as_of):
+        """
+        Looks up the fact holding the latest reported value as known on a date
+        @param as_of: date, see positions_as_of
+        @return: Fact or FactRow, None if no fact was filed by as_of
+        """
+        position = self.__position_as_of(as_of)
+        return self.__facts[int(self.__positions[position])] if position != self.MISSING else None
+
+    def series_as_of(self, as_of):
+        """
+        Builds the history of the concept as it was known on a date: one value per period end, taken from the most
+        recent report of that period filed on or before as_of
+        @param as_of: date, see positions_as_of
+        @return: tuple of numpy arrays (end, value), ordered by period end
+        """
+        known = np.flatnonzero(self.filed <= self.__to_dates(as_of))
+        order = known[np.lexsort((known, self.end[known]))]
+        # the last report of each period end wins
+        latest = order[self.__is_last_of_run(self.end[order])]
+        return self.end[latest], self.value[latest]
@@ -0,0 +1,99 @@
+import asyncio
+
+import aiohttp
+import backoff
+
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.rate_limiter import TokenBucketRateLimiter
+from secpy.core.utils.network_client_opts import NetworkClientOpts
+
+
+class AsyncNetworkClient:
+    def __init__(self,
+                 user_agent,
+                 max_requests_per_sec=10,
+                 max_retries=5,
+                 max_connections=10,
+                 json_decoder=None
+                 ):
+        """
+        asyncio counterpart to NetworkClient. Requests are made over a single pooled aiohttp session so that many requests
+        can be in flight at once, while the client's own rate limiter and the process-wide rate limiter shared w/ NetworkClient
+        keep the overall request rate w/in the SEC's limits: https://www.sec.gov/privacy.htm#security
+        The underlying session is created on first use and must be closed w/ close() or by using the client as an async context manager
+        @param user_agent: Used in header of request to identify application making the request
+        @param max_requests_per_sec: Maximum number of request this client makes against the SEC REST API in one second
+        @param max_retries: Maximum number of retries to make a request before giving up
+        @param max_connections: Maximum number of connections kept open to the SEC REST API at a time
+        @param json_decoder: JsonDecoder, used to decode responses in make_request_json. Defaults to the process-wide JsonDecoder
+        """
+        self._headers = NetworkClientOpts.get_headers(user_agent)
+        self._max_requests_per_sec = NetworkClientOpts.validate_max_requests_per_sec(max_requests_per_sec)
+        self.max_retries = NetworkClientOpts.validate_max_retries(max_retries)
+        self.max_connections = self.__set_max_connections(max_connections)
+        self._rate_limiter = TokenBucketRateLimiter(self._max_requests_per_sec, parent=TokenBucketRateLimiter.shared())
+        self._json_decoder = NetworkClientOpts.get_json_decoder(json_decoder)
+        self.__session = None
+
+    @staticmethod
+    def __set_max_connections(max_connections):
+        assert isinstance(max_connections, int) and max_connections > 0, "max_connections arg {} must be a positive integer!".format(max_connections)
+        return max_connections
+
+    def __get_session(self):
+        if self.__session is None or self.__session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.__session = aiohttp.ClientSession(headers=self._headers, connector=connector)
+        return self.__session
+
+    async def make_request_json(self, endpoint, **kwargs):
+        """
+        Makes a request to a given endpoint
+        @param endpoint: EndpointEnum value
+        @param kwargs: used to specify substitution variables in order to format endpoint
+        @return: response in json form
+        """
+        return self._json_decoder.loads(await self.make_request(endpoint, **kwargs))
+
+    async def make_request(self, endpoint, **kwargs):
+        """
+        Makes a request to a given SEC REST API endpoint in the set of endpoint templates defined by EndpointEnum
+        @param endpoint: EndpointEnum value
+        @param kwargs: used to specify substitution variables in order to format endpoint
+        @return: bytes, body of the response
+        """
+        assert EndpointEnum.validate_endpoint_kwargs(**kwargs)
+        formatted_endpoint = endpoint.value.format(**kwargs)
+
+        @backoff.on_exception(backoff.expo,
+                              (aiohttp.ClientError, asyncio.TimeoutError),
+                              max_tries=self.max_retries,
+                              giveup=self.__is_response_error
+                              )
+        async def __make_request_helper():
+            await self._rate_limiter.acquire_async()
+            async with self.__get_session().get(formatted_endpoint) as response:
+                response.raise_for_status()
+                return await response.read()
+
+        return await __make_request_helper()
+
+    @staticmethod
+    def __is_response_error(exception):
+        # Mirrors NetworkClient, where responses w/ an error status are raised to the caller rather than retried
+        return isinstance(exception, aiohttp.ClientResponseError)
+
+    async def close(self):
+        """
+        Closes the underlying session and all of its pooled connections
+        @return: None
+        """
+        if self.__session is not None and not self.__session.closed:
+            await self.__session.close()
+        self.__session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class BatchExecutor:
+    __DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, max_workers=None):
+        """
+        Runs a function over an iterable of items on a bounded pool of worker threads.
+        Items are submitted lazily so that only a bounded number of them are in flight at once, which keeps memory flat
+        for large iterables. Network requests made by the workers are still subject to the shared rate limiter in NetworkClient
+        @param max_workers: int, number of worker threads to use
+        """
+        self.max_workers = self.__set_max_workers(max_workers)
+
+    def __set_max_workers(self, max_workers):
+        if max_workers is None:
+            return self.__DEFAULT_MAX_WORKERS
+        assert isinstance(max_workers, int) and max_workers > 0, "max_workers arg {} must be a positive integer!".format(max_workers)
+        return max_workers
+
+    def run(self, func, items):
+        """
+        Applies func to each item and yields a BatchResult for each item in the order that they finish.
+        Exceptions raised by func are captured in the BatchResult of that item instead of being raised
+        @param func: python callable, takes a single item as an argument
+        @param items: iterable of items to apply func to
+        @return: generator of BatchResult
+        """
+        items = iter(items)
+        max_in_flight = self.max_workers * 2
+        in_flight = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            self.__submit(executor, func, items, in_flight, max_in_flight)
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = in_flight.pop(future)
+                    yield self.__to_batch_result(item, future)
+                self.__submit(executor, func, items, in_flight, max_in_flight)
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def __submit(executor, func, items, in_flight, max_in_flight):
+        while len(in_flight) < max_in_flight:
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            in_flight[executor.submit(func, item)] = item
+
+    @staticmethod
+    def __to_batch_result(item, future):
+        try:
+            return BatchResult(item, result=future.result())
+        except Exception as e:
+            return BatchResult(item, exception=e)
+
+
+class BatchResult:
+    def __init__(self, item, result=None, exception=None):
+        """
+        Outcome of applying a function to a single item in a batch
+        @param item: the item that was passed to the function, ie a CIK or ticker
+        @param result: return value of the function, None if the function raised
+        @param exception: exception raised by the function, None if the function succeeded
+        """
+        self.item = item
+        self.result = result
+        self.exception = exception
+
+    @property
+    def ok(self):
+        return self.exception is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else repr(self.exception)
+        return "BatchResult(item={!r}, {})".format(self.item, status)
@@ -1,13 +1,17 @@
 import os
 import shutil
 from zipfile import ZipFile
-from tempfile import gettempdir
+from tempfile import mkstemp
 import re
-import json
 from abc import ABC, abstractmethod
-import time
 
+from secpy.core.json_decoder import JsonDecoder
 from secpy.core.mixins.base_endpoint_mixin import BaseEndpointMixin
+from secpy.core.parallel_bulk_processor import ParallelBulkProcessor
+from secpy.core.resumable_downloader import ResumableDownloader
+from secpy.core.utils.cik_opts import CIKOpts
+from secpy.core.utils.network_client_opts import NetworkClientOpts
+from secpy.core.utils.zip_opts import ZipOpts
 
 
 class BulkDataEndpoint(BaseEndpointMixin, ABC):
@@ -20,32 +24,54 @@ class BulkDataEndpoint(BaseEndpointMixin, ABC):
         @param kwargs:
         """
         super().__init__(user_agent, **kwargs)
+        self._json_decoder = NetworkClientOpts.get_json_decoder(kwargs.get("json_decoder"))
         self._archive_persisted = existing_archive is not None
         self.bulk_data_file_object = self.__set_bulk_data_file_object(existing_archive)
 
     def __set_bulk_data_file_object(self, existing_archive):
-        return BulkDataFileObject(existing_archive, self._ticker_cte_map) if existing_archive else None
+        return BulkDataFileObject(existing_archive, self._ticker_cte_map, self._json_decoder) if existing_archive else None
 
-    def download_bulk_data(self, override=False, chunk_size=1028):
+    def download_bulk_data(self, override=False, chunk_size=ResumableDownloader.DEFAULT_CHUNK_SIZE, segments=1, archive_path=None):
         """
-        Download from bulk data endpoint to a temp directory and set the bulk_data_file_object
+        Download from bulk data endpoint to a new file in the temp directory and set the bulk_data_file_object
         @param override: bool, override existing_archive and download
         @param chunk_size: int, number of bytes to read into memory while iterating over response
+        @param segments: int, number of byte ranges of the archive to download in parallel
+        @param archive_path: str, full path to download the archive to instead of a new file in the temp directory. The archive
+                             is treated as persisted, and a download to the same path that was interrupted, even by a restart,
+                             resumes from its .part file. The path must not be shared by downloads that run at the same time
         @return:
         """
         if not self._archive_persisted or (self._archive_persisted and override):
-            archive_path = self.__get_temp_zip_file_path()
-            self._validate_path_and_download_file(self._endpoint, archive_path, chunk_size=chunk_size)
-            self.bulk_data_file_object = BulkDataFileObject(archive_path, self._ticker_cte_map)
+            persisted = archive_path is not None
+            if not persisted:
+                archive_path = self.__get_temp_zip_file_path()
+            try:
+                self._validate_path_and_download_file(self._endpoint, archive_path, chunk_size=chunk_size, segments=segments)
+            except BaseException:
+                if not persisted:
+                    # the temp path is unique to this call, so the partial download can never be resumed
+                    if os.path.exists(archive_path):
+                        os.remove(archive_path)
+                    ResumableDownloader.discard(archive_path)
+                raise
+            self.__remove_temp_archive()
+            self.bulk_data_file_object = BulkDataFileObject(archive_path, self._ticker_cte_map, self._json_decoder)
+            self._archive_persisted = persisted
         else:
             self._logger.warn("Archive already exists, skipping download...")
         return self
 
     @staticmethod
     def __get_temp_zip_file_path():
-        temp_dir = gettempdir()
-        filename = str(int(time.time()))
-        return os.path.join(temp_dir, filename) + ".zip"
+        # unique per call, so instances/processes downloading the same endpoint never share, or delete, each other's archive
+        file_descriptor, path = mkstemp(prefix="secpy-", suffix=".zip")
+        os.close(file_descriptor)
+        return path
+
+    def __remove_temp_archive(self):
+        if not self._archive_persisted and self.bulk_data_file_object and self.bulk_data_file_object.archive_exists():
+            os.remove(self.bulk_data_file_object.archive_path)
 
     def get_data_for_ticker_from_archive(self, ticker):
         """
@@ -68,11 +94,54 @@ class BulkDataEndpoint(BaseEndpointMixin, ABC):
 
         if self.bulk_data_file_object.archive_exists():
             shutil.move(self.bulk_data_file_object.archive_path, output_path)
-            self.__set_bulk_data_file_object(output_path)
+            self.bulk_data_file_object = self.__set_bulk_data_file_object(output_path)
             self._archive_persisted = True
         else:
             raise Exception("Bulk data not loaded into memory, nothing to save!")
 
+    def sync_bulk_data(self, archive_path, store=None, chunk_size=ResumableDownloader.DEFAULT_CHUNK_SIZE, segments=1):
+        """
+        Refreshes a persisted archive (and optionally a BulkDataStore) w/ the latest archive from the SEC, only reprocessing
+        the companies that changed. The CRC/size of each company file in the new archive is compared against the previous
+        version, read from the store if one is given or otherwise from the archive at archive_path. Only added/modified companies
+        are reloaded into the store and removed ones are deleted from it, then the new archive replaces the one at archive_path.
+        The SEC only publishes the full archive, so it is still downloaded in full. The download is made to <archive_path>.download,
+        so an interrupted sync resumes the download where it left off the next time it is run
+        @param archive_path: str, full path of the persisted archive, created if it doesn't exist yet
+        @param store: BulkDataStore to update
+        @param chunk_size: int, number of bytes to read into memory while iterating over response
+        @param segments: int, number of byte ranges of the archive to download in parallel
+        @return: BulkDataSyncResult
+        """
+        if store is not None:
+            previous_members = self._get_store_members(store)
+        elif os.path.exists(archive_path):
+            previous_members = ZipOpts.get_member_signatures(archive_path)
+        else:
+            previous_members = {}
+
+        download_path = archive_path + ".download"
+        if os.path.exists(download_path):
+            os.remove(download_path)
+        self._validate_path_and_download_file(self._endpoint, download_path, chunk_size=chunk_size, segments=segments)
+        try:
+            result = BulkDataSyncResult.from_member_signatures(previous_members, ZipOpts.get_member_signatures(download_path))
+            if store is not None:
+                if result.changed_ciks:
+                    self._ingest_archive(store, download_path, set(result.changed_ciks))
+                for cik in result.removed_ciks:
+                    self._delete_from_store(store, cik)
+            os.replace(download_path, archive_path)
+        except BaseException:
+            if os.path.exists(download_path):
+                os.remove(download_path)
+            raise
+
+        self.__remove_temp_archive()
+        self.bulk_data_file_object = BulkDataFileObject(archive_path, self._ticker_cte_map, self._json_decoder)
+        self._archive_persisted = True
+        return result
+
     def _get_bulk_data_if_none(self, **kwargs):
         if not self.bulk_data_file_object:
             self.download_bulk_data(**kwargs)
@@ -83,15 +152,93 @@ class BulkDataEndpoint(BaseEndpointMixin, ABC):
         @param func: python callable, function to apply to entire set of data in archive
         @return: return value of func
         """
-        return func(self.__extract_file_and_parse_data(filename) for filename in self.bulk_data_file_object.get_filelist())
+        return func(self.iter_companies())
+
+    def iter_companies(self, ciks=None, tickers=None, exchanges=None):
+        """
+        Lazily parses the companies in the archive one at a time, in archive order. Filters are resolved to filenames
+        before anything is read, so only the files of the selected companies are decompressed and memory use stays flat.
+        Companies selected by ciks and tickers are combined, exchanges then narrows down that selection (or the whole archive)
+        @param ciks: iterable of CIKs (str or int) to include
+        @param tickers: iterable of tickers to include, raises KeyError for a ticker that isn't in the ticker map
+        @param exchanges: iterable of ExchangeEnum values, only include companies listed on one of these exchanges
+        @return: generator of data objects
+        """
+        for filename in self._get_company_filenames(ciks, tickers, exchanges):
+            yield self.__extract_file_and_parse_data(filename)
 
-    def for_each_company(self, func):
+    def _get_company_filenames(self, ciks=None, tickers=None, exchanges=None):
+        # resolves the filters of iter_companies to the names of the company files to read, downloads the zip file if it doesn't exist
+        self._get_bulk_data_if_none()
+        selected_ciks = self.__select_ciks(ciks, tickers, exchanges)
+        return self.bulk_data_file_object.get_company_filenames(selected_ciks)
+
+    def for_each_company(self, func, processes=None, chunksize=ParallelBulkProcessor.DEFAULT_CHUNKSIZE, ordered=True):
         """
         Applies some function to each data object in the archive
         @param func: python callable, function to apply to each data object
+        @param processes: int, number of worker processes to spread the archive across. The archive is processed serially if None
+        @param chunksize: int, number of files sent to a worker process at a time
+        @param ordered: bool, return results in archive order rather than in the order workers finish them
         @return: list of return value of func
         """
-        return [func(self.__extract_file_and_parse_data(filename)) for filename in self.bulk_data_file_object.get_filelist()]
+        if processes is None:
+            return [func(data_object) for data_object in self.iter_companies()]
+        return list(self.map_companies(func, processes, chunksize, ordered))
+
+    def map_companies(self, func, processes=None, chunksize=ParallelBulkProcessor.DEFAULT_CHUNKSIZE, ordered=True):
+        """
+        Applies some function to each company in the archive across a pool of worker processes.
+        func is sent to the workers so it must be picklable, ie a function defined at the top level of a module
+        @param func: python callable, function to apply to each data object
+        @param processes: int, number of worker processes. Defaults to the number of CPUs on the machine
+        @param chunksize: int, number of files sent to a worker process at a time
+        @param ordered: bool, yield results in archive order rather than in the order workers finish them
+        @return: generator of return value of func
+        """
+        return self.__get_parallel_processor(processes, chunksize).map(func, self._get_company_filenames(), ordered)
+
+    def filter_companies(self, predicate, processes=None, chunksize=ParallelBulkProcessor.DEFAULT_CHUNKSIZE, ordered=True):
+        """
+        Finds the companies in the archive that match some predicate across a pool of worker processes.
+        predicate is sent to the workers so it must be picklable, ie a function defined at the top level of a module
+        @param predicate: python callable, takes a data object and returns a bool
+        @param processes: int, number of worker processes. Defaults to the number of CPUs on the machine
+        @param chunksize: int, number of files sent to a worker process at a time
+        @param ordered: bool, yield data objects in archive order rather than in the order workers finish them
+        @return: generator of data objects
+        """
+        return self.__get_parallel_processor(processes, chunksize).filter(predicate, self._get_company_filenames(), ordered)
+
+    def reduce_companies(self, func, initial, combine, processes=None, chunksize=ParallelBulkProcessor.DEFAULT_CHUNKSIZE):
+        """
+        Folds all companies in the archive into a single value across a pool of worker processes, ie sum, min, max of some value.
+        Each worker folds its chunk of the archive starting from initial and the partial results are merged w/ combine.
+        func and combine are sent to the workers so they must be picklable, ie functions defined at the top level of a module
+        @param func: python callable, takes an accumulator and a data object and returns the new accumulator
+        @param initial: starting value of the accumulator for each worker's chunk, should be an identity for combine (ie 0 for a sum)
+        @param combine: python callable, merges two accumulators into one
+        @param processes: int, number of worker processes. Defaults to the number of CPUs on the machine
+        @param chunksize: int, number of files sent to a worker process at a time
+        @return: the final accumulator
+        """
+        return self.__get_parallel_processor(processes, chunksize).reduce(func, initial, combine, self._get_company_filenames())
+
+    def __get_parallel_processor(self, processes, chunksize):
+        self._get_bulk_data_if_none()
+        return ParallelBulkProcessor(self.bulk_data_file_object.archive_path, self._get_parser(), processes, chunksize, self._json_decoder)
+
+    def __select_ciks(self, ciks, tickers, exchanges):
+        selected_ciks = None
+        if ciks is not None or tickers is not None:
+            selected_ciks = {CIKOpts.format_cik(cik) for cik in ciks or []}
+            selected_ciks.update(self._ticker_cte_map.lookup_ticker(ticker).cik for ticker in tickers or [])
+        if exchanges is not None:
+            exchange_ciks = {cte_object.cik
+                             for exchange in exchanges
+                             for cte_object in self._ticker_cte_map.filter_companies_by_exchange(exchange).values()}
+            selected_ciks = exchange_ciks if selected_ciks is None else selected_ciks & exchange_ciks
+        return selected_ciks
 
     def __extract_file_and_parse_data(self, filename):
         data = self.bulk_data_file_object.get_file(filename)
@@ -102,24 +249,70 @@ class BulkDataEndpoint(BaseEndpointMixin, ABC):
         Deletes bulk data zip file from temporary location after object goes out of scope
         @return:
         """
-        if not self._archive_persisted and self.bulk_data_file_object and self.bulk_data_file_object.archive_exists():
-            os.remove(self.bulk_data_file_object.archive_path)
+        # __init__ may have raised before the archive was set, ie on an invalid arg
+        if hasattr(self, "bulk_data_file_object"):
+            self.__remove_temp_archive()
+
+    def convert_to_store(self, store):
+        """
+        Loads the archive into a local BulkDataStore so later queries don't need to decompress and parse the archive again.
+        Downloads the zip file if it doesn't exist
+        @param store: BulkDataStore
+        @return: int, number of companies loaded
+        """
+        self._get_bulk_data_if_none()
+        return self._ingest_archive(store, self.bulk_data_file_object.archive_path)
 
-    @abstractmethod
     def _parse_data(self, data):
+        return self._get_parser()(data)
+
+    @abstractmethod
+    def _get_parser(self):
+        """
+        Gets the callable used to parse the json of a single file in the archive into a data object.
+        It is sent to worker processes when the archive is processed in parallel, so it must be picklable
+        @return: python callable
+        """
+        pass
+
+    @abstractmethod
+    def _ingest_archive(self, store, archive_path, ciks=None):
+        """
+        Loads the archive at archive_path into store w/ the BulkDataStore method for this type of archive
+        @param ciks: set of 10 digit CIKs to load, all companies in the archive if None
+        @return: int, number of companies loaded
+        """
+        pass
+
+    @abstractmethod
+    def _get_store_members(self, store):
+        """
+        Gets the CRC/size of the archive files that the companies in store were loaded from for this type of archive
+        @return: dict of filename -> (crc, size)
+        """
+        pass
+
+    @abstractmethod
+    def _delete_from_store(self, store, cik):
+        """
+        Removes the data for a company loaded from this type of archive from store
+        @return: None
+        """
         pass
 
 
 class BulkDataFileObject:
     __FILENAME_REGEX = re.compile("CIK\d{10}.json$")
 
-    def __init__(self, archive_path, ticker_cte_map):
+    def __init__(self, archive_path, ticker_cte_map, json_decoder=None):
         """
         Handles the parsing of files in bulk data zip file and the creation of CIK/ticker to filename maps.
         @param archive_path: Full path of bulk data zip file
         @param ticker_cte_map: ticker to CTE map object used to create the CIK/Ticker to filename maps
+        @param json_decoder: JsonDecoder, used to decode files in the archive. Defaults to the process-wide JsonDecoder
         """
         self.archive_path = archive_path
+        self.__json_decoder = json_decoder or JsonDecoder.shared()
         self.__zipfile = self.__set_zip_file(archive_path)
         self.__ticker_to_filename_map = {}
         self.__cik_to_filename_map = {}
@@ -174,11 +367,27 @@ class BulkDataFileObject:
         return self.__cik_to_filename_map[cik]
 
     def get_file(self, filename):
-        return json.loads(self.__zipfile.read(filename))
+        return self.__json_decoder.loads(self.__zipfile.read(filename))
+
+    def open_file(self, filename):
+        """
+        Opens a file in the archive for reading, decompressing it as it is read rather than all at once
+        @param filename: str
+        @return: binary file-like object
+        """
+        return self.__zipfile.open(filename)
 
     def get_filelist(self):
         return self.__zipfile.filelist
 
+    def get_company_filenames(self, ciks=None):
+        """
+        Lists the names of the company files in the archive, skipping any other files in the ZIP
+        @param ciks: set of 10 digit CIKs to restrict the list to, all companies if None
+        @return: List[str] in archive order
+        """
+        return [filename for cik, filename in self.__cik_to_filename_map.items() if ciks is None or cik in ciks]
+
     def get_json_for_ticker_from_zip(self, ticker):
         """
         Gets json data from archive for a particular ticker
@@ -209,3 +418,57 @@ class BulkDataFileObject:
 
     def get_cik_to_filename_map(self):
         return self.__cik_to_filename_map
+
+
+class BulkDataSyncResult:
+    def __init__(self, added_ciks, modified_ciks, removed_ciks):
+        """
+        Companies that changed between two versions of a bulk archive
+        @param added_ciks: List[str], companies only in the new archive
+        @param modified_ciks: List[str], companies whose files differ between the archives
+        @param removed_ciks: List[str], companies only in the previous archive
+        """
+        self.added_ciks = added_ciks
+        self.modified_ciks = modified_ciks
+        self.removed_ciks = removed_ciks
+
+    @classmethod
+    def from_member_signatures(cls, previous_members, current_members):
+        """
+        Compares the files of two versions of an archive. A company has changed if any of its files was added, removed or
+        has a different CRC/size, ie the additional filings pages of a company in submissions.zip
+        @param previous_members: dict of filename -> (crc, size), see ZipOpts.get_member_signatures
+        @param current_members: dict of filename -> (crc, size)
+        @return: BulkDataSyncResult
+        """
+        previous_signatures = cls.__group_by_cik(previous_members)
+        current_signatures = cls.__group_by_cik(current_members)
+        added_ciks = sorted(cik for cik in current_signatures if cik not in previous_signatures)
+        removed_ciks = sorted(cik for cik in previous_signatures if cik not in current_signatures)
+        modified_ciks = sorted(cik for cik, signature in current_signatures.items()
+                               if cik in previous_signatures and previous_signatures[cik] != signature)
+        return cls(added_ciks, modified_ciks, removed_ciks)
+
+    @staticmethod
+    def __group_by_cik(members):
+        signatures = {}
+        for filename, signature in members.items():
+            cik = ZipOpts.parse_cik_from_member_name(filename)
+            if cik is not None:
+                signatures.setdefault(cik, set()).add((filename,) + tuple(signature))
+        return signatures
+
+    @property
+    def changed_ciks(self):
+        """
+        Companies that need to be reprocessed, ie added or modified
+        @return: List[str]
+        """
+        return sorted(self.added_ciks + self.modified_ciks)
+
+    def has_changes(self):
+        return bool(self.added_ciks or self.modified_ciks or self.removed_ciks)
+
+    def __repr__(self):
+        return "BulkDataSyncResult(added={}, modified={}, removed={})".format(
+            len(self.added_ciks), len(self.modified_ciks), len(self.removed_ciks))
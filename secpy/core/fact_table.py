@@ -0,0 +1,281 @@
+import numpy as np
+
+
+class FactTable:
+    START = "start"
+    END = "end"
+    VAL = "val"
+    ACCN = "accn"
+    FY = "fy"
+    FP = "fp"
+    FORM = "form"
+    FILED = "filed"
+    FRAME = "frame"
+
+    # fiscal_year of facts that don't report one
+    MISSING_FISCAL_YEAR = 0
+    # columns w/ a natural order, the dictionary encoded columns are ordered by first appearance so they can't be sorted by
+    SORTABLE_COLUMNS = ("value", "fiscal_year", "start", "end", "filed")
+
+    def __init__(self, data, concept_name, unit):
+        """
+        Columnar representation of all facts reported for a concept in a single unit.
+        Numeric and date fields are stored in typed NumPy arrays, the low-cardinality string fields (form, fiscal period
+        and frame) are dictionary encoded and accession numbers, which are mostly unique, are kept in an object array, so the table takes a fraction of the memory of a list of Fact
+        instances and can be filtered/sorted at array speed.
+        The table also behaves like a list of facts: indexing and iterating over it yields FactRow views that have the
+        same attributes as Fact
+        @param data: List[dict], facts as returned by the SEC REST API
+        @param concept_name: str
+        @param unit: str
+        """
+        self.concept_name = concept_name
+        self.unit = unit
+        raw_values = [fact[self.VAL] for fact in data]
+        self._integer_values = all(isinstance(value, int) for value in raw_values)
+        self.value = np.array(raw_values, dtype=np.float64)
+        self.fiscal_year = np.array([fact[self.FY] or self.MISSING_FISCAL_YEAR for fact in data], dtype=np.int32)
+        self.start = self.__to_dates([fact.get(self.START) for fact in data])
+        self.end = self.__to_dates([fact[self.END] for fact in data])
+        self.filed = self.__to_dates([fact[self.FILED] for fact in data])
+        self.form_codes, self.form_categories = self.__encode([fact[self.FORM] for fact in data])
+        self.fiscal_period_codes, self.fiscal_period_categories = self.__encode([fact[self.FP] for fact in data])
+        self.accn = self.__to_object_array([fact[self.ACCN] for fact in data])
+        self.frame_codes, self.frame_categories = self.__encode([fact.get(self.FRAME) for fact in data])
+
+    @classmethod
+    def _from_columns(cls, source, indices):
+        table = cls.__new__(cls)
+        table.concept_name = source.concept_name
+        table.unit = source.unit
+        table._integer_values = source._integer_values
+        for column in ["value", "fiscal_year", "start", "end", "filed", "accn", "form_codes", "fiscal_period_codes", "frame_codes"]:
+            setattr(table, column, getattr(source, column)[indices])
+        for column in ["form_categories", "fiscal_period_categories", "frame_categories"]:
+            setattr(table, column, getattr(source, column))
+        return table
+
+    @staticmethod
+    def __to_dates(values):
+        return np.array([value if value else "NaT" for value in values], dtype="datetime64[D]")
+
+    @classmethod
+    def __encode(cls, values):
+        categories = {}
+        codes = np.fromiter((categories.setdefault(value, len(categories)) for value in values), dtype=np.int32, count=len(values))
+        return codes, cls.__to_object_array(list(categories.keys()))
+
+    @staticmethod
+    def __to_object_array(values):
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+
+    @staticmethod
+    def __lookup_code(categories, value):
+        matches = np.flatnonzero(categories == value) if len(categories) else []
+        return matches[0] if len(matches) else -1
+
+    @staticmethod
+    def __to_date(value):
+        return np.datetime64(value, "D")
+
+    @property
+    def form(self):
+        return self.form_categories[self.form_codes]
+
+    @property
+    def fiscal_period(self):
+        return self.fiscal_period_categories[self.fiscal_period_codes]
+
+    @property
+    def frame(self):
+        return self.frame_categories[self.frame_codes]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("FactTable index {} out of range".format(key))
+            return FactRow(self, int(key))
+        return self.take(key)
+
+    def __iter__(self):
+        return (FactRow(self, i) for i in range(len(self)))
+
+    def __repr__(self):
+        return "FactTable(concept_name={!r}, unit={!r}, rows={})".format(self.concept_name, self.unit, len(self))
+
+    def take(self, indices):
+        """
+        Builds a new table from a subset of rows
+        @param indices: slice, array of positions or boolean mask
+        @return: FactTable
+        """
+        return self._from_columns(self, indices)
+
+    def mask(self,
+             form=None,
+             fiscal_period=None,
+             fiscal_year=None,
+             start_date=None,
+             end_date=None,
+             filed_after=None,
+             filed_before=None,
+             has_frame=None):
+        """
+        Builds a boolean mask of the rows that match all of the given conditions. Date args can be ISO formatted strings,
+        datetime.date instances or numpy.datetime64 values and bounds are inclusive
+        @param form: str, ie 10-K
+        @param fiscal_period: str, ie FY, Q1
+        @param fiscal_year: int
+        @param start_date: only keep facts w/ a period ending on or after start_date
+        @param end_date: only keep facts w/ a period ending on or before end_date
+        @param filed_after: only keep facts filed on or after filed_after
+        @param filed_before: only keep facts filed on or before filed_before
+        @param has_frame: bool, only keep facts that do (or do not) have a frame
+        @return: numpy array of bool
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if form is not None:
+            mask &= self.form_codes == self.__lookup_code(self.form_categories, form)
+        if fiscal_period is not None:
+            mask &= self.fiscal_period_codes == self.__lookup_code(self.fiscal_period_categories, fiscal_period)
+        if fiscal_year is not None:
+            mask &= self.fiscal_year == fiscal_year
+        if start_date is not None:
+            mask &= self.end >= self.__to_date(start_date)
+        if end_date is not None:
+            mask &= self.end <= self.__to_date(end_date)
+        if filed_after is not None:
+            mask &= self.filed >= self.__to_date(filed_after)
+        if filed_before is not None:
+            mask &= self.filed <= self.__to_date(filed_before)
+        if has_frame is not None:
+            no_frame_code = self.__lookup_code(self.frame_categories, None)
+            mask &= (self.frame_codes != no_frame_code) if has_frame else (self.frame_codes == no_frame_code)
+        return mask
+
+    def filter(self, **kwargs):
+        """
+        Filters rows of the table. See mask for the supported conditions
+        @return: FactTable
+        """
+        return self.take(self.mask(**kwargs))
+
+    def sort_by(self, *columns, descending=False):
+        """
+        Sorts the table by one or more columns, earlier columns take precedence
+        @param columns: str, names of the columns to sort by, one of SORTABLE_COLUMNS
+        @param descending: bool
+        @return: FactTable
+        """
+        assert columns, "At least one column to sort by must be specified!"
+        for column in columns:
+            assert column in self.SORTABLE_COLUMNS, \
+                "column arg {} must be one of {}!".format(column, ", ".join(self.SORTABLE_COLUMNS))
+        # np.lexsort sorts by the last key first
+        order = np.lexsort([getattr(self, column) for column in reversed(columns)])
+        return self.take(order[::-1] if descending else order)
+
+    def latest(self, **kwargs):
+        """
+        Gets the most recently filed fact, ties are broken by the most recent period end.
+        Accepts the same conditions as mask to only consider a subset of the facts
+        @return: FactRow, None if no facts match
+        """
+        positions = np.flatnonzero(self.mask(**kwargs)) if kwargs else np.arange(len(self))
+        if len(positions) == 0:
+            return None
+        order = np.lexsort((self.end[positions], self.filed[positions]))
+        return FactRow(self, int(positions[order[-1]]))
+
+    def latest_value(self, **kwargs):
+        """
+        Gets the value of the most recently filed fact. See latest
+        @return: int or float, None if no facts match
+        """
+        latest = self.latest(**kwargs)
+        return latest.value if latest is not None else None
+
+    def _get_value(self, i):
+        value = self.value[i].item()
+        return int(value) if self._integer_values else value
+
+    def _get_date(self, column, i):
+        date = column[i]
+        return None if np.isnat(date) else str(date)
+
+
+class FactRow:
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        """
+        Read-only view of a single row in a FactTable w/ the same attributes as Fact
+        @param table: FactTable
+        @param index: int, position of the row in the table
+        """
+        self._table = table
+        self._index = index
+
+    @property
+    def concept_name(self):
+        return self._table.concept_name
+
+    @property
+    def unit(self):
+        return self._table.unit
+
+    @property
+    def start(self):
+        return self._table._get_date(self._table.start, self._index)
+
+    @property
+    def end(self):
+        return self._table._get_date(self._table.end, self._index)
+
+    @property
+    def value(self):
+        return self._table._get_value(self._index)
+
+    @property
+    def accn(self):
+        return self._table.accn[self._index]
+
+    @property
+    def fiscal_year(self):
+        fiscal_year = int(self._table.fiscal_year[self._index])
+        return None if fiscal_year == FactTable.MISSING_FISCAL_YEAR else fiscal_year
+
+    @property
+    def fiscal_period(self):
+        return self._table.fiscal_period_categories[self._table.fiscal_period_codes[self._index]]
+
+    @property
+    def form(self):
+        return self._table.form_categories[self._table.form_codes[self._index]]
+
+    @property
+    def filed(self):
+        return self._table._get_date(self._table.filed, self._index)
+
+    @property
+    def frame(self):
+        return self._table.frame_categories[self._table.frame_codes[self._index]]
+
+    def get_form_frame(self):
+        """
+        Formats a string in form_fy_fp format. See Fact.get_form_frame
+        @return: str
+        """
+        frame = self.frame or "CY{}{}".format(self.fiscal_year, self.fiscal_period)
+        return "{}_{}".format(self.form, frame)
+
+    def __repr__(self):
+        return "FactRow(concept_name={!r}, unit={!r}, end={!r}, value={!r}, form={!r}, filed={!r})".format(
+            self.concept_name, self.unit, self.end, self.value, self.form, self.filed)
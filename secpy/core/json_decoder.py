@@ -0,0 +1,73 @@
+import importlib
+import importlib.util
+import threading
+
+
+class JsonDecoder:
+    # fastest first, the standard library json module is always installed so it is the fallback
+    BACKENDS = ("orjson", "ujson", "simdjson", "json")
+
+    __shared_instance = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, backend=None):
+        """
+        Decodes JSON documents w/ the fastest JSON library that is installed. SEC responses and bulk archive members are
+        large documents made up mostly of numbers and short strings, which the C-based libraries decode several times faster
+        than the standard library. Every backend decodes to the same python types (dict, list, str, int, float, bool, None),
+        but the float parsing of ujson and simdjson isn't guaranteed to round the same way as the json module, so floats may
+        differ in their last digit between backends. Pass a backend explicitly where results must be bit for bit reproducible
+        @param backend: str, name of the library to decode w/, one of BACKENDS. Defaults to the first installed library in BACKENDS
+        """
+        self.backend = self.__set_backend(backend)
+        self.__loads = importlib.import_module(self.backend).loads
+
+    def __set_backend(self, backend):
+        if backend is None:
+            return self.get_available_backends()[0]
+        assert backend in self.BACKENDS, "backend arg {} must be one of {}!".format(backend, self.BACKENDS)
+        assert self.is_available(backend), "backend arg {} is not installed!".format(backend)
+        return backend
+
+    @classmethod
+    def shared(cls):
+        """
+        Gets the process-wide decoder used when a decoder isn't passed in explicitly, creating it if it doesn't exist yet
+        @return: JsonDecoder
+        """
+        with cls.__shared_lock:
+            if cls.__shared_instance is None:
+                cls.__shared_instance = cls()
+            return cls.__shared_instance
+
+    @classmethod
+    def reset_shared(cls):
+        """
+        Discards the process-wide decoder
+        @return: None
+        """
+        with cls.__shared_lock:
+            cls.__shared_instance = None
+
+    @staticmethod
+    def is_available(backend):
+        """
+        @param backend: str, name of a JSON library
+        @return: bool, True if the library is installed
+        """
+        return importlib.util.find_spec(backend) is not None
+
+    @classmethod
+    def get_available_backends(cls):
+        """
+        @return: list of str, installed backends in order of preference
+        """
+        return [backend for backend in cls.BACKENDS if cls.is_available(backend)]
+
+    def loads(self, data):
+        """
+        Decodes a JSON document
+        @param data: bytes or str, bytes are expected to be UTF-8 encoded
+        @return: decoded value
+        """
+        return self.__loads(data)
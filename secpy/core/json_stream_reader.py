@@ -0,0 +1,131 @@
+import io
+import json
+import re
+
+
+class JsonStreamReader:
+    DEFAULT_CHUNK_SIZE = 64 * 1024
+    __WHITESPACE_REGEX = re.compile(r"[ \t\n\r]*")
+    # runs of anything but brackets, where brackets inside complete strings are part of the run
+    __SKIPPABLE_REGEX = re.compile(r'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+    def __init__(self, stream, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Pull-based reader over a JSON document that is read from a stream a chunk at a time rather than loaded whole.
+        Callers walk the structure they expect w/ iter_object, then either decode a value w/ read_value or pass over it
+        w/ skip_value, which scans to the end of the value w/o building any python objects. Only the value being read and
+        the unread part of the current chunk are held in memory
+        @param stream: file-like object, opened in binary (decoded as UTF-8) or text mode
+        @param chunk_size: int, number of characters to read from the stream at a time
+        """
+        assert isinstance(chunk_size, int) and chunk_size > 0, "chunk_size arg {} must be a positive integer!".format(chunk_size)
+        self.__stream = io.TextIOWrapper(stream, encoding="utf-8") if not isinstance(stream, io.TextIOBase) else stream
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def __fill(self, size=None):
+        if self.__eof:
+            return False
+        data = self.__stream.read(size or self.__chunk_size)
+        if not data:
+            self.__eof = True
+            return False
+        self.__buffer = self.__buffer[self.__pos:] + data
+        self.__pos = 0
+        return True
+
+    def __skip_whitespace(self):
+        while True:
+            self.__pos = self.__WHITESPACE_REGEX.match(self.__buffer, self.__pos).end()
+            if self.__pos < len(self.__buffer) or not self.__fill():
+                return
+
+    def peek(self):
+        """
+        @return: str, next non-whitespace character w/o consuming it, empty at the end of the document
+        """
+        self.__skip_whitespace()
+        return self.__buffer[self.__pos] if self.__pos < len(self.__buffer) else ""
+
+    def expect(self, char):
+        """
+        Consumes the next non-whitespace character
+        @param char: str, character the document must have next
+        @return: None
+        """
+        actual = self.peek()
+        if actual != char:
+            raise ValueError("Expected {!r} but found {!r} in JSON stream".format(char, actual))
+        self.__pos += 1
+
+    def read_value(self):
+        """
+        Decodes the next value in the document
+        @return: decoded value
+        """
+        self.__skip_whitespace()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__pos)
+                # a value ending right at the end of the buffer may be a number that continues in the next chunk
+                if end < len(self.__buffer) or self.__eof:
+                    self.__pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__eof:
+                    raise
+            # grow the buffer by at least the size of the pending value so large values are only re-decoded a few times
+            self.__fill(max(self.__chunk_size, len(self.__buffer) - self.__pos))
+
+    def skip_value(self):
+        """
+        Consumes the next value in the document w/o decoding it
+        @return: None
+        """
+        if self.peek() not in ("[", "{"):
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            self.__pos = self.__SKIPPABLE_REGEX.match(self.__buffer, self.__pos).end()
+            # the run stops early at a string that continues in the next chunk
+            if self.__pos >= len(self.__buffer) or self.__buffer[self.__pos] == '"':
+                self.__fill_or_raise()
+                continue
+            char = self.__buffer[self.__pos]
+            if char in "[{":
+                depth += 1
+                self.__pos += 1
+            else:
+                depth -= 1
+                self.__pos += 1
+                if depth == 0:
+                    return
+
+    def __fill_or_raise(self):
+        if not self.__fill(max(self.__chunk_size, len(self.__buffer) - self.__pos)):
+            raise ValueError("Unexpected end of JSON stream")
+
+    def iter_object(self):
+        """
+        Iterates over the keys of the next object in the document. The value of each key must be consumed w/ read_value,
+        skip_value or another nested iter_* call before moving on to the next key
+        @return: generator of str
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.__pos += 1
+            return
+        while True:
+            key = self.read_value()
+            self.expect(":")
+            yield key
+            char = self.peek()
+            self.__pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise ValueError("Expected ',' or '}}' but found {!r} in JSON stream".format(char))
@@ -0,0 +1,40 @@
+class LazyNamespace:
+    def __init__(self, raw, factory, key_func=None):
+        """
+        Namespace whose attributes are built from a dict of raw values the first time they are accessed.
+        Used in place of SimpleNamespace when parsing large responses where typically only a few attributes are needed.
+        Attributes are cached once built, so subsequent access is as cheap as a regular attribute lookup.
+        See NamespaceOpts for listing/getting attributes of a LazyNamespace and SimpleNamespace interchangeably
+        @param raw: dict of raw key -> raw value
+        @param factory: python callable, takes the raw key and raw value and returns the attribute value
+        @param key_func: python callable, converts a raw key into an attribute name
+        """
+        self.__raw = raw
+        self.__factory = factory
+        self.__raw_keys = {key_func(raw_key) if key_func else raw_key: raw_key for raw_key in raw}
+
+    def __getattr__(self, name):
+        # only called when name has not been built yet
+        if name.startswith("_LazyNamespace__"):
+            raise AttributeError(name)
+        try:
+            return self._get(name)
+        except KeyError:
+            raise AttributeError("{} has no attribute {}".format(type(self).__name__, name))
+
+    def _get(self, name):
+        raw_key = self.__raw_keys[name]
+        if name in self.__dict__:
+            return self.__dict__[name]
+        value = self.__factory(raw_key, self.__raw[raw_key])
+        self.__dict__[name] = value
+        return value
+
+    def _list_names(self):
+        return list(self.__raw_keys.keys())
+
+    def __dir__(self):
+        return self._list_names()
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join(self._list_names()))
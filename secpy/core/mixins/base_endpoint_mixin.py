@@ -1,5 +1,6 @@
 import logging
 
+from secpy.core.batch_executor import BatchExecutor
 from secpy.core.mixins.base_network_client_mixin import BaseNetworkClientMixin
 from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
 
@@ -7,15 +8,33 @@ from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
 class BaseEndpointMixin(BaseNetworkClientMixin):
     _endpoint = None
 
-    def __init__(self, user_agent, **kwargs):
+    def __init__(self,
+                 user_agent,
+                 ticker_cache_dir=None,
+                 ticker_cache_ttl=TickerCompanyExchangeMap.DEFAULT_CACHE_TTL,
+                 **kwargs):
         """
         Base class to be inherited by all classes that interact directly w/ the SEC REST API
         @param user_agent: unique identifiers to use in headers when making requests to SEC REST API
+        @param ticker_cache_dir: str, directory to cache company_tickers_exchange.json in, see TickerCompanyExchangeMap.
+                                 Not cached on disk if None
+        @param ticker_cache_ttl: int, number of seconds the cached company_tickers_exchange.json is used before it is revalidated
         @param kwargs: Misc
         """
         super().__init__(user_agent, **kwargs)
         self._logger = self.__set_logger()
-        self._ticker_cte_map = TickerCompanyExchangeMap(user_agent, **kwargs)
+        self._ticker_cte_map = TickerCompanyExchangeMap.shared(user_agent, cache_dir=ticker_cache_dir, cache_ttl=ticker_cache_ttl, **kwargs)
+
+    @staticmethod
+    def _run_batch(func, items, max_workers=None):
+        """
+        Applies func to each item concurrently on a bounded pool of worker threads
+        @param func: python callable, takes a single item as an argument
+        @param items: iterable of items to apply func to
+        @param max_workers: int, number of worker threads to use
+        @return: generator of BatchResult in the order that items finish
+        """
+        return BatchExecutor(max_workers).run(func, items)
 
     @staticmethod
     def __set_logger():
@@ -17,6 +17,10 @@ class BaseNetworkClientMixin:
         assert EndpointEnum.validate_endpoint_kwargs(**kwargs)
         return self.__network_client.make_request_json(endpoint, **kwargs)
 
+    def _validate_args_and_make_raw_request(self, endpoint, request_headers=None, **kwargs):
+        assert EndpointEnum.validate_endpoint_kwargs(**kwargs)
+        return self.__network_client.make_request(endpoint, request_headers=request_headers, **kwargs)
+
     def _validate_path_and_download_file(self, endpoint, target_path, **kwargs):
         assert not path.exists(target_path), "target_path {} already exists!".format(target_path)
         return self.__network_client.download_file(endpoint, target_path, **kwargs)
@@ -0,0 +1,25 @@
+class SlotsDataObjectMixin:
+    """
+    Base class for the data objects that are created once per parsed element (facts, filings, frames, addresses, tickers).
+    Subclasses declare their attributes in __slots__, so instances don't carry a __dict__, and get __eq__, __hash__ and
+    __repr__ from the slot values. Subclasses resolve the json keys of their SchemaEnum into class attributes (ie _VAL_KEY)
+    once at class creation, rather than going through the Enum for every element that is parsed.
+    Instances hash by value and their attributes are writable, so an instance must not be modified while it is in a set
+    or used as a dict key
+    """
+    __slots__ = ()
+
+    def _slot_values(self):
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._slot_values() == other._slot_values()
+        else:
+            return False
+
+    def __hash__(self):
+        return hash(self._slot_values())
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ", ".join("{}={!r}".format(slot, getattr(self, slot)) for slot in self.__slots__))
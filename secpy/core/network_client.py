@@ -1,47 +1,72 @@
+import threading
+
 import backoff
 import requests
-from ratelimiter import RateLimiter
-from tqdm import tqdm
+from requests.adapters import HTTPAdapter
+
+from secpy.core.rate_limiter import TokenBucketRateLimiter
+from secpy.core.resumable_downloader import ResumableDownloader
+from secpy.core.utils.network_client_opts import NetworkClientOpts
 
 
 class NetworkClient:
-    __MAXIMUM_REQUESTS_PER_SEC_CAP = 10
+    __CONNECTION_POOL_SIZE = 16
+
+    # Shared by every NetworkClient in the process w/ the same user agent so that connections are reused across endpoint objects
+    __shared_sessions = {}
+    __shared_lock = threading.Lock()
 
     def __init__(self,
                  user_agent,
                  max_requests_per_sec=10,
-                 max_retries=5
+                 max_retries=5,
+                 cache=None,
+                 json_decoder=None
                  ):
         """
         Handles all requests to SEC REST API endpoints. Ensures that requests are formatted properly and are in accordance
         with the SEC's recommendations as specified here: https://www.sec.gov/privacy.htm#security
+        Each instance is throttled to its own max_requests_per_sec and, together w/ every other client in the process, to
+        the process-wide rate limiter, and instances w/ the same user_agent share a pooled requests.Session so that
+        connections are kept alive between requests
         @param user_agent: Used in header of request to identify application making the request
-        @param max_requests_per_sec: Maximum number of request against the SEC REST API in one second
+        @param max_requests_per_sec: Maximum number of request this client makes against the SEC REST API in one second
         @param max_retries: Maximum number of retries to make a request before giving up
+        @param cache: ResponseCache, optional cache used by make_request_json for the endpoints it has a TTL for
+        @param json_decoder: JsonDecoder, used to decode responses in make_request_json. Defaults to the process-wide JsonDecoder
         """
-        self._headers = self.__set_headers(user_agent)
-        self._max_requests_per_sec = self.__set_max_requests_per_sec(max_requests_per_sec)
-        self.max_retries = self.__set_max_retries(max_retries)
+        self._headers = NetworkClientOpts.get_headers(user_agent)
+        self._max_requests_per_sec = NetworkClientOpts.validate_max_requests_per_sec(max_requests_per_sec)
+        self.max_retries = NetworkClientOpts.validate_max_retries(max_retries)
+        self._rate_limiter = TokenBucketRateLimiter(self._max_requests_per_sec, parent=TokenBucketRateLimiter.shared())
+        self._session = self.__get_shared_session(user_agent)
+        self._cache = cache
+        self._json_decoder = NetworkClientOpts.get_json_decoder(json_decoder)
 
-    @staticmethod
-    def __set_headers(user_agent):
-        assert isinstance(user_agent, str), "user_agent arg {} is not of type string!".format(user_agent)
-        assert user_agent != "", "user_agent must be a non-empty string!"
-        return {
-            "User-Agent": user_agent
-        }
-
-    def __set_max_requests_per_sec(self, max_requests_per_sec):
-        assert isinstance(max_requests_per_sec, int) and max_requests_per_sec > 0, "max_requests_per_sec arg {} must be a positive integer!".format( max_requests_per_sec)
-        assert max_requests_per_sec <= self.__MAXIMUM_REQUESTS_PER_SEC_CAP, "max_requests_per_sec {} must be less than or equal to {} or else application risks getting rate limited. " \
-                                                                            "See https://www.sec.gov/privacy.htm#security for more information re. rate limiting".format(max_requests_per_sec, self.__MAXIMUM_REQUESTS_PER_SEC_CAP)
-        return max_requests_per_sec
+    @classmethod
+    def __get_shared_session(cls, user_agent):
+        with cls.__shared_lock:
+            if user_agent not in cls.__shared_sessions:
+                session = requests.Session()
+                session.headers.update(NetworkClientOpts.get_headers(user_agent))
+                adapter = HTTPAdapter(pool_connections=cls.__CONNECTION_POOL_SIZE, pool_maxsize=cls.__CONNECTION_POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                cls.__shared_sessions[user_agent] = session
+            return cls.__shared_sessions[user_agent]
 
-    @staticmethod
-    def __set_max_retries(max_retries):
-        assert isinstance(max_retries, int) and max_retries > 0, "rate_limit arg {} must be a positive integer!".format(
-            max_retries)
-        return max_retries
+    @classmethod
+    def reset_shared_state(cls):
+        """
+        Closes all shared sessions and discards the shared rate limiter. The next NetworkClient created will start
+        w/ a fresh session and rate limiter
+        @return: None
+        """
+        with cls.__shared_lock:
+            for session in cls.__shared_sessions.values():
+                session.close()
+            cls.__shared_sessions = {}
+        TokenBucketRateLimiter.reset_shared()
 
     def make_request_json(self, endpoint, **kwargs):
         """
@@ -50,58 +75,74 @@ class NetworkClient:
         @param kwargs: used to specify substitution variables in order to format endpoint
         @return: response in json form
         """
-        return self.make_request(endpoint, **kwargs).json()
+        if self._cache is None or not self._cache.is_cacheable(endpoint):
+            return self._json_decoder.loads(self.make_request(endpoint, **kwargs).content)
+        return self._json_decoder.loads(self.__make_cached_request(endpoint, **kwargs))
+
+    def __make_cached_request(self, endpoint, **kwargs):
+        formatted_endpoint = endpoint.value.format(**kwargs)
+        entry = self._cache.get(formatted_endpoint)
+        if entry and self._cache.is_fresh(endpoint, entry):
+            return entry.body
 
-    def make_request(self, endpoint, **kwargs):
+        request_headers = entry.conditional_headers() if entry else None
+        response = self.make_request(endpoint, request_headers=request_headers, **kwargs)
+        if response.status_code == 304 and entry:
+            return self._cache.refresh(entry).body
+
+        entry = self._cache.put(formatted_endpoint,
+                                response.content,
+                                etag=response.headers.get("ETag"),
+                                last_modified=response.headers.get("Last-Modified"))
+        return entry.body
+
+    def make_request(self, endpoint, request_headers=None, **kwargs):
         """
         Makes a request to a given SEC REST API endpoint in the set of endpoint templates defined by EndpointEnum
         @param endpoint: EndpointEnum value
+        @param request_headers: dict, additional headers to send w/ the request, ie for conditional requests
         @param kwargs: used to specify substitution variables in order to format endpoint
         @return: response
         """
+        headers = dict(self._headers, **request_headers) if request_headers else self._headers
 
-        @RateLimiter(max_calls=self._max_requests_per_sec, period=1)
         @backoff.on_exception(backoff.expo,
                               requests.exceptions.RequestException,
                               max_tries=self.max_retries
                               )
         def __make_requests_helper():
             formatted_endpoint = endpoint.value.format(**kwargs)
-            return requests.get(
+            self._rate_limiter.acquire()
+            return self._session.get(
                 formatted_endpoint,
-                headers=self._headers
+                headers=headers
             )
 
         response = __make_requests_helper()
         self.__validate_response(response)
         return response
 
-    def download_file(self, endpoint, file_path, chunk_size, disable_progress_bar=False, **kwargs):
+    def download_file(self,
+                      endpoint,
+                      file_path,
+                      chunk_size=ResumableDownloader.DEFAULT_CHUNK_SIZE,
+                      disable_progress_bar=False,
+                      segments=1,
+                      **kwargs):
         """
-        Downloads a file from the SEC REST API and stores it on disk
+        Downloads a file from the SEC REST API and stores it on disk. Bytes are written to <file_path>.part first and the
+        download resumes from there w/ a Range request after a failure, either on retry or on the next call w/ the same file_path.
+        See ResumableDownloader
         @param endpoint: EndpointEnum value
         @param file_path: output location of the file
         @param chunk_size: number of bytes to read into memory while iterating over response
+        @param disable_progress_bar: bool
+        @param segments: int, number of byte ranges to download in parallel, each request still goes through the rate limiter
         @param kwargs: used to specify substitution variables in order to format endpoint
-        @return:
+        @return: int, size of the downloaded file in bytes
         """
-        @RateLimiter(max_calls=self._max_requests_per_sec, period=1)
-        @backoff.on_exception(backoff.expo,
-                              requests.exceptions.RequestException,
-                              max_tries=self.max_retries
-                              )
-        def __download_file_helper():
-            formatted_endpoint = endpoint.value.format(**kwargs)
-            response = requests.get(formatted_endpoint, stream=True, allow_redirects=True, headers=self._headers)
-            content_length = int(response.headers.get('content-length'))
-            initial_pos = 0
-            with open(file_path, "wb") as file:
-                with tqdm(total=content_length, unit_scale=True, unit="B", desc=file_path, initial=initial_pos, ascii=True, disable=disable_progress_bar) as pbar:
-                    for chunk in response.iter_content(chunk_size=chunk_size):
-                        file.write(chunk)
-                        pbar.update(len(chunk))
-
-        __download_file_helper()
+        downloader = ResumableDownloader(self._session, self._rate_limiter, self._headers, self.max_retries)
+        return downloader.download(endpoint.value.format(**kwargs), file_path, chunk_size, segments, disable_progress_bar)
 
     @staticmethod
     def __validate_response(response):
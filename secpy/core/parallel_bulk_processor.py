@@ -0,0 +1,134 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from zipfile import ZipFile
+
+from secpy.core.json_decoder import JsonDecoder
+
+# ZipFile handle opened once by each worker process in _init_worker, ZipFile handles can't be shared across processes
+_worker_zip_file = None
+_worker_json_decoder = None
+
+
+def _init_worker(archive_path, json_backend):
+    global _worker_zip_file, _worker_json_decoder
+    _worker_zip_file = ZipFile(archive_path)
+    _worker_json_decoder = JsonDecoder(json_backend)
+
+
+def _read_member(filename):
+    return _worker_json_decoder.loads(_worker_zip_file.read(filename))
+
+
+def _map_chunk(filenames, parser, func):
+    return [func(parser(_read_member(filename))) for filename in filenames]
+
+
+def _filter_chunk(filenames, parser, predicate):
+    data_objects = (parser(_read_member(filename)) for filename in filenames)
+    return [data_object for data_object in data_objects if predicate(data_object)]
+
+
+def _reduce_chunk(filenames, parser, func, initial):
+    accumulator = initial
+    for filename in filenames:
+        accumulator = func(accumulator, parser(_read_member(filename)))
+    return accumulator
+
+
+class ParallelBulkProcessor:
+    DEFAULT_CHUNKSIZE = 64
+
+    def __init__(self, archive_path, parser, processes=None, chunksize=DEFAULT_CHUNKSIZE, json_decoder=None):
+        """
+        Processes the members of a bulk data zip file across a pool of worker processes.
+        Members are split into chunks that are read, decoded and parsed by the workers, each of which opens its own handle on the archive.
+        Any callables passed in (including parser) are sent to the workers, so they must be picklable, ie functions defined
+        at the top level of a module rather than lambdas or nested functions
+        @param archive_path: str, full path of the bulk data zip file
+        @param parser: python callable, parses the json of a single member into a data object, ie CompanyFacts
+        @param processes: int, number of worker processes. Defaults to the number of CPUs on the machine
+        @param chunksize: int, number of members sent to a worker at a time
+        @param json_decoder: JsonDecoder, its backend is used to decode members in the workers. Defaults to the process-wide JsonDecoder
+        """
+        assert processes is None or (isinstance(processes, int) and processes > 0), "processes arg {} must be a positive integer!".format(processes)
+        assert isinstance(chunksize, int) and chunksize > 0, "chunksize arg {} must be a positive integer!".format(chunksize)
+        self.archive_path = archive_path
+        self.parser = parser
+        self.processes = processes
+        self.chunksize = chunksize
+        self.json_decoder = json_decoder or JsonDecoder.shared()
+
+    def map(self, func, filenames, ordered=True):
+        """
+        Applies func to the data object parsed from each member
+        @param func: python callable, takes a single data object
+        @param filenames: iterable of member names to process
+        @param ordered: bool, yield results in the order of filenames rather than in the order they finish
+        @return: generator of return values of func
+        """
+        for results in self.__run(_map_chunk, filenames, ordered, func):
+            yield from results
+
+    def filter(self, predicate, filenames, ordered=True):
+        """
+        Keeps the data objects for which predicate returns True
+        @param predicate: python callable, takes a single data object and returns a bool
+        @param filenames: iterable of member names to process
+        @param ordered: bool, yield data objects in the order of filenames rather than in the order they finish
+        @return: generator of data objects
+        """
+        for results in self.__run(_filter_chunk, filenames, ordered, predicate):
+            yield from results
+
+    def reduce(self, func, initial, combine, filenames):
+        """
+        Folds the data objects of all members into a single value.
+        Each chunk is folded in a worker starting from initial, then the partial results are merged w/ combine
+        @param func: python callable, takes an accumulator and a data object and returns the new accumulator
+        @param initial: starting value of the accumulator for each chunk, should be an identity for combine (ie 0 for a sum)
+        @param combine: python callable, merges two accumulators into one
+        @param filenames: iterable of member names to process
+        @return: the final accumulator
+        """
+        result = initial
+        for partial_result in self.__run(_reduce_chunk, filenames, False, func, initial):
+            result = combine(result, partial_result)
+        return result
+
+    def __run(self, chunk_func, filenames, ordered, *args):
+        chunks = iter(self.__chunk(list(filenames)))
+        # like BatchExecutor, only a bounded number of chunks are in flight so finished results don't pile up in the
+        # parent while it waits on a slow chunk or a slow consumer
+        max_in_flight = 2 * (self.processes or os.cpu_count() or 1)
+        in_flight = deque()
+        executor = ProcessPoolExecutor(max_workers=self.processes,
+                                       initializer=_init_worker,
+                                       initargs=(self.archive_path, self.json_decoder.backend))
+        try:
+            self.__submit(executor, chunk_func, chunks, args, in_flight, max_in_flight)
+            while in_flight:
+                if ordered:
+                    done = [in_flight.popleft()]
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        in_flight.remove(future)
+                # refilled before yielding so the workers stay busy while the caller consumes the results
+                self.__submit(executor, chunk_func, chunks, args, in_flight, max_in_flight)
+                for future in done:
+                    yield future.result()
+        finally:
+            # chunks that haven't started are dropped if the caller stops consuming results early or a chunk fails
+            executor.shutdown(cancel_futures=True)
+
+    def __submit(self, executor, chunk_func, chunks, args, in_flight, max_in_flight):
+        while len(in_flight) < max_in_flight:
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return
+            in_flight.append(executor.submit(chunk_func, chunk, self.parser, *args))
+
+    def __chunk(self, filenames):
+        return [filenames[i:i + self.chunksize] for i in range(0, len(filenames), self.chunksize)]
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+import time
+
+
+class TokenBucketRateLimiter:
+    # rate of the process-wide bucket, the SEC's limit for all traffic from a host: https://www.sec.gov/privacy.htm#security
+    SHARED_MAX_CALLS_PER_SEC = 10
+
+    __shared_instance = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, max_calls_per_sec, burst=1, parent=None):
+        """
+        Thread-safe token bucket used to throttle requests against the SEC REST API.
+        Tokens are refilled continuously at max_calls_per_sec and each call reserves one token. When the bucket is empty
+        the call is handed a reservation in the future, so concurrent callers are spaced out instead of bursting together.
+        The same bucket can be shared by threads (acquire) and asyncio tasks (acquire_async).
+        A bucket w/ a parent reserves a token from both at once, so calls are held to the lower of the two rates and
+        every bucket w/ the same parent draws from the parent's rate as well, ie a client limited to 2 calls per second
+        that shares the process-wide bucket w/ other clients
+        @param max_calls_per_sec: int, number of calls allowed per second
+        @param burst: int, maximum number of calls that can be made back to back after the bucket has been idle
+        @param parent: TokenBucketRateLimiter, bucket that is drawn from on every call in addition to this one
+        """
+        assert isinstance(max_calls_per_sec, int) and max_calls_per_sec > 0, "max_calls_per_sec arg {} must be a positive integer!".format(max_calls_per_sec)
+        assert isinstance(burst, int) and burst > 0, "burst arg {} must be a positive integer!".format(burst)
+        assert parent is None or isinstance(parent, TokenBucketRateLimiter), "parent arg {} must be a TokenBucketRateLimiter!".format(parent)
+        self.max_calls_per_sec = max_calls_per_sec
+        self.burst = burst
+        self.parent = parent
+        # time at which the bucket will be full again, each call pushes it back by one interval (1 / max_calls_per_sec)
+        self.__full_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """
+        Gets the process-wide rate limiter, creating it if it doesn't exist yet.
+        The SEC rate limit applies to all traffic from a host, so every client in the process should draw from this bucket,
+        either directly or as the parent of its own bucket
+        @return: TokenBucketRateLimiter
+        """
+        with cls.__shared_lock:
+            if cls.__shared_instance is None:
+                cls.__shared_instance = cls(cls.SHARED_MAX_CALLS_PER_SEC)
+            return cls.__shared_instance
+
+    @classmethod
+    def reset_shared(cls):
+        """
+        Discards the process-wide rate limiter
+        @return: None
+        """
+        with cls.__shared_lock:
+            cls.__shared_instance = None
+
+    def reserve(self):
+        """
+        Reserves a single token from the bucket and from its parents
+        @return: float, number of seconds the caller must wait before making its call
+        """
+        chain = self.__get_chain()
+        # locks are always taken child first, so buckets sharing a parent can't deadlock
+        for limiter in chain:
+            limiter.__lock.acquire()
+        try:
+            now = time.monotonic()
+            call_at = max(limiter.__get_earliest_call(now) for limiter in chain)
+            for limiter in chain:
+                limiter.__reserve_at(call_at)
+            return call_at - now
+        finally:
+            for limiter in reversed(chain):
+                limiter.__lock.release()
+
+    def acquire(self):
+        """
+        Blocks the calling thread until a token is available
+        @return: None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """
+        Suspends the calling coroutine until a token is available w/out blocking the event loop
+        @return: None
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def __get_chain(self):
+        chain = [self]
+        while chain[-1].parent is not None:
+            chain.append(chain[-1].parent)
+        return chain
+
+    def __get_interval(self):
+        return 1 / self.max_calls_per_sec
+
+    def __get_earliest_call(self, now):
+        # a token is available once the bucket is no more than burst - 1 intervals away from being full
+        return max(now, self.__full_at - (self.burst - 1) * self.__get_interval())
+
+    def __reserve_at(self, call_at):
+        self.__full_at = max(self.__full_at, call_at) + self.__get_interval()
@@ -0,0 +1,262 @@
+import gzip
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.utils.file_opts import FileOpts
+
+
+class ResponseCache:
+    DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "secpy", "responses")
+    DEFAULT_MAX_SIZE = 1024 ** 3
+    DEFAULT_TTLS = {
+        EndpointEnum.COMPANY_FACTS: 24 * 60 * 60,
+        EndpointEnum.COMPANY_CONCEPT: 24 * 60 * 60,
+        EndpointEnum.FRAMES: 24 * 60 * 60,
+        EndpointEnum.SUBMISSIONS_CIK: 60 * 60,
+        # historical submissions pages only contain older filings, so they rarely change once published
+        EndpointEnum.SUBMISSIONS: 7 * 24 * 60 * 60
+    }
+    # not .gz, since the gzip stream of an entry starts after its stored_at prefix
+    __FILE_EXTENSION = ".secpy-cache"
+    # stored_at is kept uncompressed at the start of each entry file, so revalidating an entry rewrites 8 bytes in place
+    # rather than recompressing the whole body
+    __STORED_AT = struct.Struct("<d")
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, ttls=None, max_size=DEFAULT_MAX_SIZE, compression_level=6):
+        """
+        Disk-backed cache of responses from the data.sec.gov endpoints, used by NetworkClient to avoid spending the rate budget on unchanged data.
+        Entries are keyed by the formatted URL of the request and stored gzip compressed alongside the ETag/Last-Modified
+        validators of the response and the time it was fetched or last revalidated. Entries older than the TTL of their endpoint are revalidated w/ a conditional request.
+        Once the total size of the cache exceeds max_size the least recently used entries are evicted. cache_dir is rescanned
+        before evicting, so entries written by other processes sharing the same directory count toward max_size too
+        @param cache_dir: str, directory to store cached responses in
+        @param ttls: dict of EndpointEnum -> number of seconds a response is fresh for. Overrides DEFAULT_TTLS, only endpoints w/ a TTL are cached
+        @param max_size: int, maximum number of bytes the cache can take up on disk
+        @param compression_level: int, gzip compression level between 0 and 9
+        """
+        assert isinstance(max_size, int) and max_size > 0, "max_size arg {} must be a positive integer!".format(max_size)
+        assert compression_level in range(10), "compression_level arg {} must be an integer between 0 and 9!".format(compression_level)
+        self.cache_dir = cache_dir
+        self.ttls = self.__set_ttls(ttls)
+        self.max_size = max_size
+        self.compression_level = compression_level
+        self.__lock = threading.Lock()
+        self.__entry_sizes = {}
+        self.__total_size = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.__load_entry_sizes()
+
+    def __set_ttls(self, ttls):
+        merged_ttls = dict(self.DEFAULT_TTLS)
+        merged_ttls.update(ttls or {})
+        for endpoint, ttl in merged_ttls.items():
+            assert isinstance(endpoint, EndpointEnum), "ttls key {} must be an EndpointEnum value!".format(endpoint)
+            assert isinstance(ttl, (int, float)) and ttl >= 0, "ttl {} for {} must be a non-negative number!".format(ttl, endpoint)
+        return merged_ttls
+
+    def __load_entry_sizes(self):
+        # stats every entry in cache_dir, including the ones written or removed by other processes sharing it
+        entry_sizes = {}
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(self.__FILE_EXTENSION):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    entry_sizes[path] = os.path.getsize(path)
+                except FileNotFoundError:
+                    pass
+        with self.__lock:
+            self.__entry_sizes = entry_sizes
+            self.__total_size = sum(entry_sizes.values())
+
+    def is_cacheable(self, endpoint):
+        return endpoint in self.ttls
+
+    def is_fresh(self, endpoint, entry):
+        """
+        Checks whether a cached entry is still w/in the TTL of its endpoint
+        @param endpoint: EndpointEnum value the entry was requested from
+        @param entry: CachedResponse
+        @return: bool
+        """
+        return time.time() - entry.stored_at < self.ttls[endpoint]
+
+    def get(self, url):
+        """
+        Gets the cached response for a URL and marks it as recently used
+        @param url: str, formatted URL of the request
+        @return: CachedResponse, None if the URL is not cached
+        """
+        path = self.__get_path(url)
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+            stored_at, = self.__STORED_AT.unpack_from(data)
+            entry = CachedResponse.from_bytes(gzip.decompress(data[self.__STORED_AT.size:]), stored_at)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError, struct.error):
+            # corrupt entry, ie from a process that was killed mid-write before atomic writes were in place
+            self.__remove_entry(path)
+            return None
+        self.__mark_used(path)
+        return entry
+
+    def put(self, url, body, etag=None, last_modified=None):
+        """
+        Stores a response in the cache, evicting the least recently used entries if the cache grows past max_size
+        @param url: str, formatted URL of the request
+        @param body: bytes, body of the response
+        @param etag: str, ETag header of the response
+        @param last_modified: str, Last-Modified header of the response
+        @return: CachedResponse
+        """
+        entry = CachedResponse(url, body, etag, last_modified, time.time())
+        self.__write_entry(entry)
+        return entry
+
+    def refresh(self, entry):
+        """
+        Marks a cached entry as fresh again, ie after the SEC responded w/ 304 Not Modified. Only the stored_at field at
+        the start of the entry file is rewritten, the compressed body is left as is
+        @param entry: CachedResponse
+        @return: CachedResponse
+        """
+        path = self.__get_path(entry.url)
+        stored_at = time.time()
+        try:
+            with open(path, "r+b") as file:
+                file.write(self.__STORED_AT.pack(stored_at))
+        except FileNotFoundError:
+            # evicted since it was read
+            return self.put(entry.url, entry.body, entry.etag, entry.last_modified)
+        entry.stored_at = stored_at
+        self.__mark_used(path)
+        return entry
+
+    def clear(self):
+        """
+        Removes all entries from the cache
+        @return: None
+        """
+        self.__load_entry_sizes()
+        with self.__lock:
+            paths = list(self.__entry_sizes.keys())
+        for path in paths:
+            self.__remove_entry(path)
+
+    def size(self):
+        """
+        @return: int, number of bytes taken up by the cache on disk. Entries written by other processes are only counted
+                 once this cache has rescanned cache_dir, ie when evicting
+        """
+        return self.__total_size
+
+    def __write_entry(self, entry):
+        path = self.__get_path(entry.url)
+        FileOpts.atomic_write(path, self.__STORED_AT.pack(entry.stored_at) + gzip.compress(entry.to_bytes(), compresslevel=self.compression_level))
+        with self.__lock:
+            self.__track_entry(path)
+        self.__evict_if_needed()
+
+    def __evict_if_needed(self):
+        with self.__lock:
+            if self.__total_size <= self.max_size:
+                return
+        # only the entries tracked by this process are counted until the cache looks full
+        self.__load_entry_sizes()
+        with self.__lock:
+            if self.__total_size <= self.max_size:
+                return
+            paths = sorted(self.__entry_sizes.keys(), key=self.__get_last_used)
+            evicted = []
+            total_size = self.__total_size
+            for path in paths:
+                if total_size <= self.max_size:
+                    break
+                total_size -= self.__entry_sizes[path]
+                evicted.append(path)
+        for path in evicted:
+            self.__remove_entry(path)
+
+    def __track_entry(self, path):
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            return
+        self.__total_size += size - self.__entry_sizes.get(path, 0)
+        self.__entry_sizes[path] = size
+
+    def __remove_entry(self, path):
+        with self.__lock:
+            self.__total_size -= self.__entry_sizes.pop(path, 0)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __mark_used(path):
+        # modification time doubles as the last used time of an entry for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def __get_last_used(path):
+        try:
+            return os.path.getmtime(path)
+        except FileNotFoundError:
+            return 0
+
+    def __get_path(self, url):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, key + self.__FILE_EXTENSION)
+
+
+class CachedResponse:
+    def __init__(self, url, body, etag, last_modified, stored_at):
+        """
+        Response stored in ResponseCache
+        @param url: str, formatted URL of the request
+        @param body: bytes, body of the response
+        @param etag: str, ETag header of the response
+        @param last_modified: str, Last-Modified header of the response
+        @param stored_at: float, unix timestamp of when the response was fetched or last revalidated
+        """
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def conditional_headers(self):
+        """
+        Builds the headers needed to revalidate the response w/ a conditional request
+        @return: dict
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_bytes(self):
+        header = json.dumps({
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified
+        })
+        return header.encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data, stored_at):
+        header, body = data.split(b"\n", 1)
+        metadata = json.loads(header)
+        return cls(metadata["url"], body, metadata["etag"], metadata["last_modified"], stored_at)
@@ -0,0 +1,263 @@
+import glob
+import json
+import os
+import re
+import shutil
+import threading
+
+import backoff
+import requests
+from tqdm import tqdm
+
+from secpy.core.batch_executor import BatchExecutor
+from secpy.core.utils.file_opts import FileOpts
+
+
+class IncompleteDownloadError(requests.exceptions.RequestException):
+    """
+    Raised when a response ends before all of the expected bytes were received. Subclasses RequestException so that it is
+    retried, and resumed, like any other network error
+    """
+    pass
+
+
+class RangeNotHonouredError(Exception):
+    """
+    Raised when the server answers a Range request for a segment w/ the whole file, which happens when the file changed
+    after the download started. It isn't retried since every retry would get the same answer, calling download again
+    discards the segments of the old version of the file and starts over
+    """
+    pass
+
+
+class ResumableDownloader:
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+    PART_SUFFIX = ".part"
+    __METADATA_SUFFIX = ".json"
+    __CONTENT_RANGE_REGEX = re.compile(r"bytes (?:\d+-\d+|\*)/(\d+)")
+
+    def __init__(self, session, rate_limiter, headers, max_retries):
+        """
+        Downloads large files w/ HTTP Range requests so that a failed download picks up where it left off rather than starting over.
+        Bytes are written to a <file_path>.part file next to the target, along w/ a <file_path>.part.json file holding the
+        ETag/Last-Modified validator and size of the remote file. Resumed requests send the validator in If-Range, so a part
+        file of an older version of the file is discarded instead of being spliced together w/ the new version.
+        Once the expected number of bytes are on disk the part file is renamed to file_path in a single step
+        @param session: requests.Session to make requests w/
+        @param rate_limiter: TokenBucketRateLimiter every request is made through
+        @param headers: dict, headers to send w/ every request
+        @param max_retries: int, maximum number of attempts per request before giving up
+        """
+        self._session = session
+        self._rate_limiter = rate_limiter
+        self._headers = dict(headers, **{"Accept-Encoding": "identity"})
+        self.max_retries = max_retries
+
+    def download(self, url, file_path, chunk_size=DEFAULT_CHUNK_SIZE, segments=1, disable_progress_bar=False):
+        """
+        Downloads url to file_path, resuming from a previous partial download of the same file if there is one
+        @param url: str
+        @param file_path: str, output location of the file
+        @param chunk_size: int, number of bytes to read into memory at a time while iterating over a response
+        @param segments: int, number of byte ranges to download in parallel. Falls back to a single stream if the server
+                         doesn't report the size of the file or doesn't support Range requests
+        @param disable_progress_bar: bool
+        @return: int, size of the downloaded file in bytes
+        """
+        assert isinstance(chunk_size, int) and chunk_size > 0, "chunk_size arg {} must be a positive integer!".format(chunk_size)
+        assert isinstance(segments, int) and segments > 0, "segments arg {} must be a positive integer!".format(segments)
+        part_path = file_path + self.PART_SUFFIX
+        size = None
+        if segments > 1:
+            size, validator, accepts_ranges = self.__probe(url)
+            if size and accepts_ranges and size >= segments:
+                self.__download_segments(url, part_path, size, validator, segments, chunk_size, disable_progress_bar)
+            else:
+                size = None
+        if size is None:
+            size = self.__download_single_stream(url, part_path, chunk_size, disable_progress_bar)
+        os.replace(part_path, file_path)
+        self.__remove(self.__get_metadata_path(part_path))
+        return size
+
+    @classmethod
+    def discard(cls, file_path):
+        """
+        Removes everything a partial download of file_path left on disk, ie when it won't be resumed
+        @param file_path: str, output location that was passed to download
+        @return: None
+        """
+        part_path = file_path + cls.PART_SUFFIX
+        segment_paths = [path for path in glob.glob(glob.escape(part_path) + ".*") if path[len(part_path) + 1:].isdigit()]
+        for path in [part_path, part_path + cls.__METADATA_SUFFIX] + segment_paths:
+            cls.__remove(path)
+
+    def __probe(self, url):
+        @backoff.on_exception(backoff.expo, requests.exceptions.RequestException, max_tries=self.max_retries)
+        def __probe_helper():
+            self._rate_limiter.acquire()
+            response = self._session.head(url, allow_redirects=True, headers=self._headers)
+            response.raise_for_status()
+            return response
+
+        response = __probe_helper()
+        content_length = response.headers.get("content-length")
+        size = int(content_length) if content_length else None
+        accepts_ranges = response.headers.get("Accept-Ranges", "").lower() == "bytes"
+        return size, self.__get_validator(response), accepts_ranges
+
+    def __download_single_stream(self, url, part_path, chunk_size, disable_progress_bar):
+        @backoff.on_exception(backoff.expo, requests.exceptions.RequestException, max_tries=self.max_retries)
+        def __download_helper():
+            metadata = self.__read_metadata(part_path)
+            offset = self.__get_size(part_path) if metadata else 0
+            headers = dict(self._headers)
+            if offset:
+                headers["Range"] = "bytes={}-".format(offset)
+                if metadata.get("validator"):
+                    headers["If-Range"] = metadata["validator"]
+
+            self._rate_limiter.acquire()
+            with self._session.get(url, stream=True, allow_redirects=True, headers=headers) as response:
+                if response.status_code == 416:
+                    # the part file already holds every byte of the file, unless the file has since shrunk
+                    if self.__get_total_size(response) == offset == metadata.get("size"):
+                        return offset
+                    self.__discard(part_path)
+                    raise IncompleteDownloadError("Partial download of {} no longer matches the remote file".format(url))
+                response.raise_for_status()
+
+                if response.status_code == 206:
+                    if metadata.get("size") is None or metadata["size"] != self.__get_total_size(response):
+                        self.__discard(part_path)
+                        raise IncompleteDownloadError("Partial download of {} can't be verified against the remote file".format(url))
+                    mode = "ab"
+                    expected_size = metadata["size"]
+                else:
+                    # a full response, either because nothing was downloaded yet or because the file has changed
+                    mode = "wb"
+                    offset = 0
+                    content_length = response.headers.get("content-length")
+                    expected_size = int(content_length) if content_length else None
+                    self.__write_metadata(part_path, {"validator": self.__get_validator(response), "size": expected_size})
+
+                with open(part_path, mode) as file:
+                    with tqdm(total=expected_size, unit_scale=True, unit="B", desc=part_path, initial=offset, ascii=True, disable=disable_progress_bar) as pbar:
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            file.write(chunk)
+                            pbar.update(len(chunk))
+
+            size = self.__get_size(part_path)
+            if expected_size is not None and size != expected_size:
+                raise IncompleteDownloadError("Received {} of {} bytes of {}".format(size, expected_size, url))
+            return size
+
+        return __download_helper()
+
+    def __download_segments(self, url, part_path, size, validator, segments, chunk_size, disable_progress_bar):
+        metadata = {"validator": validator, "size": size, "segments": segments}
+        segment_paths = ["{}.{}".format(part_path, i) for i in range(segments)]
+        if self.__read_metadata(part_path) != metadata:
+            # segments on disk belong to another version of the file or were split differently
+            for segment_path in segment_paths:
+                self.__remove(segment_path)
+            self.__write_metadata(part_path, metadata)
+        bounds = [(i * size // segments, (i + 1) * size // segments - 1) for i in range(segments)]
+
+        initial = sum(self.__get_size(segment_path) for segment_path in segment_paths)
+        with tqdm(total=size, unit_scale=True, unit="B", desc=part_path, initial=initial, ascii=True, disable=disable_progress_bar) as pbar:
+            pbar_lock = threading.Lock()
+
+            def download_segment(i):
+                start, end = bounds[i]
+                self.__download_segment(url, segment_paths[i], start, end, validator, chunk_size, pbar, pbar_lock)
+
+            failures = [result.exception for result in BatchExecutor(segments).run(download_segment, range(segments)) if not result.ok]
+        if failures:
+            # finished segments are kept on disk, so the next attempt only downloads what is missing
+            raise failures[0]
+
+        with open(part_path, "wb") as part_file:
+            for segment_path in segment_paths:
+                with open(segment_path, "rb") as segment_file:
+                    shutil.copyfileobj(segment_file, part_file, chunk_size)
+        for segment_path in segment_paths:
+            self.__remove(segment_path)
+        if self.__get_size(part_path) != size:
+            self.__discard(part_path)
+            raise IncompleteDownloadError("Segments of {} don't add up to {} bytes".format(url, size))
+
+    def __download_segment(self, url, segment_path, start, end, validator, chunk_size, pbar, pbar_lock):
+        expected_size = end - start + 1
+
+        @backoff.on_exception(backoff.expo, requests.exceptions.RequestException, max_tries=self.max_retries)
+        def __download_segment_helper():
+            done = self.__get_size(segment_path)
+            if done > expected_size:
+                self.__remove(segment_path)
+                done = 0
+            if done == expected_size:
+                return
+            headers = dict(self._headers, Range="bytes={}-{}".format(start + done, end))
+            if validator:
+                headers["If-Range"] = validator
+
+            self._rate_limiter.acquire()
+            with self._session.get(url, stream=True, allow_redirects=True, headers=headers) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise RangeNotHonouredError("Server did not honour the range request for {}, the file may have changed during the download".format(url))
+                with open(segment_path, "ab") as file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        file.write(chunk)
+                        with pbar_lock:
+                            pbar.update(len(chunk))
+
+            received = self.__get_size(segment_path)
+            if received != expected_size:
+                raise IncompleteDownloadError("Received {} of {} bytes of range {}-{} of {}".format(received, expected_size, start, end, url))
+
+        __download_segment_helper()
+
+    def __get_total_size(self, response):
+        match = self.__CONTENT_RANGE_REGEX.match(response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
+
+    @staticmethod
+    def __get_validator(response):
+        # a weak ETag can't be used in If-Range, in which case the Last-Modified date is used instead
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return response.headers.get("Last-Modified")
+
+    def __get_metadata_path(self, part_path):
+        return part_path + self.__METADATA_SUFFIX
+
+    def __read_metadata(self, part_path):
+        try:
+            with open(self.__get_metadata_path(part_path), "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def __write_metadata(self, part_path, metadata):
+        FileOpts.atomic_write(self.__get_metadata_path(part_path), json.dumps(metadata).encode())
+
+    def __discard(self, part_path):
+        self.__remove(part_path)
+        self.__remove(self.__get_metadata_path(part_path))
+
+    @staticmethod
+    def __get_size(path):
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def __remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
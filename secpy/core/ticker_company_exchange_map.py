@@ -1,4 +1,8 @@
+import threading
+
 from secpy.core.mixins.base_network_client_mixin import BaseNetworkClientMixin, EndpointEnum
+from secpy.core.mixins.slots_data_object_mixin import SlotsDataObjectMixin
+from secpy.core.response_cache import ResponseCache
 from enum import Enum
 
 from secpy.core.utils.cik_opts import CIKOpts
@@ -7,18 +11,65 @@ from secpy.core.utils.cik_opts import CIKOpts
 class TickerCompanyExchangeMap(BaseNetworkClientMixin):
     UNKNOWN = "UNKNOWN"
     CIK_LENGTH = 10
+    # company_tickers_exchange.json is regenerated by the SEC once a day
+    DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+    __shared_instances = {}
+    __shared_lock = threading.Lock()
 
-    def __init__(self, user_agent, **kwargs):
+    def __init__(self, user_agent, cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL, **kwargs):
         """
         Handles downloading/parsing of company_tickers_exchange.json file from SEC REST API into a map of ticker -> CTEObject
         Used throughout to convert between CIK -> ticker values
+        CIK -> CTEObject and exchange -> CTEObject indexes are built alongside the ticker map so that all lookups are constant time.
+        Some CIKs have several tickers (ie preferred shares), in which case the first ticker listed for that CIK in
+        company_tickers_exchange.json is treated as its primary ticker
 
         Important Note: Unlisted companies will not appear in this mapping they do not typically appear in company_tickers_exhcnage.json
         @param user_agent: Used in header of request to identify application making the request
+        @param cache_dir: str, directory of the ResponseCache to cache company_tickers_exchange.json in, used instead of the
+                          cache kwarg. The file is not cached on disk if both are None
+        @param cache_ttl: int, number of seconds the cached file is used before it is revalidated against the SEC REST API
         @param kwargs:
         """
-        super().__init__(user_agent, **kwargs)
+        super().__init__(user_agent, **self.__with_cache(cache_dir, cache_ttl, kwargs))
         self.__ticker_to_cte_object_mapping = None
+        self.__cik_to_cte_objects_mapping = None
+        self.__exchange_to_cte_objects_mapping = None
+        self.__build_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, user_agent, cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL, **kwargs):
+        """
+        Gets the process-wide TickerCompanyExchangeMap for a set of arguments, creating it if it doesn't exist yet.
+        Endpoint objects use these instances so that company_tickers_exchange.json is downloaded and parsed at most once per
+        process for each distinct configuration
+        @param user_agent: Used in header of request to identify application making the request
+        @param cache_dir: str, directory to cache company_tickers_exchange.json in. The file is not cached on disk if None
+        @param cache_ttl: int, number of seconds the cached file is used before it is revalidated against the SEC REST API
+        @param kwargs: see __init__, values must be hashable
+        @return: TickerCompanyExchangeMap
+        """
+        key = (user_agent, cache_dir, cache_ttl, tuple(sorted(kwargs.items())))
+        with cls.__shared_lock:
+            if key not in cls.__shared_instances:
+                cls.__shared_instances[key] = cls(user_agent, cache_dir=cache_dir, cache_ttl=cache_ttl, **kwargs)
+            return cls.__shared_instances[key]
+
+    @classmethod
+    def reset_shared(cls):
+        """
+        Discards the process-wide TickerCompanyExchangeMaps. Files cached on disk are left in place
+        @return: None
+        """
+        with cls.__shared_lock:
+            cls.__shared_instances = {}
+
+    @staticmethod
+    def __with_cache(cache_dir, cache_ttl, kwargs):
+        if cache_dir is None:
+            return kwargs
+        return dict(kwargs, cache=ResponseCache(cache_dir, ttls={EndpointEnum.COMPANY_TICKER_EXCHANGE: cache_ttl}))
 
     def lookup_ticker(self, ticker):
         """
@@ -31,25 +82,34 @@ class TickerCompanyExchangeMap(BaseNetworkClientMixin):
 
     def lookup_cik(self, cik):
         """
-        Search the __ticker_to_cte_object_mapping for a CIK, downloads company_tickers_exchange.json if it doesn't exist
+        Search the __cik_to_cte_objects_mapping for a CIK, downloads company_tickers_exchange.json if it doesn't exist
         @param cik: cik to look up in map
-        @return: CTEObject
+        @return: CTEObject of the primary ticker for the CIK, UNKNOWN if the CIK is not in the map
         """
         self.__build_ticker_to_cte_object_mapping_if_none()
-        find = [cte_object for cte_object in self.__ticker_to_cte_object_mapping.values() if cte_object.cik == cik]
-        if find:
-            return find[0]
+        cte_objects = self.__cik_to_cte_objects_mapping.get(cik)
+        if cte_objects:
+            return cte_objects[0]
         else:
             return self.UNKNOWN
 
+    def lookup_tickers_for_cik(self, cik):
+        """
+        Search the __cik_to_cte_objects_mapping for all tickers listed under a CIK
+        @param cik: cik to look up in map
+        @return: List[CTEObject] in the order they are listed in company_tickers_exchange.json, empty if the CIK is not in the map
+        """
+        self.__build_ticker_to_cte_object_mapping_if_none()
+        return list(self.__cik_to_cte_objects_mapping.get(cik, []))
+
     def filter_companies_by_exchange(self, exchange_enum):
         """
-        Filters __ticker_to_cte_object_mapping into a mapping of only CTEObjects that are a part of the specified exchange
+        Gets a mapping of only CTEObjects that are a part of the specified exchange
         @param exchange_enum: ExchangeEnum value defining what exchange to filter on
         @return: dictionary of ticker -> CTEObject where all CTEObject.exchange == exchange_enum.value
         """
         self.__build_ticker_to_cte_object_mapping_if_none()
-        return {_: v for _, v in self.__ticker_to_cte_object_mapping.items() if v.exchange == exchange_enum.value}
+        return dict(self.__exchange_to_cte_objects_mapping.get(exchange_enum.value, {}))
 
     def ticker_to_cik_mapping(self):
         """
@@ -85,17 +145,31 @@ class TickerCompanyExchangeMap(BaseNetworkClientMixin):
 
     def __build_ticker_to_cte_object_mapping_if_none(self):
         if not self.__ticker_to_cte_object_mapping:
-            self.__build_ticker_to_cte_object_mapping()
+            # Endpoints may resolve tickers from several worker threads at once, only one of them should download the mapping
+            with self.__build_lock:
+                if not self.__ticker_to_cte_object_mapping:
+                    self.__build_ticker_to_cte_object_mapping()
 
     def __build_ticker_to_cte_object_mapping(self):
-        response = self._validate_args_and_make_request(EndpointEnum.COMPANY_TICKER_EXCHANGE)
+        response = self.__get_company_tickers_exchange()
         response_data = response["data"]
         cte_objs = [CTEObject(obj) for obj in response_data]
-        cik_to_ticker_mapping = {cte_obj.ticker: cte_obj for cte_obj in cte_objs}
-        self.__ticker_to_cte_object_mapping = cik_to_ticker_mapping
-
-
-class CTEObject:
+        ticker_to_cte_object_mapping = {cte_obj.ticker: cte_obj for cte_obj in cte_objs}
+        cik_to_cte_objects_mapping = {}
+        exchange_to_cte_objects_mapping = {}
+        for ticker, cte_obj in ticker_to_cte_object_mapping.items():
+            cik_to_cte_objects_mapping.setdefault(cte_obj.cik, []).append(cte_obj)
+            exchange_to_cte_objects_mapping.setdefault(cte_obj.exchange, {})[ticker] = cte_obj
+        self.__cik_to_cte_objects_mapping = cik_to_cte_objects_mapping
+        self.__exchange_to_cte_objects_mapping = exchange_to_cte_objects_mapping
+        # Set last since it is what signals that the mappings have been built
+        self.__ticker_to_cte_object_mapping = ticker_to_cte_object_mapping
+
+    def __get_company_tickers_exchange(self):
+        return self._validate_args_and_make_request(EndpointEnum.COMPANY_TICKER_EXCHANGE)
+
+
+class CTEObject(SlotsDataObjectMixin):
     class CTESchemaEnum(Enum):
         """
         Each object in company_ticker_json is an array w/ 4 values, w/ each value representing one part of the schema
@@ -105,26 +179,23 @@ class CTEObject:
         TICKER = 2
         EXCHANGE = 3
 
+    __slots__ = ("cik", "ticker", "exchange", "name")
+
+    _CIK_INDEX = CTESchemaEnum.CIK.value
+    _NAME_INDEX = CTESchemaEnum.NAME.value
+    _TICKER_INDEX = CTESchemaEnum.TICKER.value
+    _EXCHANGE_INDEX = CTESchemaEnum.EXCHANGE.value
+
     def __init__(self, obj):
         """
         Data object class for storing data from the company_ticker_exchange.json endpoint
         CTE is short for Company Ticker Exchange.
         @param obj: dictionary to parse into CTEObject
         """
-        self.cik = self.__set_cik(obj)
-        self.ticker = obj[self.CTESchemaEnum.TICKER.value]
-        self.exchange = obj[self.CTESchemaEnum.EXCHANGE.value]
-        self.name = obj[self.CTESchemaEnum.NAME.value]
-
-    def __set_cik(self, obj):
-        cik_num = obj[self.CTESchemaEnum.CIK.value]
-        return CIKOpts.format_cik(cik_num)
-
-    def __eq__(self, other):
-        if isinstance(other, CTEObject):
-            return self.__dict__ == other.__dict__
-        else:
-            return False
+        self.cik = CIKOpts.format_cik(obj[self._CIK_INDEX])
+        self.ticker = obj[self._TICKER_INDEX]
+        self.exchange = obj[self._EXCHANGE_INDEX]
+        self.name = obj[self._NAME_INDEX]
 
 
 class ExchangeEnum(Enum):
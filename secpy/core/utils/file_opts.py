@@ -0,0 +1,27 @@
+import os
+import tempfile
+
+
+class FileOpts:
+    @staticmethod
+    def atomic_write(path, data):
+        """
+        Writes data to path such that readers will only ever see either the previous or the new contents of the file.
+        Data is written to a temporary file in the same directory which then replaces path in a single rename
+        @param path: str, full path of the file to write
+        @param data: bytes
+        @return: None
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,36 @@
+from secpy.core.lazy_namespace import LazyNamespace
+
+
+class NamespaceOpts:
+    @staticmethod
+    def list_keys(namespace):
+        """
+        Lists the attribute names of a LazyNamespace or SimpleNamespace w/out building any attributes
+        @param namespace: LazyNamespace or SimpleNamespace
+        @return: List[str]
+        """
+        if isinstance(namespace, LazyNamespace):
+            return namespace._list_names()
+        return list(vars(namespace).keys())
+
+    @staticmethod
+    def get(namespace, key):
+        """
+        Gets an attribute of a LazyNamespace or SimpleNamespace, building it if needed
+        @param namespace: LazyNamespace or SimpleNamespace
+        @param key: str, attribute name
+        @return: attribute value
+        @raise KeyError: if the namespace has no attribute named key
+        """
+        if isinstance(namespace, LazyNamespace):
+            return namespace._get(key)
+        return vars(namespace)[key]
+
+    @staticmethod
+    def items(namespace):
+        """
+        Lists the (attribute name, attribute value) pairs of a LazyNamespace or SimpleNamespace, building any attributes that haven't been built yet
+        @param namespace: LazyNamespace or SimpleNamespace
+        @return: List[tuple]
+        """
+        return [(key, NamespaceOpts.get(namespace, key)) for key in NamespaceOpts.list_keys(namespace)]
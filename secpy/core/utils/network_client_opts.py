@@ -0,0 +1,50 @@
+from secpy.core.json_decoder import JsonDecoder
+from secpy.core.rate_limiter import TokenBucketRateLimiter
+
+
+class NetworkClientOpts:
+    MAXIMUM_REQUESTS_PER_SEC_CAP = TokenBucketRateLimiter.SHARED_MAX_CALLS_PER_SEC
+
+    @staticmethod
+    def get_headers(user_agent):
+        """
+        Validates user_agent and builds the headers sent w/ every request to the SEC REST API
+        @param user_agent: str, identifies the application making the request
+        @return: dict
+        """
+        assert isinstance(user_agent, str), "user_agent arg {} is not of type string!".format(user_agent)
+        assert user_agent != "", "user_agent must be a non-empty string!"
+        return {
+            "User-Agent": user_agent
+        }
+
+    @classmethod
+    def validate_max_requests_per_sec(cls, max_requests_per_sec):
+        """
+        @param max_requests_per_sec: int, must not exceed the SEC's limit. See https://www.sec.gov/privacy.htm#security
+        @return: int
+        """
+        assert isinstance(max_requests_per_sec, int) and max_requests_per_sec > 0, "max_requests_per_sec arg {} must be a positive integer!".format(max_requests_per_sec)
+        assert max_requests_per_sec <= cls.MAXIMUM_REQUESTS_PER_SEC_CAP, "max_requests_per_sec {} must be less than or equal to {} or else application risks getting rate limited. " \
+                                                                         "See https://www.sec.gov/privacy.htm#security for more information re. rate limiting".format(max_requests_per_sec, cls.MAXIMUM_REQUESTS_PER_SEC_CAP)
+        return max_requests_per_sec
+
+    @staticmethod
+    def validate_max_retries(max_retries):
+        """
+        @param max_retries: int
+        @return: int
+        """
+        assert isinstance(max_retries, int) and max_retries > 0, "max_retries arg {} must be a positive integer!".format(max_retries)
+        return max_retries
+
+    @staticmethod
+    def get_json_decoder(json_decoder):
+        """
+        @param json_decoder: JsonDecoder or None
+        @return: JsonDecoder, the process-wide JsonDecoder if json_decoder is None
+        """
+        if json_decoder is None:
+            return JsonDecoder.shared()
+        assert isinstance(json_decoder, JsonDecoder), "json_decoder arg {} must be a JsonDecoder!".format(json_decoder)
+        return json_decoder
@@ -26,3 +26,21 @@ class PeriodFormatOpts:
             return "CY{}".format(period_format)
         else:
             raise Exception("Type of period_format must be either a string or datetime.date: {}".format(period_format))
+
+    @staticmethod
+    def get_period_range(start_year, end_year, quarterly=False, use_instantaneous=False):
+        """
+        Lists the frame periods between two calendar years, ie CY2010..CY2024 or CY2010Q1..CY2024Q4
+        @param start_year: int, first calendar year, inclusive
+        @param end_year: int, last calendar year, inclusive
+        @param quarterly: bool, list each quarter of a year instead of the year as a whole
+        @param use_instantaneous: bool, list instantaneous quarterly periods (ie CY2010Q1I), used for balance sheet concepts
+        @return: List[str]
+        """
+        assert isinstance(start_year, int) and isinstance(end_year, int) and start_year <= end_year, \
+            "start_year arg {} and end_year arg {} must be integers w/ start_year <= end_year!".format(start_year, end_year)
+        assert quarterly or not use_instantaneous, "Instantaneous periods are only available for quarterly periods!"
+        if not quarterly:
+            return ["CY{}".format(year) for year in range(start_year, end_year + 1)]
+        instantaneous_flag = "I" if use_instantaneous else ""
+        return ["CY{}Q{}{}".format(year, quarter, instantaneous_flag) for year in range(start_year, end_year + 1) for quarter in range(1, 5)]
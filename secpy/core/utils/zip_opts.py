@@ -0,0 +1,39 @@
+import re
+from zipfile import ZipFile
+
+
+class ZipOpts:
+    # matches the company files of the bulk archives as well as the additional filings pages in submissions.zip
+    __COMPANY_MEMBER_REGEX = re.compile(r"CIK(\d{10})(-submissions-\d+)?\.json$")
+
+    @classmethod
+    def get_member_signatures(cls, archive_path):
+        """
+        Reads the CRC and uncompressed size of each company file from the central directory of a bulk archive.
+        Only the directory at the end of the ZIP is read, none of the files are decompressed
+        @param archive_path: str, full path of the bulk archive
+        @return: dict of filename -> (crc, size)
+        """
+        with ZipFile(archive_path) as zip_file:
+            return {info.filename: (info.CRC, info.file_size) for info in zip_file.infolist()
+                    if cls.__COMPANY_MEMBER_REGEX.match(info.filename)}
+
+    @classmethod
+    def parse_cik_from_member_name(cls, filename):
+        """
+        Parses the CIK from the name of a company file in a bulk archive, ie CIK0000789019.json or CIK0000789019-submissions-001.json
+        @param filename: str
+        @return: str, 10 digit CIK. None if filename isn't a company file
+        """
+        match = cls.__COMPANY_MEMBER_REGEX.match(filename)
+        return match.group(1) if match else None
+
+    @classmethod
+    def is_submissions_page_member(cls, filename):
+        """
+        Checks whether a file in a bulk archive is an additional filings page of a company, ie CIK0000789019-submissions-001.json
+        @param filename: str
+        @return: bool
+        """
+        match = cls.__COMPANY_MEMBER_REGEX.match(filename)
+        return bool(match and match.group(2))
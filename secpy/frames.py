@@ -1,7 +1,11 @@
 from enum import Enum
 
+import numpy as np
+import requests
+
 from secpy.core.endpoint_enum import EndpointEnum
 from secpy.core.mixins.base_endpoint_mixin import BaseEndpointMixin
+from secpy.core.mixins.slots_data_object_mixin import SlotsDataObjectMixin
 from secpy.core.utils.period_format_opts import PeriodFormatOpts
 
 
@@ -12,6 +16,18 @@ class FramesEndpoint(BaseEndpointMixin):
     _endpoint = EndpointEnum.FRAMES
 
     def get_company_concept_for_ticker(self, taxonomy, concept, unit, period_format, use_instantaneous=False):
+        return self.get_frames(taxonomy, concept, unit, period_format, use_instantaneous)
+
+    def get_frames(self, taxonomy, concept, unit, period_format, use_instantaneous=False):
+        """
+        Request frames data from SEC REST API for a given taxonomy/concept/unit/period
+        @param taxonomy: str
+        @param concept: str
+        @param unit: str
+        @param period_format: str, int or datetime.date. See PeriodFormatOpts.format_period_format_arg
+        @param use_instantaneous: bool
+        @return: Frames
+        """
         period_format_arg = PeriodFormatOpts.format_period_format_arg(period_format, use_instantaneous)
         response = self._validate_args_and_make_request(self._endpoint,
                                                         TAXONOMY=taxonomy,
@@ -21,6 +37,51 @@ class FramesEndpoint(BaseEndpointMixin):
                                                         )
         return Frames(response)
 
+    def get_frames_panel(self,
+                         concepts,
+                         start_year,
+                         end_year,
+                         quarterly=False,
+                         use_instantaneous=False,
+                         taxonomy="us-gaap",
+                         unit="USD",
+                         max_workers=None):
+        """
+        Requests the frames of several concepts over a range of periods concurrently and assembles a CIK x period matrix
+        per concept. Requests go through the endpoint's network client, so they share the process-wide rate limiter and
+        the response cache (if one was given). Periods the SEC has no frame for (404) are left empty in the panel
+        @param concepts: iterable of concept names (ie Assets), or (taxonomy, concept, unit) tuples for concepts that
+                         aren't in taxonomy/unit
+        @param start_year: int, first calendar year, inclusive
+        @param end_year: int, last calendar year, inclusive
+        @param quarterly: bool, request each quarter instead of each calendar year
+        @param use_instantaneous: bool, request instantaneous quarterly periods, used for balance sheet concepts
+        @param taxonomy: str, taxonomy of concepts given by name
+        @param unit: str, unit of concepts given by name
+        @param max_workers: int, number of requests to have in flight at a time
+        @return: dict of (taxonomy, concept, unit) -> FramesPanel
+        """
+        periods = PeriodFormatOpts.get_period_range(start_year, end_year, quarterly, use_instantaneous)
+        keys = [concept if isinstance(concept, tuple) else (taxonomy, concept, unit) for concept in concepts]
+        combinations = [(key, period) for key in keys for period in periods]
+
+        def get_frames(combination):
+            (combination_taxonomy, combination_concept, combination_unit), period = combination
+            return self.get_frames(combination_taxonomy, combination_concept, combination_unit, period)
+
+        frames_by_key = {key: {} for key in keys}
+        for result in self._run_batch(get_frames, combinations, max_workers):
+            key, period = result.item
+            if result.ok:
+                frames_by_key[key][period] = result.result
+            elif not self.__is_missing_frame(result.exception):
+                raise result.exception
+        return {key: FramesPanel(key[0], key[1], key[2], periods, frames_by_key[key]) for key in keys}
+
+    @staticmethod
+    def __is_missing_frame(exception):
+        response = getattr(exception, "response", None)
+        return isinstance(exception, requests.exceptions.HTTPError) and response is not None and response.status_code == 404
 
 
 class Frames:
@@ -38,6 +99,9 @@ class Frames:
         """
         Aggregate of CompanyFrames that represents data for a particular taxonomy/concept/unit for all available companies
         at a specified period of time.
+        The companies are stored as parallel NumPy arrays (cik, val, end, accn, loc and entity_name) rather than a
+        CompanyFrame per company, so cross-sectional operations (rank, quantile, top_n, filter and joins on CIK w/ other
+        Frames) run at array speed. Indexing and iterating over Frames yields CompanyFrame instances
         @param data: dict
         """
         self.taxonomy = data[self.FramesSchemaEnum.TAXONOMY.value]
@@ -47,14 +111,220 @@ class Frames:
         self.label = data[self.FramesSchemaEnum.LABEL.value]
         self.description = data[self.FramesSchemaEnum.DESCRIPTION.value]
         self.pts = data[self.FramesSchemaEnum.PTS.value]
-        self.data = self.__set_company_frames(data)
+        self.__set_company_frames(data)
 
     def __set_company_frames(self, data):
         company_frames_arr = data[self.FramesSchemaEnum.DATA.value]
-        return [CompanyFrame(obj) for obj in company_frames_arr]
+        raw_values = [obj[CompanyFrame._VAL_KEY] for obj in company_frames_arr]
+        self._integer_values = all(isinstance(value, int) for value in raw_values)
+        self.cik = np.array([obj[CompanyFrame._CIK_KEY] for obj in company_frames_arr], dtype=np.int64)
+        self.val = np.array(raw_values, dtype=np.float64)
+        self.end = np.array([obj[CompanyFrame._END_KEY] for obj in company_frames_arr], dtype="datetime64[D]")
+        self.accn = self.__to_object_array([obj[CompanyFrame._ACCN_KEY] for obj in company_frames_arr])
+        self.loc = self.__to_object_array([obj[CompanyFrame._LOC_KEY] for obj in company_frames_arr])
+        self.entity_name = self.__to_object_array([obj[CompanyFrame._ENTITY_NAME_KEY] for obj in company_frames_arr])
+
+    @staticmethod
+    def __to_object_array(values):
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+
+    @classmethod
+    def _from_columns(cls, source, indices):
+        frames = cls.__new__(cls)
+        for attribute in ["taxonomy", "tag", "ccp", "uom", "label", "description", "_integer_values"]:
+            setattr(frames, attribute, getattr(source, attribute))
+        for column in ["cik", "val", "end", "accn", "loc", "entity_name"]:
+            setattr(frames, column, getattr(source, column)[indices])
+        frames.pts = len(frames.cik)
+        return frames
+
+    @classmethod
+    def _from_arrays(cls, taxonomy, tag, ccp, uom, label, description, cik, val, end, accn, loc, entity_name, integer_values):
+        frames = cls.__new__(cls)
+        frames.taxonomy = taxonomy
+        frames.tag = tag
+        frames.ccp = ccp
+        frames.uom = uom
+        frames.label = label
+        frames.description = description
+        frames.pts = len(cik)
+        frames._integer_values = integer_values
+        frames.cik = np.asarray(cik, dtype=np.int64)
+        frames.val = np.asarray(val, dtype=np.float64)
+        frames.end = np.asarray(end, dtype="datetime64[D]")
+        frames.accn = cls.__to_object_array(accn)
+        frames.loc = cls.__to_object_array(loc)
+        frames.entity_name = cls.__to_object_array(entity_name)
+        return frames
+
+    @property
+    def data(self):
+        """
+        @return: List[CompanyFrame], one per company
+        """
+        return list(self)
+
+    def __len__(self):
+        return len(self.cik)
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("Frames index {} out of range".format(key))
+            return self.__get_company_frame(int(key))
+        return self.take(key)
+
+    def __iter__(self):
+        return (self.__get_company_frame(i) for i in range(len(self)))
+
+    def __repr__(self):
+        return "Frames(taxonomy={!r}, tag={!r}, uom={!r}, ccp={!r}, rows={})".format(self.taxonomy, self.tag, self.uom, self.ccp, len(self))
+
+    def __get_company_frame(self, i):
+        value = self.val[i].item()
+        return CompanyFrame({
+            CompanyFrame._ACCN_KEY: self.accn[i],
+            CompanyFrame._CIK_KEY: int(self.cik[i]),
+            CompanyFrame._ENTITY_NAME_KEY: self.entity_name[i],
+            CompanyFrame._LOC_KEY: self.loc[i],
+            CompanyFrame._END_KEY: str(self.end[i]),
+            CompanyFrame._VAL_KEY: int(value) if self._integer_values else value
+        })
+
+    def take(self, indices):
+        """
+        Builds new Frames from a subset of companies
+        @param indices: slice, array of positions or boolean mask
+        @return: Frames
+        """
+        return self._from_columns(self, indices)
+
+    def mask(self, min_val=None, max_val=None, ciks=None, locs=None, end_after=None, end_before=None):
+        """
+        Builds a boolean mask of the companies that match all of the given conditions, bounds are inclusive
+        @param min_val: int or float
+        @param max_val: int or float
+        @param ciks: iterable of CIKs (str or int)
+        @param locs: iterable of str, location codes, ie US-WA
+        @param end_after: str, datetime.date or numpy.datetime64, only keep values w/ a period ending on or after end_after
+        @param end_before: str, datetime.date or numpy.datetime64, only keep values w/ a period ending on or before end_before
+        @return: numpy array of bool
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if min_val is not None:
+            mask &= self.val >= min_val
+        if max_val is not None:
+            mask &= self.val <= max_val
+        if ciks is not None:
+            mask &= np.isin(self.cik, [int(cik) for cik in ciks])
+        if locs is not None:
+            mask &= np.isin(self.loc, list(locs))
+        if end_after is not None:
+            mask &= self.end >= np.datetime64(end_after, "D")
+        if end_before is not None:
+            mask &= self.end <= np.datetime64(end_before, "D")
+        return mask
+
+    def filter(self, **kwargs):
+        """
+        Filters companies. See mask for the supported conditions
+        @return: Frames
+        """
+        return self.take(self.mask(**kwargs))
+
+    def rank(self, ascending=False, pct=False):
+        """
+        Ranks companies by value, tied values share the average of their ranks
+        @param ascending: bool, rank the smallest value 1 instead of the largest
+        @param pct: bool, return ranks as a fraction of the number of companies
+        @return: numpy array of float64, in the order of the companies
+        """
+        _, inverse, counts = np.unique(self.val if ascending else -self.val, return_inverse=True, return_counts=True)
+        last_ranks = np.cumsum(counts)
+        average_ranks = last_ranks - (counts - 1) / 2
+        ranks = average_ranks[inverse.reshape(-1)]
+        return ranks / len(self) if pct else ranks
+
+    def quantile(self, q):
+        """
+        @param q: float or array-like of float between 0 and 1
+        @return: float or numpy array of float64, value(s) at the given quantile(s)
+        """
+        return np.quantile(self.val, q)
+
+    def quantile_bucket(self, buckets):
+        """
+        Assigns each company to one of a number of equally sized value buckets, ie quintiles for buckets=5
+        @param buckets: int
+        @return: numpy array of int, 0 for the lowest values up to buckets - 1 for the highest, in the order of the companies
+        """
+        assert isinstance(buckets, int) and buckets > 0, "buckets arg {} must be a positive integer!".format(buckets)
+        ranks = self.rank(ascending=True)
+        return np.minimum(((ranks - 1) * buckets // len(self)).astype(np.int64), buckets - 1) if len(self) else np.empty(0, dtype=np.int64)
+
+    def top_n(self, n, ascending=False):
+        """
+        Gets the companies w/ the n largest values, largest first
+        @param n: int
+        @param ascending: bool, get the n smallest values instead, smallest first
+        @return: Frames
+        """
+        assert isinstance(n, int) and n >= 0, "n arg {} must be a non-negative integer!".format(n)
+        n = min(n, len(self))
+        keys = self.val if ascending else -self.val
+        candidates = np.argpartition(keys, n - 1)[:n] if 0 < n < len(self) else np.arange(len(self))[:n]
+        return self.take(candidates[np.argsort(keys[candidates], kind="stable")])
+
+    def sort_by_value(self, ascending=False):
+        """
+        @param ascending: bool
+        @return: Frames, companies ordered by value
+        """
+        order = np.argsort(self.val, kind="stable")
+        return self.take(order if ascending else order[::-1])
+
+    def get_positions(self, ciks):
+        """
+        Looks up the position of each CIK
+        @param ciks: array-like of int
+        @return: numpy array of int, -1 for CIKs w/o a value
+        """
+        ciks = np.asarray(ciks, dtype=np.int64)
+        order = np.argsort(self.cik, kind="stable")
+        sorted_ciks = self.cik[order]
+        slots = np.minimum(np.searchsorted(sorted_ciks, ciks), max(len(sorted_ciks) - 1, 0))
+        found = (sorted_ciks[slots] == ciks) if len(sorted_ciks) else np.zeros(len(ciks), dtype=bool)
+        return np.where(found, order[slots] if len(order) else -1, -1)
+
+    def join(self, other):
+        """
+        Inner join w/ another Frames on CIK, ie the same concept for another period or another concept for the same period
+        @param other: Frames
+        @return: tuple of Frames (self, other), both restricted to the CIKs they have in common and in the same CIK order
+        """
+        return tuple(self.align([self, other]))
+
+    @staticmethod
+    def align(frames_list):
+        """
+        Restricts several Frames to the CIKs they all have a value for, in the same CIK order, so that their arrays can be
+        combined element-wise, ie for screening a universe on several concepts at once
+        @param frames_list: List[Frames]
+        @return: List[Frames]
+        """
+        assert frames_list, "frames_list arg {} must contain at least one Frames!".format(frames_list)
+        common_ciks = frames_list[0].cik
+        for frames in frames_list[1:]:
+            common_ciks = np.intersect1d(common_ciks, frames.cik)
+        common_ciks = np.unique(common_ciks)
+        return [frames.take(frames.get_positions(common_ciks)) for frames in frames_list]
 
 
-class CompanyFrame:
+class CompanyFrame(SlotsDataObjectMixin):
     class CompanyFrameSchemaEnum(Enum):
         ACCN = "accn"
         CIK = "cik"
@@ -63,14 +333,78 @@ class CompanyFrame:
         END = "end"
         VAL = "val"
 
+    __slots__ = ("accn", "cik", "entity_name", "loc", "end", "val")
+
+    _ACCN_KEY = CompanyFrameSchemaEnum.ACCN.value
+    _CIK_KEY = CompanyFrameSchemaEnum.CIK.value
+    _ENTITY_NAME_KEY = CompanyFrameSchemaEnum.ENTITY_NAME.value
+    _LOC_KEY = CompanyFrameSchemaEnum.LOC.value
+    _END_KEY = CompanyFrameSchemaEnum.END.value
+    _VAL_KEY = CompanyFrameSchemaEnum.VAL.value
+
     def __init__(self, data):
         """
         Represents data for a particular taxonomy/concept/unit for a single company
         @param data: dict
         """
-        self.accn = data[self.CompanyFrameSchemaEnum.ACCN.value]
-        self.cik = data[self.CompanyFrameSchemaEnum.CIK.value]
-        self.entity_name = data[self.CompanyFrameSchemaEnum.ENTITY_NAME.value]
-        self.loc = data[self.CompanyFrameSchemaEnum.LOC.value]
-        self.end = data[self.CompanyFrameSchemaEnum.END.value]
-        self.val = data[self.CompanyFrameSchemaEnum.VAL.value]
+        self.accn = data[self._ACCN_KEY]
+        self.cik = data[self._CIK_KEY]
+        self.entity_name = data[self._ENTITY_NAME_KEY]
+        self.loc = data[self._LOC_KEY]
+        self.end = data[self._END_KEY]
+        self.val = data[self._VAL_KEY]
+
+
+class FramesPanel:
+    def __init__(self, taxonomy, concept, unit, periods, frames_by_period):
+        """
+        Values of a concept for every company across a range of periods, as a CIK x period matrix
+        @param taxonomy: str
+        @param concept: str
+        @param unit: str
+        @param periods: List[str], periods in the order of the columns of the matrix, ie CY2010Q1I..CY2024Q4I
+        @param frames_by_period: dict of period -> Frames, periods w/o Frames are left empty
+        """
+        self.taxonomy = taxonomy
+        self.concept = concept
+        self.unit = unit
+        self.periods = list(periods)
+        self.frames = frames_by_period
+        self.missing_periods = [period for period in self.periods if period not in frames_by_period]
+        self.ciks = np.unique(np.concatenate([frames.cik for frames in frames_by_period.values()])) if frames_by_period \
+            else np.empty(0, dtype=np.int64)
+        self.values = self.__build_matrix()
+
+    def __build_matrix(self):
+        values = np.full((len(self.ciks), len(self.periods)), np.nan)
+        for column, period in enumerate(self.periods):
+            frames = self.frames.get(period)
+            if frames is not None:
+                values[np.searchsorted(self.ciks, frames.cik), column] = frames.val
+        return values
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def get_period(self, period):
+        """
+        @param period: str, ie CY2021Q4I
+        @return: numpy array of float64, value of each company in ciks for the period, NaN where a company has no value
+        """
+        return self.values[:, self.periods.index(period)]
+
+    def get_cik(self, cik):
+        """
+        @param cik: str or int
+        @return: numpy array of float64, value of the company for each period in periods, NaN where it has no value
+        """
+        cik = int(cik)
+        row = np.searchsorted(self.ciks, cik)
+        if row == len(self.ciks) or self.ciks[row] != cik:
+            raise KeyError("CIK {} has no values in the panel".format(cik))
+        return self.values[row]
+
+    def __repr__(self):
+        return "FramesPanel(taxonomy={!r}, concept={!r}, unit={!r}, ciks={}, periods={})".format(
+            self.taxonomy, self.concept, self.unit, len(self.ciks), len(self.periods))
@@ -0,0 +1,177 @@
+import numpy as np
+
+from secpy.bulk_data_store import BulkDataStore
+from secpy.company_facts import CompanyFactsBulkEndpoint
+from secpy.frames import Frames, FramesPanel
+from secpy.core.utils.period_format_opts import PeriodFormatOpts
+
+
+class LocalFramesEngine:
+    def __init__(self, source, taxonomy="us-gaap"):
+        """
+        Computes Frames from a local copy of the company facts instead of requesting them from the frames endpoint.
+        Every fact in companyfacts.zip carries the frame (ie CY2021Q4I) it was aggregated into by the SEC, so the Frames
+        of a taxonomy/concept/unit/period are the facts of that concept whose frame is that period, one per company.
+        Any number of concepts and periods are computed in a single pass over the source w/o any requests to the SEC
+        @param source: CompanyFactsBulkEndpoint (read w/ iter_concept_facts) or BulkDataStore (read w/ query_facts)
+        @param taxonomy: str, taxonomy of concepts that aren't taxonomy qualified
+        """
+        assert isinstance(source, (CompanyFactsBulkEndpoint, BulkDataStore)), \
+            "source arg {} must be a CompanyFactsBulkEndpoint or BulkDataStore!".format(source)
+        self.source = source
+        self.taxonomy = taxonomy
+
+    def compute_frames(self, concepts, periods=None, units=None, ciks=None):
+        """
+        Computes the Frames of several concepts for several periods at once
+        @param concepts: iterable of concept names (ie Assets) or taxonomy qualified concept names (ie us-gaap:Assets)
+        @param periods: iterable of periods (ie CY2021, CY2021Q4 or CY2021Q4I), every period the facts were framed in if None
+        @param units: iterable of units (ie USD), every unit if None
+        @param ciks: iterable of CIKs to restrict the Frames to
+        @return: dict of (taxonomy, concept, unit, period) -> Frames, combinations w/o any facts are left out
+        """
+        concepts = [self.__qualify_concept(concept) for concept in concepts]
+        periods = set(periods) if periods is not None else None
+        units = set(units) if units is not None else None
+        if isinstance(self.source, BulkDataStore):
+            builders = self.__collect_from_store(concepts, periods, units, ciks)
+        else:
+            builders = self.__collect_from_archive(concepts, periods, units, ciks)
+        return {key: builder.build(*key) for key, builder in builders.items()}
+
+    def get_frames(self, taxonomy, concept, unit, period_format, use_instantaneous=False):
+        """
+        Computes the Frames for a single taxonomy/concept/unit/period, see FramesEndpoint.get_frames.
+        Each call reads the source, so use compute_frames or get_frames_panel for more than one concept/period
+        @param taxonomy: str
+        @param concept: str
+        @param unit: str
+        @param period_format: str, int or datetime.date. See PeriodFormatOpts.format_period_format_arg
+        @param use_instantaneous: bool
+        @return: Frames, empty if no company reported the concept for the period
+        """
+        period = PeriodFormatOpts.format_period_format_arg(period_format, use_instantaneous)
+        frames = self.compute_frames(["{}:{}".format(taxonomy, concept)], [period], [unit])
+        return frames.get((taxonomy, concept, unit, period), _FramesBuilder().build(taxonomy, concept, unit, period))
+
+    def get_frames_panel(self,
+                         concepts,
+                         start_year,
+                         end_year,
+                         quarterly=False,
+                         use_instantaneous=False,
+                         unit="USD",
+                         ciks=None):
+        """
+        Assembles a CIK x period matrix per concept, see FramesEndpoint.get_frames_panel
+        @param concepts: iterable of concept names (ie Assets), or (taxonomy, concept, unit) tuples for concepts that
+                         aren't in the engine's taxonomy or unit
+        @param start_year: int, first calendar year, inclusive
+        @param end_year: int, last calendar year, inclusive
+        @param quarterly: bool, compute each quarter instead of each calendar year
+        @param use_instantaneous: bool, compute instantaneous quarterly periods, used for balance sheet concepts
+        @param unit: str, unit of concepts given by name
+        @param ciks: iterable of CIKs to restrict the panel to
+        @return: dict of (taxonomy, concept, unit) -> FramesPanel
+        """
+        periods = PeriodFormatOpts.get_period_range(start_year, end_year, quarterly, use_instantaneous)
+        keys = [concept if isinstance(concept, tuple) else (self.taxonomy, concept, unit) for concept in concepts]
+        frames = self.compute_frames(["{}:{}".format(key[0], key[1]) for key in keys], periods, {key[2] for key in keys}, ciks)
+        return {key: FramesPanel(key[0], key[1], key[2], periods,
+                                    {period: frames[key + (period,)] for period in periods if key + (period,) in frames})
+                for key in keys}
+
+    def __qualify_concept(self, concept):
+        return concept if ":" in concept else "{}:{}".format(self.taxonomy, concept)
+
+    def __collect_from_archive(self, concepts, periods, units, ciks):
+        builders = {}
+        for unit_facts in self.source.iter_concept_facts(concepts, ciks=ciks):
+            if units is not None and unit_facts.unit not in units:
+                continue
+            cik = int(unit_facts.cik)
+            for fact in unit_facts.facts:
+                if fact.frame is None or (periods is not None and fact.frame not in periods):
+                    continue
+                key = (unit_facts.taxonomy, unit_facts.concept_name, unit_facts.unit, fact.frame)
+                builder = builders.get(key)
+                if builder is None:
+                    builder = builders[key] = _FramesBuilder(unit_facts.label, unit_facts.description)
+                builder.add(cik, unit_facts.entity_name, fact.value, fact.end, fact.accn, fact.filed)
+        return builders
+
+    def __collect_from_store(self, concepts, periods, units, ciks):
+        builders = {}
+        for concept in concepts:
+            taxonomy, concept_name = concept.split(":", 1)
+            facts = self.source.query_facts(taxonomy, concept_name, unit=units, ciks=ciks, frame=periods)
+            if periods is None:
+                framed_mask = np.array([frame is not None for frame in facts["frame"]], dtype=bool)
+                facts = {column: values[framed_mask] for column, values in facts.items()}
+            if not len(facts["frame"]):
+                continue
+            labels = self.source.get_concept_labels(taxonomy, concept_name)
+            # facts are grouped by (unit, frame) w/ a single stable sort, which keeps them in CIK order w/in each group
+            unique_units, unit_codes = np.unique(facts["unit"], return_inverse=True)
+            unique_frames, frame_codes = np.unique(facts["frame"], return_inverse=True)
+            groups = unit_codes * len(unique_frames) + frame_codes
+            order = np.argsort(groups, kind="stable")
+            for selected in np.split(order, np.flatnonzero(np.diff(groups[order])) + 1):
+                first = selected[0]
+                label, description = labels.get(facts["cik"][first], (None, None))
+                builders[(taxonomy, concept_name, facts["unit"][first], facts["frame"][first])] = _FramesBuilder.from_columns(
+                    label, description, facts["cik"][selected].astype(np.int64), facts["entity_name"][selected],
+                    facts["value"][selected], facts["end"][selected], facts["accn"][selected], facts["filed"][selected])
+        return builders
+
+
+class _FramesBuilder:
+    def __init__(self, label=None, description=None):
+        """
+        Accumulates the facts of a single taxonomy/concept/unit/period across companies
+        @param label: str
+        @param description: str
+        """
+        self.label = label
+        self.description = description
+        self.cik = []
+        self.entity_name = []
+        self.val = []
+        self.end = []
+        self.accn = []
+        self.filed = []
+        self.integer_values = True
+
+    @classmethod
+    def from_columns(cls, label, description, cik, entity_name, val, end, accn, filed):
+        builder = cls(label, description)
+        builder.cik, builder.entity_name, builder.val, builder.end, builder.accn, builder.filed = cik, entity_name, val, end, accn, filed
+        # the store returns values as floats, whole numbers are reported as ints like the frames endpoint does
+        builder.integer_values = bool(np.all(np.mod(val, 1) == 0))
+        return builder
+
+    def add(self, cik, entity_name, val, end, accn, filed):
+        self.cik.append(cik)
+        self.entity_name.append(entity_name)
+        self.val.append(val)
+        self.end.append(end)
+        self.accn.append(accn)
+        self.filed.append(filed)
+        self.integer_values = self.integer_values and isinstance(val, int)
+
+    def build(self, taxonomy, concept, unit, period):
+        cik = np.asarray(self.cik, dtype=np.int64)
+        filed = np.asarray(self.filed, dtype="datetime64[D]")
+        # a company should only have one fact per frame, if it has more the most recently filed one wins
+        order = np.lexsort((filed, cik))
+        latest = order[np.append(cik[order][1:] != cik[order][:-1], True)] if len(order) else order
+        columns = [np.asarray(column, dtype=object)[latest] for column in (self.entity_name, self.accn)]
+        return Frames._from_arrays(taxonomy, concept, period, unit, self.label, self.description,
+                                   cik[latest],
+                                   np.asarray(self.val, dtype=np.float64)[latest],
+                                   np.asarray(self.end, dtype="datetime64[D]")[latest],
+                                   columns[1],
+                                   # facts don't report the location of the company
+                                   [None] * len(latest),
+                                   columns[0],
+                                   self.integer_values)
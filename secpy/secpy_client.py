@@ -6,26 +6,59 @@ from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
 
 
 class SECPyClient:
-    def __init__(self, user_agent):
+    def __init__(self, user_agent, cache=None, json_decoder=None, ticker_cache_dir=None):
+        """
+        Entrypoint for creating endpoint objects
+        @param user_agent: unique identifiers to use in headers when making requests to SEC REST API
+        @param cache: ResponseCache, optional cache passed to every endpoint object created by the client
+        @param json_decoder: JsonDecoder, optional decoder passed to every endpoint object created by the client
+        @param ticker_cache_dir: str, optional directory to cache company_tickers_exchange.json in for every endpoint object
+                                 created by the client
+        """
         self.user_agent = user_agent
+        self.cache = cache
+        self.json_decoder = json_decoder
+        self.ticker_cache_dir = ticker_cache_dir
+
+    def __with_cache(self, kwargs):
+        if self.cache is not None:
+            kwargs.setdefault("cache", self.cache)
+        return self.__with_endpoint_kwargs(kwargs)
+
+    def __with_endpoint_kwargs(self, kwargs):
+        # the json_decoder and ticker_cache_dir of the client apply to every endpoint object, bulk ones included
+        if self.json_decoder is not None:
+            kwargs.setdefault("json_decoder", self.json_decoder)
+        if self.ticker_cache_dir is not None:
+            kwargs.setdefault("ticker_cache_dir", self.ticker_cache_dir)
+        return kwargs
 
     def submissions(self, **kwargs):
-        return SubmissionsEndpoint(self.user_agent, **kwargs)
+        return SubmissionsEndpoint(self.user_agent, **self.__with_cache(kwargs))
 
     def bulk_submissions(self, existing_archive=None,  **kwargs):
-        return SubmissionsBulkEndpoint(self.user_agent, existing_archive, **kwargs)
+        return SubmissionsBulkEndpoint(self.user_agent, existing_archive, **self.__with_endpoint_kwargs(kwargs))
 
     def company_facts(self, **kwargs):
-        return CompanyFactsEndpoint(self.user_agent, **kwargs)
+        return CompanyFactsEndpoint(self.user_agent, **self.__with_cache(kwargs))
 
     def bulk_company_facts(self, existing_archive=None, **kwargs):
-        return CompanyFactsBulkEndpoint(self.user_agent, existing_archive, **kwargs)
+        return CompanyFactsBulkEndpoint(self.user_agent, existing_archive, **self.__with_endpoint_kwargs(kwargs))
 
     def company_concepts(self, **kwargs):
-        return CompanyConceptEndpoint(self.user_agent, **kwargs)
+        return CompanyConceptEndpoint(self.user_agent, **self.__with_cache(kwargs))
 
     def frames(self, **kwargs):
-        return FramesEndpoint(self.user_agent, **kwargs)
+        return FramesEndpoint(self.user_agent, **self.__with_cache(kwargs))
 
     def ticker_company_exchange_map(self, **kwargs):
-        return TickerCompanyExchangeMap(self.user_agent, **kwargs)
+        """
+        Gets the TickerCompanyExchangeMap shared w/ the (non-bulk) endpoint objects created by the client w/ the same kwargs
+        @param kwargs: see BaseEndpointMixin, ie ticker_cache_dir
+        @return: TickerCompanyExchangeMap
+        """
+        kwargs = self.__with_cache(kwargs)
+        return TickerCompanyExchangeMap.shared(self.user_agent,
+                                               cache_dir=kwargs.pop("ticker_cache_dir", None),
+                                               cache_ttl=kwargs.pop("ticker_cache_ttl", TickerCompanyExchangeMap.DEFAULT_CACHE_TTL),
+                                               **kwargs)
@@ -1,8 +1,12 @@
 from enum import Enum
 
+import numpy as np
+
+from secpy.core.batch_executor import BatchExecutor
 from secpy.core.bulk_data import BulkDataEndpoint
 from secpy.core.endpoint_enum import EndpointEnum
 from secpy.core.mixins.base_endpoint_mixin import BaseEndpointMixin
+from secpy.core.mixins.slots_data_object_mixin import SlotsDataObjectMixin
 from secpy.core.network_client import NetworkClient
 from secpy.core.utils.cik_opts import CIKOpts
 
@@ -31,6 +35,24 @@ class SubmissionsEndpoint(BaseEndpointMixin):
         response = self._validate_args_and_make_request(self._endpoint, CIK=cik)
         return Submissions(response)
 
+    def get_submissions_for_tickers(self, tickers, max_workers=None):
+        """
+        Request submissions data from SEC REST API for several tickers concurrently
+        @param tickers: iterable of str
+        @param max_workers: int, number of worker threads to use
+        @return: generator of BatchResult keyed by ticker, yielded in the order that requests finish
+        """
+        return self._run_batch(self.get_submissions_for_ticker, tickers, max_workers)
+
+    def get_submissions_for_ciks(self, ciks, max_workers=None):
+        """
+        Request submissions data from SEC REST API for several CIKs concurrently
+        @param ciks: iterable of str
+        @param max_workers: int, number of worker threads to use
+        @return: generator of BatchResult keyed by CIK, yielded in the order that requests finish
+        """
+        return self._run_batch(self.get_submission_for_cik, ciks, max_workers)
+
 
 class SubmissionsBulkEndpoint(BulkDataEndpoint):
     """
@@ -38,8 +60,17 @@ class SubmissionsBulkEndpoint(BulkDataEndpoint):
     """
     _endpoint = EndpointEnum.BULK_SUBMISSIONS
 
-    def _parse_data(self, data):
-        return Submissions(data)
+    def _get_parser(self):
+        return Submissions
+
+    def _ingest_archive(self, store, archive_path, ciks=None):
+        return store.ingest_submissions(archive_path, ciks)
+
+    def _get_store_members(self, store):
+        return store.get_archive_members(store.SUBMISSIONS_ARCHIVE)
+
+    def _delete_from_store(self, store, cik):
+        store.delete_submissions(cik)
 
 
 class Submissions:
@@ -105,7 +136,7 @@ class Submissions:
         return Filings(filings, self.cik)
 
 
-class Address:
+class Address(SlotsDataObjectMixin):
     class AddressesSchemaEnum(Enum):
         STREET_1 = "street1"
         STREET_2 = "street2"
@@ -114,17 +145,26 @@ class Address:
         STATE_OR_COUNTRY_DESCRIPTION = "stateOrCountryDescription"
         ZIP_CODE = "zipCode"
 
+    __slots__ = ("street_1", "street_2", "city", "state_or_country", "state_or_country_description", "zip_code")
+
+    _STREET_1_KEY = AddressesSchemaEnum.STREET_1.value
+    _STREET_2_KEY = AddressesSchemaEnum.STREET_2.value
+    _CITY_KEY = AddressesSchemaEnum.CITY.value
+    _STATE_OR_COUNTRY_KEY = AddressesSchemaEnum.STATE_OR_COUNTRY.value
+    _STATE_OR_COUNTRY_DESCRIPTION_KEY = AddressesSchemaEnum.STATE_OR_COUNTRY_DESCRIPTION.value
+    _ZIP_CODE_KEY = AddressesSchemaEnum.ZIP_CODE.value
+
     def __init__(self, data):
         """
         Represents primary address(es) of a given company based on their filings
         @param data: dict
         """
-        self.street_1 = data[self.AddressesSchemaEnum.STREET_1.value]
-        self.street_2 = data[self.AddressesSchemaEnum.STREET_2.value]
-        self.city = data[self.AddressesSchemaEnum.CITY.value]
-        self.state_or_country = data[self.AddressesSchemaEnum.STATE_OR_COUNTRY.value]
-        self.state_or_country_description = data[self.AddressesSchemaEnum.STATE_OR_COUNTRY_DESCRIPTION.value]
-        self.zip_code = data[self.AddressesSchemaEnum.ZIP_CODE.value]
+        self.street_1 = data[self._STREET_1_KEY]
+        self.street_2 = data[self._STREET_2_KEY]
+        self.city = data[self._CITY_KEY]
+        self.state_or_country = data[self._STATE_OR_COUNTRY_KEY]
+        self.state_or_country_description = data[self._STATE_OR_COUNTRY_DESCRIPTION_KEY]
+        self.zip_code = data[self._ZIP_CODE_KEY]
 
 
 class HasFilingsMixin:
@@ -134,14 +174,12 @@ class HasFilingsMixin:
     def _parse_filings(self, data):
         """
         The 'recent' field returned submissions api endpoint is an object consisting of numerous arrays
-        each containing a single element of an overall filing object. The fields of a filing can be stitched together by
-        grabbing the i'th index of each field, putting it in a dict keyed by the fieldnames and then passing that dict to a Filing object
+        each containing a single element of an overall filing object. The arrays are kept as they are in a FilingTable,
+        which only stitches the fields of a filing together when that filing is accessed
         @param data: dict
-        @return: List[Filing]
+        @return: FilingTable
         """
-        first_key = list(data.keys())[0]
-        num_filings = len(data[first_key])
-        return [Filing({k: v[i] for k, v in data.items()}, self.cik) for i in range(num_filings)]
+        return FilingTable(data, self.cik)
 
 
 class Filings(HasFilingsMixin):
@@ -159,6 +197,7 @@ class Filings(HasFilingsMixin):
         self.cik = cik
         self.recent_files = self.__set_recent_filings(data)
         self.historical_files = self.__set_historical_filings(data)
+        self.__all_files = None
 
     def __set_recent_filings(self, data):
         recent_filings = data[Filings.FilingsSchemaEnum.RECENT.value]
@@ -170,11 +209,60 @@ class Filings(HasFilingsMixin):
 
     def filter_by_form(self, form_type):
         """
-        Filter available recent filings by a particular form type
+        Filter available filings by a particular form type. Only recent filings are searched until load_all is called
         @param form_type: str
-        @return: List[Filing]
+        @return: FilingTable
+        """
+        return self.__get_loaded_files().filter_by_form(form_type)
+
+    def load_all(self, user_agent, cache=None, max_workers=None):
+        """
+        Downloads every page of historical filings concurrently and merges them w/ the recent filings into a single table
+        of all filings made by the company, newest first. Filings that appear on more than one page are only kept once.
+        Pages are requested through one NetworkClient, so they share the process-wide session and rate limiter, and are
+        looked up in cache first if one is given. The merged table is kept, so later calls don't make any requests
+        @param user_agent: str, used in header of request to identify application making the request
+        @param cache: ResponseCache, optional cache to look up the historical filings in before making the requests
+        @param max_workers: int, number of pages to request at a time
+        @return: FilingTable
+        """
+        if self.__all_files is None:
+            pages = self.__get_historical_pages(NetworkClient(user_agent, cache=cache), max_workers)
+            self.__all_files = FilingTable.merge([self.recent_files] + pages)
+        return self.__all_files
+
+    def __get_historical_pages(self, network_client, max_workers):
+        if not self.historical_files:
+            return []
+
+        def get_page(historical_file):
+            return historical_file.get_historical_filings(None, network_client=network_client)
+
+        results = list(BatchExecutor(max_workers).run(get_page, self.historical_files))
+        failures = [result.exception for result in results if not result.ok]
+        if failures:
+            raise failures[0]
+        pages = {result.item.filename: result.result for result in results}
+        return [pages[historical_file.filename] for historical_file in self.historical_files]
+
+    def get_by_accession_number(self, accession_number):
+        """
+        Looks up a filing by its accession number. Only recent filings are searched until load_all is called
+        @param accession_number: str
+        @return: FilingRow, None if there is no loaded filing w/ the accession number
         """
-        return [form for form in self.recent_files if form.form == form_type]
+        return self.__get_loaded_files().get_by_accession_number(accession_number)
+
+    def query(self, **kwargs):
+        """
+        Looks up filings that match all of the given conditions. See FilingTable.query.
+        Only recent filings are searched until load_all is called
+        @return: FilingTable
+        """
+        return self.__get_loaded_files().query(**kwargs)
+
+    def __get_loaded_files(self):
+        return self.__all_files if self.__all_files is not None else self.recent_files
 
 
 class HistoricalFiling(HasFilingsMixin):
@@ -207,18 +295,55 @@ class HistoricalFiling(HasFilingsMixin):
     def __set_file_path(self):
         return EndpointEnum.SUBMISSIONS.value.format(FILE_NAME=self.filename)
 
-    def get_historical_filings(self, user_agent):
+    def get_historical_filings(self, user_agent, cache=None, network_client=None):
         """
         Makes request to download historical filings data from self.file_link
         @param user_agent: str, used in header of request to identify application making the request
-        @return: List[Submission]
+        @param cache: ResponseCache, optional cache to look up the historical filings in before making the request
+        @param network_client: NetworkClient, client to make the request w/, created from user_agent and cache if None
+        @return: FilingTable
         """
-        nwc = NetworkClient(user_agent)
+        nwc = network_client or NetworkClient(user_agent, cache=cache)
         response = nwc.make_request_json(EndpointEnum.SUBMISSIONS, FILE_NAME=self.filename)
         return self._parse_filings(response)
 
 
-class Filing:
+class HasPrimaryDocumentMixin:
+    """
+    Links to/downloads the primary document of a filing. Expects cik, accession_number and primary_document_name attributes
+    """
+    __slots__ = ()
+
+    @property
+    def _endpoint_format_kwargs(self):
+        # drop the leading zeroes from cik since they are not used in the endpoint
+        cik_num = int(self.cik)
+        formatted_accession_num = self.accession_number.replace("-", "")
+        return {
+            "CIK_NUM": cik_num,
+            "ACCESSION_NUM": formatted_accession_num,
+            "FILE_NAME": self.primary_document_name
+        }
+
+    @property
+    def primary_document_link(self):
+        return EndpointEnum.EDGAR_DATA_ARCHIVES.value.format(**self._endpoint_format_kwargs)
+
+    def download_primary_document(self, user_agent, output_path, chunk_size=1028):
+        """
+        Downloads the primary document for the SEC archive
+        @param user_agent: str, unique identifier needed to make request
+        @param output_path: str, path to save downloaded document to
+        @param chunk_size: int, number of bytes to process from request at a time
+        @return: None
+        """
+        # TODO is there a better way of going about this that doesn't involve user supplying a user_agent?
+        # Seems sort of clumsy. On paper, one request for a single document shouldn't get rate limited
+        nwc = NetworkClient(user_agent)
+        nwc.download_file(EndpointEnum.EDGAR_DATA_ARCHIVES, output_path, chunk_size,  **self._endpoint_format_kwargs)
+
+
+class Filing(HasPrimaryDocumentMixin, SlotsDataObjectMixin):
     class FilingSchemaEnum(Enum):
         ACCESSION_NUMBER = "accessionNumber"
         FILING_DATE = "filingDate"
@@ -235,6 +360,24 @@ class Filing:
         PRIMARY_DOCUMENT = "primaryDocument"
         PRIMARY_DOCUMENT_DESCRIPTION = "primaryDocumentDescription"
 
+    __slots__ = ("cik", "accession_number", "filing_date", "report_date", "acceptance_date_time", "act", "form", "file_number",
+                 "film_number", "items", "size", "is_xbrl", "is_inline_xbrl", "primary_document_name", "primary_document_description")
+
+    _ACCESSION_NUMBER_KEY = FilingSchemaEnum.ACCESSION_NUMBER.value
+    _FILING_DATE_KEY = FilingSchemaEnum.FILING_DATE.value
+    _REPORT_DATE_KEY = FilingSchemaEnum.REPORT_DATE.value
+    _ACCEPTANCE_DATE_TIME_KEY = FilingSchemaEnum.ACCEPTANCE_DATE_TIME.value
+    _ACT_KEY = FilingSchemaEnum.ACT.value
+    _FORM_KEY = FilingSchemaEnum.FORM.value
+    _FILE_NUMBER_KEY = FilingSchemaEnum.FILE_NUMBER.value
+    _FILM_NUMBER_KEY = FilingSchemaEnum.FILM_NUMBER.value
+    _ITEMS_KEY = FilingSchemaEnum.ITEMS.value
+    _SIZE_KEY = FilingSchemaEnum.SIZE.value
+    _IS_XBRL_KEY = FilingSchemaEnum.IS_XBRL.value
+    _IS_INLINE_XBRL_KEY = FilingSchemaEnum.IS_INLINE_XBRL.value
+    _PRIMARY_DOCUMENT_KEY = FilingSchemaEnum.PRIMARY_DOCUMENT.value
+    _PRIMARY_DOCUMENT_DESCRIPTION_KEY = FilingSchemaEnum.PRIMARY_DOCUMENT_DESCRIPTION.value
+
     def __init__(self, data, cik):
         """
         Represents a single filing made by a given company.
@@ -243,43 +386,404 @@ class Filing:
         @param cik: cik of the specified company
         """
         self.cik = cik
-        self.accession_number = data[self.FilingSchemaEnum.ACCESSION_NUMBER.value]
-        self.filing_date = data[self.FilingSchemaEnum.FILING_DATE.value]
-        self.report_date = data[self.FilingSchemaEnum.REPORT_DATE.value]
-        self.acceptance_date_time = data[self.FilingSchemaEnum.ACCEPTANCE_DATE_TIME.value]
-        self.act = data[self.FilingSchemaEnum.ACT.value]
-        self.form = data[self.FilingSchemaEnum.FORM.value]
-        self.file_number = data[self.FilingSchemaEnum.FILE_NUMBER.value]
-        self.film_number = data[self.FilingSchemaEnum.FILM_NUMBER.value]
-        self.items = data[self.FilingSchemaEnum.ITEMS.value]
-        self.size = data[self.FilingSchemaEnum.SIZE.value]
-        self.is_xbrl = data[self.FilingSchemaEnum.IS_XBRL.value]
-        self.is_inline_xbrl = data[self.FilingSchemaEnum.IS_INLINE_XBRL.value]
-        self.primary_document_name = data[self.FilingSchemaEnum.PRIMARY_DOCUMENT.value]
-        self.primary_document_description = data.get(self.FilingSchemaEnum.PRIMARY_DOCUMENT_DESCRIPTION.value)
-
-        self._endpoint_format_kwargs = self.__set_endpoint_format_kwargs()
-        self.primary_document_link = EndpointEnum.EDGAR_DATA_ARCHIVES.value.format(**self._endpoint_format_kwargs)
-
-    def __set_endpoint_format_kwargs(self):
-        # drop the leading zeroes from cik since they are not used in the endpoint
-        cik_num = int(self.cik)
-        formatted_accession_num = self.accession_number.replace("-", "")
-        return {
-            "CIK_NUM": cik_num,
-            "ACCESSION_NUM": formatted_accession_num,
-            "FILE_NAME": self.primary_document_name
-        }
+        self.accession_number = data[self._ACCESSION_NUMBER_KEY]
+        self.filing_date = data[self._FILING_DATE_KEY]
+        self.report_date = data[self._REPORT_DATE_KEY]
+        self.acceptance_date_time = data[self._ACCEPTANCE_DATE_TIME_KEY]
+        self.act = data[self._ACT_KEY]
+        self.form = data[self._FORM_KEY]
+        self.file_number = data[self._FILE_NUMBER_KEY]
+        self.film_number = data[self._FILM_NUMBER_KEY]
+        self.items = data[self._ITEMS_KEY]
+        self.size = data[self._SIZE_KEY]
+        self.is_xbrl = data[self._IS_XBRL_KEY]
+        self.is_inline_xbrl = data[self._IS_INLINE_XBRL_KEY]
+        self.primary_document_name = data[self._PRIMARY_DOCUMENT_KEY]
+        self.primary_document_description = data.get(self._PRIMARY_DOCUMENT_DESCRIPTION_KEY)
+
+
+class FilingTable:
+    def __init__(self, data, cik):
+        """
+        Columnar representation of a set of filings made by a given company. The arrays from the 'recent' field (or an
+        additional filings page) of the submissions api endpoint are kept as they are rather than being stitched into a
+        Filing per row, which makes parsing submissions cheap when only a few filings are used.
+        Filtering is vectorized: the columns being filtered on are converted to NumPy arrays on first use, and filtered tables
+        share the columns of the table they were filtered from.
+        The table also behaves like a list of filings: indexing and iterating over it yields FilingRow views that have the
+        same attributes as Filing.
+        Indexes of form -> positions, accession number -> position and filing dates sorted for binary search are built
+        the first time they are needed and kept for the life of the table, so repeated lookups don't scan the table
+        @param data: dict, field name -> list of values
+        @param cik: str, cik associated w/ company
+        """
+        self.cik = cik
+        self._columns = data
+        self._positions = None
+        self.__arrays = {}
+        self.__reset_indexes()
+
+    @classmethod
+    def _from_positions(cls, source, positions):
+        table = cls.__new__(cls)
+        table.cik = source.cik
+        table._columns = source._columns
+        table._positions = positions
+        table.__arrays = source.__arrays
+        table.__reset_indexes()
+        return table
+
+    def __reset_indexes(self):
+        self.__form_index = None
+        self.__accession_number_index = None
+        self.__filing_date_index = None
+
+    @classmethod
+    def merge(cls, tables):
+        """
+        Combines several tables of filings made by the same company, ie the recent filings and the additional filings pages,
+        into one table ordered by filing date and acceptance time, newest first. When tables overlap the filing from the
+        earliest table is kept
+        @param tables: List[FilingTable]
+        @return: FilingTable
+        """
+        assert tables, "tables arg {} must contain at least one FilingTable!".format(tables)
+        keys = list(dict.fromkeys(key for table in tables for key in table._columns))
+        columns = {key: [] for key in keys}
+        for table in tables:
+            rows = None if table._positions is None else table._positions.tolist()
+            for key in keys:
+                column = table._columns.get(key)
+                if column is None:
+                    columns[key].extend([None] * len(table))
+                else:
+                    columns[key].extend(column if rows is None else [column[row] for row in rows])
+
+        num_filings = sum(len(table) for table in tables)
+        first_positions = {}
+        for i, accession_number in enumerate(columns.get(Filing.FilingSchemaEnum.ACCESSION_NUMBER.value, [])):
+            first_positions.setdefault(accession_number, i)
+        filing_dates = columns.get(Filing.FilingSchemaEnum.FILING_DATE.value) or [None] * num_filings
+        acceptance_date_times = columns.get(Filing.FilingSchemaEnum.ACCEPTANCE_DATE_TIME.value) or [None] * num_filings
+        order = sorted(first_positions.values(), key=lambda i: (filing_dates[i] or "", acceptance_date_times[i] or ""), reverse=True)
+        return cls._from_positions(cls(columns, tables[0].cik), np.array(order, dtype=np.intp))
+
+    def __len__(self):
+        if self._positions is not None:
+            return len(self._positions)
+        accession_numbers = self._columns.get(Filing.FilingSchemaEnum.ACCESSION_NUMBER.value)
+        return len(accession_numbers) if accession_numbers is not None else 0
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += len(self)
+            if not 0 <= key < len(self):
+                raise IndexError("FilingTable index {} out of range".format(key))
+            return FilingRow(self, self.__get_row(key))
+        return self.take(key)
+
+    def __iter__(self):
+        rows = range(len(self)) if self._positions is None else self._positions.tolist()
+        return (FilingRow(self, row) for row in rows)
+
+    def __repr__(self):
+        return "FilingTable(cik={!r}, rows={})".format(self.cik, len(self))
+
+    def __get_row(self, i):
+        return i if self._positions is None else int(self._positions[i])
+
+    def _get_value(self, key, row):
+        column = self._columns.get(key)
+        return column[row] if column is not None else None
+
+    def get_column(self, key):
+        """
+        Gets the values of a field for every filing in the table
+        @param key: str, field name as returned by the SEC REST API, ie Filing.FilingSchemaEnum.FORM.value
+        @return: numpy array
+        """
+        array = self.__arrays.get(key)
+        if array is None:
+            array = self.__to_array(key, self._columns.get(key, []))
+            self.__arrays[key] = array
+        return array if self._positions is None else array[self._positions]
+
+    @staticmethod
+    def __to_array(key, values):
+        if key in (Filing.FilingSchemaEnum.FILING_DATE.value, Filing.FilingSchemaEnum.REPORT_DATE.value):
+            return np.array([value if value else "NaT" for value in values], dtype="datetime64[D]")
+        if key in (Filing.FilingSchemaEnum.IS_XBRL.value, Filing.FilingSchemaEnum.IS_INLINE_XBRL.value):
+            return np.array(values, dtype=bool)
+        return np.array(values)
+
+    def take(self, indices):
+        """
+        Builds a view of a subset of the filings in the table
+        @param indices: slice, array of positions or boolean mask
+        @return: FilingTable
+        """
+        if isinstance(indices, np.ndarray) and np.issubdtype(indices.dtype, np.integer):
+            positions = indices
+        else:
+            positions = np.arange(len(self))[indices]
+        if self._positions is not None:
+            positions = self._positions[positions]
+        return self._from_positions(self, positions)
+
+    def mask(self, form=None, filed_after=None, filed_before=None, is_xbrl=None, is_inline_xbrl=None):
+        """
+        Builds a boolean mask of the filings that match all of the given conditions. Date args can be ISO formatted strings,
+        datetime.date instances or numpy.datetime64 values and bounds are inclusive
+        @param form: str or iterable of str, ie 10-K
+        @param filed_after: only keep filings filed on or after filed_after
+        @param filed_before: only keep filings filed on or before filed_before
+        @param is_xbrl: bool, only keep filings that do (or do not) have XBRL financial data
+        @param is_inline_xbrl: bool, only keep filings that do (or do not) have inline XBRL financial data
+        @return: numpy array of bool
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if form is not None:
+            forms = self.get_column(Filing.FilingSchemaEnum.FORM.value)
+            mask &= (forms == form) if isinstance(form, str) else np.isin(forms, list(form))
+        if filed_after is not None:
+            mask &= self.get_column(Filing.FilingSchemaEnum.FILING_DATE.value) >= np.datetime64(filed_after, "D")
+        if filed_before is not None:
+            mask &= self.get_column(Filing.FilingSchemaEnum.FILING_DATE.value) <= np.datetime64(filed_before, "D")
+        if is_xbrl is not None:
+            mask &= self.get_column(Filing.FilingSchemaEnum.IS_XBRL.value) == is_xbrl
+        if is_inline_xbrl is not None:
+            mask &= self.get_column(Filing.FilingSchemaEnum.IS_INLINE_XBRL.value) == is_inline_xbrl
+        return mask
+
+    def filter(self, **kwargs):
+        """
+        Filters the filings in the table. See mask for the supported conditions
+        @return: FilingTable
+        """
+        return self.take(self.mask(**kwargs))
+
+    def __get_form_index(self):
+        if self.__form_index is None:
+            forms = self.get_column(Filing.FilingSchemaEnum.FORM.value)
+            order = np.argsort(forms, kind="stable")
+            unique_forms, starts = np.unique(forms[order], return_index=True)
+            self.__form_index = dict(zip(unique_forms.tolist(), np.split(order, starts[1:])))
+        return self.__form_index
+
+    def __get_accession_number_index(self):
+        if self.__accession_number_index is None:
+            accession_numbers = self._columns.get(Filing.FilingSchemaEnum.ACCESSION_NUMBER.value, [])
+            if self._positions is not None:
+                accession_numbers = [accession_numbers[row] for row in self._positions.tolist()]
+            # the first position is kept if an accession number is repeated
+            self.__accession_number_index = {}
+            for i, accession_number in enumerate(accession_numbers):
+                self.__accession_number_index.setdefault(accession_number, i)
+        return self.__accession_number_index
+
+    def __get_filing_date_index(self):
+        if self.__filing_date_index is None:
+            filing_dates = self.get_column(Filing.FilingSchemaEnum.FILING_DATE.value)
+            order = np.argsort(filing_dates, kind="stable")
+            self.__filing_date_index = (filing_dates[order], order)
+        return self.__filing_date_index
+
+    def _get_form_positions(self, form_type):
+        """
+        @param form_type: str or iterable of str
+        @return: numpy array of the positions of the filings of the given form type(s), in table order
+        """
+        form_index = self.__get_form_index()
+        if isinstance(form_type, str):
+            return form_index.get(form_type, np.empty(0, dtype=np.intp))
+        positions = [form_index[form] for form in set(form_type) if form in form_index]
+        return np.sort(np.concatenate(positions)) if positions else np.empty(0, dtype=np.intp)
 
-    def download_primary_document(self, user_agent, output_path, chunk_size=1028):
+    def _get_filing_date_positions(self, start_date=None, end_date=None):
         """
-        Downloads the primary document for the SEC archive
-        @param user_agent: str, unique identifier needed to make request
-        @param output_path: str, path to save downloaded document to
-        @param chunk_size: int, number of bytes to process from request at a time
-        @return: None
+        Binary searches the sorted filing dates for the filings filed between start_date and end_date, bounds are inclusive
+        @param start_date: str, datetime.date or numpy.datetime64
+        @param end_date: str, datetime.date or numpy.datetime64
+        @return: numpy array of positions, in table order
         """
-        # TODO is there a better way of going about this that doesn't involve user supplying a user_agent?
-        # Seems sort of clumsy. On paper, one request for a single document shouldn't get rate limited
-        nwc = NetworkClient(user_agent)
-        nwc.download_file(EndpointEnum.EDGAR_DATA_ARCHIVES, output_path, chunk_size,  **self._endpoint_format_kwargs)
+        sorted_dates, order = self.__get_filing_date_index()
+        lo = np.searchsorted(sorted_dates, np.datetime64(start_date, "D"), side="left") if start_date is not None else 0
+        # NaT sorts after every date, so an open end stops at the first missing date
+        hi = np.searchsorted(sorted_dates, np.datetime64(end_date, "D"), side="right") if end_date is not None \
+            else np.searchsorted(sorted_dates, np.datetime64("NaT"), side="left")
+        return np.sort(order[lo:hi])
+
+    def get_by_accession_number(self, accession_number):
+        """
+        Looks up a filing by its accession number
+        @param accession_number: str, ie 0001564590-22-000100
+        @return: FilingRow, None if the table doesn't contain the filing
+        """
+        position = self.__get_accession_number_index().get(accession_number)
+        return self[position] if position is not None else None
+
+    def __contains__(self, accession_number):
+        return accession_number in self.__get_accession_number_index()
+
+    def filter_by_form(self, form_type):
+        """
+        Filter filings by a particular form type
+        @param form_type: str or iterable of str
+        @return: FilingTable
+        """
+        return self.take(self._get_form_positions(form_type))
+
+    def filter_by_filing_date(self, start_date=None, end_date=None):
+        """
+        Filter filings by the date they were filed on, bounds are inclusive
+        @param start_date: str, datetime.date or numpy.datetime64
+        @param end_date: str, datetime.date or numpy.datetime64
+        @return: FilingTable
+        """
+        return self.take(self._get_filing_date_positions(start_date, end_date))
+
+    def query(self, form=None, start_date=None, end_date=None, accession_numbers=None):
+        """
+        Looks up the filings that match all of the given conditions using the indexes of the table
+        @param form: str or iterable of str, ie 10-K
+        @param start_date: only keep filings filed on or after start_date
+        @param end_date: only keep filings filed on or before end_date
+        @param accession_numbers: iterable of str, only keep filings w/ these accession numbers
+        @return: FilingTable, filings in table order
+        """
+        positions = None
+        if accession_numbers is not None:
+            accession_number_index = self.__get_accession_number_index()
+            positions = np.array(sorted({accession_number_index[accn] for accn in accession_numbers if accn in accession_number_index}), dtype=np.intp)
+        if form is not None:
+            form_positions = self._get_form_positions(form)
+            positions = form_positions if positions is None else np.intersect1d(positions, form_positions, assume_unique=True)
+        if start_date is not None or end_date is not None:
+            if positions is None:
+                positions = self._get_filing_date_positions(start_date, end_date)
+            else:
+                # the rows selected so far are usually far fewer than those in the date range, so they are checked directly
+                filing_dates = self.get_column(Filing.FilingSchemaEnum.FILING_DATE.value)[positions]
+                mask = np.ones(len(positions), dtype=bool)
+                if start_date is not None:
+                    mask &= filing_dates >= np.datetime64(start_date, "D")
+                if end_date is not None:
+                    mask &= filing_dates <= np.datetime64(end_date, "D")
+                positions = positions[mask]
+        if positions is None:
+            return self.take(slice(None))
+        return self.take(positions)
+
+    def filter_xbrl(self, inline=False):
+        """
+        Filter filings down to those that have XBRL financial data
+        @param inline: bool, only keep filings w/ inline XBRL financial data
+        @return: FilingTable
+        """
+        return self.filter(is_inline_xbrl=True) if inline else self.filter(is_xbrl=True)
+
+    def to_filings(self):
+        """
+        Materializes every filing in the table
+        @return: List[Filing]
+        """
+        return [row.to_filing() for row in self]
+
+
+class FilingRow(HasPrimaryDocumentMixin):
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table, row):
+        """
+        Read-only view of a single filing in a FilingTable w/ the same attributes as Filing
+        @param table: FilingTable
+        @param row: int, position of the filing in the columns of the table
+        """
+        self._table = table
+        self._row = row
+
+    def __get(self, key):
+        return self._table._get_value(key, self._row)
+
+    @property
+    def cik(self):
+        return self._table.cik
+
+    @property
+    def accession_number(self):
+        return self.__get(Filing._ACCESSION_NUMBER_KEY)
+
+    @property
+    def filing_date(self):
+        return self.__get(Filing._FILING_DATE_KEY)
+
+    @property
+    def report_date(self):
+        return self.__get(Filing._REPORT_DATE_KEY)
+
+    @property
+    def acceptance_date_time(self):
+        return self.__get(Filing._ACCEPTANCE_DATE_TIME_KEY)
+
+    @property
+    def act(self):
+        return self.__get(Filing._ACT_KEY)
+
+    @property
+    def form(self):
+        return self.__get(Filing._FORM_KEY)
+
+    @property
+    def file_number(self):
+        return self.__get(Filing._FILE_NUMBER_KEY)
+
+    @property
+    def film_number(self):
+        return self.__get(Filing._FILM_NUMBER_KEY)
+
+    @property
+    def items(self):
+        return self.__get(Filing._ITEMS_KEY)
+
+    @property
+    def size(self):
+        return self.__get(Filing._SIZE_KEY)
+
+    @property
+    def is_xbrl(self):
+        return self.__get(Filing._IS_XBRL_KEY)
+
+    @property
+    def is_inline_xbrl(self):
+        return self.__get(Filing._IS_INLINE_XBRL_KEY)
+
+    @property
+    def primary_document_name(self):
+        return self.__get(Filing._PRIMARY_DOCUMENT_KEY)
+
+    @property
+    def primary_document_description(self):
+        return self.__get(Filing._PRIMARY_DOCUMENT_DESCRIPTION_KEY)
+
+    def _slot_values(self):
+        return tuple(getattr(self, slot) for slot in Filing.__slots__)
+
+    def __eq__(self, other):
+        if isinstance(other, FilingRow):
+            return self._slot_values() == other._slot_values()
+        else:
+            return False
+
+    def __hash__(self):
+        return hash(self._slot_values())
+
+    def to_filing(self):
+        """
+        @return: Filing w/ the same values as the row
+        """
+        return Filing({key: self.__get(key) for key in self._table._columns}, self.cik)
+
+    def __repr__(self):
+        return "FilingRow(cik={!r}, accession_number={!r}, form={!r}, filing_date={!r})".format(
+            self.cik, self.accession_number, self.form, self.filing_date)
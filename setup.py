@@ -14,6 +14,10 @@ setup(
     description=("Python library for interacting w/ the SEC REST API: https://www.sec.gov/edgar/sec-api-documentation"),
     license="MIT",
     install_requires=INSTALL_REQUIRES,
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+        "fast-json": ["orjson>=3.6"]
+    },
     keywords=["SEC", "EDGAR", "finance", "REST API wrapper"],
     url="https://github.com/McKalvan/secpy",
     download_url="https://github.com/user/reponame/archive/v{}.tar.gz".format(VERSION),
@@ -0,0 +1,159 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+import numpy as np
+
+from secpy.bulk_data_store import BulkDataStore
+from secpy.company_facts import CompanyFacts
+from secpy.company_facts import CompanyFactsBulkEndpoint
+from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
+from secpy.submissions import Submissions
+from tests.testutils.mock_utils import RESOURCES, mock_shared_company_tickers_exchange
+
+BULK_COMPANY_FACTS_ARCHIVE = os.path.join(RESOURCES, "bulk_submissions.zip")
+
+
+def load_resource(filename):
+    with open(os.path.join(RESOURCES, filename), "r") as f:
+        return json.load(f)
+
+
+class BulkDataStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = BulkDataStore(os.path.join(self.temp_dir, "secpy.db"))
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+
+    def __write_submissions_archive(self):
+        archive_path = os.path.join(self.temp_dir, "submissions.zip")
+        with ZipFile(archive_path, "w") as zip_file:
+            zip_file.writestr("CIK0000789019-submissions-001.json", json.dumps(load_resource("submissions_page.json")))
+            zip_file.writestr("CIK0000789019.json", json.dumps(load_resource("submissions.json")))
+            zip_file.writestr("README.txt", "not a company")
+        return archive_path
+
+    def test_company_facts_round_trip(self):
+        data = load_resource("company_facts.json")
+        self.store.put_company_facts(data)
+        self.assertListEqual(self.store.list_ciks(), ["0000789019"])
+
+        expected = CompanyFacts(data)
+        actual = self.store.get_company_facts("789019")
+        self.assertEqual(actual.entity_name, expected.entity_name)
+        self.assertListEqual(actual.list_taxonomies(), expected.list_taxonomies())
+        for taxonomy in expected.list_taxonomies():
+            self.assertListEqual(actual.list_concepts(taxonomy), expected.list_concepts(taxonomy))
+            for concept_name in expected.list_concepts(taxonomy):
+                expected_concept = expected.get_concept(taxonomy, concept_name)
+                actual_concept = actual.get_concept(taxonomy, concept_name)
+                self.assertEqual(actual_concept.label, expected_concept.label)
+                for unit in expected_concept.list_units():
+                    self.assertListEqual(actual_concept.get_unit(unit), expected_concept.get_unit(unit))
+        self.assertRaises(KeyError, self.store.get_company_facts, "1")
+
+    def test_put_company_facts_replaces_existing(self):
+        data = load_resource("company_facts.json")
+        self.store.put_company_facts(data)
+        data["facts"] = {"dei": data["facts"]["dei"]}
+        self.store.put_company_facts(data)
+        self.assertListEqual(self.store.get_company_facts("789019").list_taxonomies(), ["dei"])
+        self.assertEqual(len(self.store.query_facts("us-gaap", "Assets")["value"]), 0)
+
+    def test_ingest_company_facts(self):
+        self.assertEqual(self.store.ingest_company_facts(BULK_COMPANY_FACTS_ARCHIVE), 5)
+        self.assertListEqual(self.store.list_ciks(), ["0000001750", "0000001800", "0000001961", "0000002034", "0000002098"])
+        with ZipFile(BULK_COMPANY_FACTS_ARCHIVE) as zip_file:
+            expected = CompanyFacts(json.loads(zip_file.read("CIK0000001800.json")))
+        actual = self.store.get_company_facts("0000001800")
+        expected_assets = expected.get_concept("us_gaap", "Assets").get_unit("USD")
+        self.assertListEqual(actual.get_concept("us_gaap", "Assets").get_unit("USD"), expected_assets)
+
+    def test_query_facts(self):
+        self.store.ingest_company_facts(BULK_COMPANY_FACTS_ARCHIVE)
+        frame = self.store.query_facts("us-gaap", "Assets", unit="USD", frame="CY2019Q4I")
+        self.assertGreater(len(frame["cik"]), 1)
+        self.assertEqual(len(set(frame["cik"])), len(frame["cik"]))
+        self.assertTrue(all(value == "CY2019Q4I" for value in frame["frame"]))
+        self.assertTrue(all(np.datetime64("2019-10-01") <= end <= np.datetime64("2019-12-31") for end in frame["end"]))
+        self.assertEqual(frame["value"].dtype, np.float64)
+
+        with ZipFile(BULK_COMPANY_FACTS_ARCHIVE) as zip_file:
+            abbott = CompanyFacts(json.loads(zip_file.read("CIK0000001800.json")))
+        expected_values = [fact.value for fact in abbott.get_concept("us_gaap", "Assets").get_unit("USD")
+                           if fact.form == "10-K" and fact.fiscal_year == 2019]
+        abbott_10k = self.store.query_facts("us-gaap", "Assets", ciks=[1800], form="10-K", fiscal_year=2019)
+        self.assertListEqual(abbott_10k["value"].tolist(), expected_values)
+        self.assertTrue(all(cik == "0000001800" for cik in abbott_10k["cik"]))
+
+        in_range = self.store.query_facts("us-gaap", "Assets", ciks=[1800], start_date="2019-01-01", end_date="2019-12-31")
+        self.assertTrue(all(np.datetime64("2019-01-01") <= end <= np.datetime64("2019-12-31") for end in in_range["end"]))
+
+        frames = self.store.query_facts("us-gaap", "Assets", unit=["USD"], frame={"CY2019Q4I", "CY2018Q4I"})
+        self.assertSetEqual(set(frames["frame"]), {"CY2019Q4I", "CY2018Q4I"})
+        self.assertEqual(self.store.get_concept_labels("us-gaap", "Assets")["0000001800"][0], abbott.get_concept("us_gaap", "Assets").label)
+
+        empty = self.store.query_facts("us-gaap", "NotAConcept")
+        self.assertEqual(len(empty["value"]), 0)
+        self.assertEqual(empty["end"].dtype, np.dtype("datetime64[D]"))
+
+    def test_submissions(self):
+        self.assertEqual(self.store.ingest_submissions(self.__write_submissions_archive()), 1)
+        self.assertListEqual(self.store.list_submissions_ciks(), ["0000789019"])
+        expected = Submissions(load_resource("submissions.json"))
+        actual = self.store.get_submissions("789019")
+        self.assertEqual(actual.name, expected.name)
+        self.assertDictEqual(actual.addresses, expected.addresses)
+        # the first filing of the page repeats the last recent filing
+        self.assertEqual(len(actual.filings.recent_files), len(expected.filings.recent_files) + 24)
+        self.assertListEqual(actual.filings.recent_files[:len(expected.filings.recent_files)].to_filings(), expected.filings.recent_files.to_filings())
+        self.assertListEqual(actual.filings.historical_files, [])
+
+        filings = self.store.query_filings(form="10-K")
+        self.assertTrue(len(filings["accession_number"]) > 0)
+        self.assertTrue(all(form == "10-K" for form in filings["form"]))
+        self.assertTrue(np.all(filings["filing_date"][:-1] >= filings["filing_date"][1:]))
+        filed_after = self.store.query_filings(ciks=["789019"], filed_after="2022-01-01")
+        self.assertTrue(np.all(filed_after["filing_date"] >= np.datetime64("2022-01-01")))
+
+    def test_delete_company(self):
+        self.store.put_company_facts(load_resource("company_facts.json"))
+        self.store.put_submissions(load_resource("submissions.json"))
+        self.store.delete_company("789019")
+        self.assertListEqual(self.store.list_ciks(), [])
+        self.assertListEqual(self.store.list_submissions_ciks(), [])
+        self.assertEqual(len(self.store.query_filings()["cik"]), 0)
+
+    def test_failed_write_is_rolled_back(self):
+        data = load_resource("company_facts.json")
+        self.store.put_company_facts(data)
+        del data["facts"]["us-gaap"]["Assets"]["units"]["USD"][0]["end"]
+        self.assertRaises(KeyError, self.store.put_company_facts, data)
+        self.assertEqual(len(self.store.get_company_facts("789019").get_concept("us_gaap", "Assets").get_unit("USD")),
+                         len(CompanyFacts(load_resource("company_facts.json")).get_concept("us_gaap", "Assets").get_unit("USD")))
+
+
+class BulkDataEndpointConvertToStoreTest(unittest.TestCase):
+    def setUp(self):
+        mock_shared_company_tickers_exchange()
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        TickerCompanyExchangeMap.reset_shared()
+        shutil.rmtree(self.temp_dir)
+
+    def test_convert_to_store(self):
+        bulk_company_facts = CompanyFactsBulkEndpoint("/", existing_archive=BULK_COMPANY_FACTS_ARCHIVE)
+        with BulkDataStore(os.path.join(self.temp_dir, "secpy.db")) as store:
+            self.assertEqual(bulk_company_facts.convert_to_store(store), 5)
+            self.assertEqual(len(store.list_ciks()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
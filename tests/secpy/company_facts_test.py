@@ -0,0 +1,187 @@
+import copy
+import io
+import json
+import os
+import unittest
+from datetime import date
+
+from secpy.company_facts import CompanyFacts, CompanyFactsStreamParser, Fact, Statement, StatementHistory
+from secpy.core.utils.namespace_opts import NamespaceOpts
+from tests.testutils.mock_utils import RESOURCES
+
+with open(os.path.join(RESOURCES, "company_facts.json"), "r") as f:
+    COMPANY_FACTS_DATA = json.load(f)
+
+
+class CompanyFactsTest(unittest.TestCase):
+    def test_company_facts(self):
+        company_facts = CompanyFacts(COMPANY_FACTS_DATA)
+        self.assertEqual(company_facts.cik, "0000789019")
+        self.assertEqual(company_facts.entity_name, "MICROSOFT CORPORATION")
+        self.assertListEqual(company_facts.list_taxonomies(), ["dei", "us_gaap"])
+        self.assertListEqual(company_facts.list_concepts("us_gaap"), ["Assets", "Revenues", "EarningsPerShareBasic"])
+
+        assets = company_facts.get_concept("us_gaap", "Assets")
+        self.assertIs(assets, company_facts.taxonomies.us_gaap.Assets)
+        self.assertEqual(assets.get_unit("USD")[-1].value, 333779000000)
+        self.assertListEqual(company_facts.get_concept("us_gaap", "EarningsPerShareBasic").list_units(), ["USD_shares"])
+
+    def test_lazy_company_facts_matches_eager(self):
+        eager_company_facts = CompanyFacts(COMPANY_FACTS_DATA)
+        lazy_company_facts = CompanyFacts(COMPANY_FACTS_DATA, lazy=True)
+        self.assertListEqual(lazy_company_facts.list_taxonomies(), eager_company_facts.list_taxonomies())
+        for taxonomy in eager_company_facts.list_taxonomies():
+            self.assertListEqual(lazy_company_facts.list_concepts(taxonomy), eager_company_facts.list_concepts(taxonomy))
+            for concept_name in eager_company_facts.list_concepts(taxonomy):
+                eager_concept = eager_company_facts.get_concept(taxonomy, concept_name)
+                lazy_concept = lazy_company_facts.get_concept(taxonomy, concept_name)
+                self.assertEqual(lazy_concept.label, eager_concept.label)
+                self.assertListEqual(lazy_concept.list_units(), eager_concept.list_units())
+                for unit in eager_concept.list_units():
+                    self.assertListEqual(lazy_concept.get_unit(unit),
+                                         eager_concept.get_unit(unit))
+
+    def test_lazy_company_facts_parse_on_access(self):
+        company_facts = CompanyFacts(COMPANY_FACTS_DATA, lazy=True)
+        self.assertNotIn("us_gaap", vars(company_facts.taxonomies))
+
+        assets = company_facts.taxonomies.us_gaap.Assets
+        self.assertIn("us_gaap", vars(company_facts.taxonomies))
+        self.assertNotIn("Revenues", vars(company_facts.taxonomies.us_gaap))
+        self.assertNotIn("USD", vars(assets.units))
+
+        self.assertEqual(assets.units.USD[0].value, 286556000000)
+        self.assertIs(assets.get_unit("USD"), assets.units.USD)
+        self.assertIs(company_facts.get_concept("us_gaap", "Assets"), assets)
+
+    def test_missing_keys(self):
+        for company_facts in [CompanyFacts(COMPANY_FACTS_DATA), CompanyFacts(COMPANY_FACTS_DATA, lazy=True)]:
+            self.assertRaises(KeyError, company_facts.get_taxonomy, "ifrs_full")
+            self.assertRaises(KeyError, company_facts.get_concept, "us_gaap", "Liabilities")
+            self.assertRaises(KeyError, company_facts.get_concept("us_gaap", "Assets").get_unit, "EUR")
+
+    def test_statement_history_lazy(self):
+        eager_statements = CompanyFacts(COMPANY_FACTS_DATA).get_statement_history().get_all_statements()
+        lazy_statements = CompanyFacts(COMPANY_FACTS_DATA, lazy=True).get_statement_history().get_all_statements()
+        self.assertListEqual([(statement.form, statement.filed) for statement in lazy_statements],
+                             [(statement.form, statement.filed) for statement in eager_statements])
+
+
+    def test_statement_history(self):
+        company_facts = CompanyFacts(COMPANY_FACTS_DATA)
+        history = company_facts.get_statement_history()
+        self.assertIs(company_facts.get_statement_history(), history)
+
+        expected = {}
+        for _, concepts in NamespaceOpts.items(company_facts.taxonomies):
+            for concept_name, concept in NamespaceOpts.items(concepts):
+                for unit_name, facts in NamespaceOpts.items(concept.units):
+                    for fact in facts:
+                        expected.setdefault(fact.get_form_frame(), {})[(concept_name, unit_name)] = fact
+        self.assertEqual(len(history.get_all_statements()), len(expected))
+        for form_frame, facts in expected.items():
+            form, period = form_frame.split("_", 1)
+            statement = history.get_statement_for_form_and_period(form, period)
+            self.assertEqual(statement.form, form)
+            for (concept_name, unit_name), fact in facts.items():
+                self.assertEqual(statement.get_facts_for_unit(concept_name, unit_name), fact)
+
+        ten_ks = history.get_statements_for_form("10-K")
+        self.assertEqual(len(ten_ks), sum(form_frame.startswith("10-K_") for form_frame in expected))
+        self.assertListEqual(history.get_statements_for_form("10-K", exact=True), ten_ks)
+        self.assertListEqual(history.get_statements_for_form("10-K/A"), [])
+        self.assertTrue(all(statement.fiscal_year == 2021 for statement in history.get_statements_for_fiscal_period(2021)))
+        self.assertTrue(all(statement.fiscal_period == "FY" for statement in history.get_statements_for_fiscal_period(2021, "FY")))
+
+        filed = [statement.filed for statement in history.get_statements_for_date_range("20/07/30", "21/07/29")]
+        self.assertListEqual(filed, sorted(filed))
+        self.assertTrue(all("2020-07-30" < date < "2021-07-29" for date in filed))
+        self.assertEqual(len(history.get_statements_for_date_range(start_date="20/07/29")) + len(history.get_statements_for_date_range(end_date="20/07/30")),
+                         len(history.get_all_statements()))
+
+    def test_statements_for_form_include_amendments(self):
+        data = copy.deepcopy(COMPANY_FACTS_DATA)
+        amended = data["facts"]["us-gaap"]["Assets"]["units"]["USD"][-1]
+        amended["form"] = "10-K/A"
+        history = CompanyFacts(data).get_statement_history()
+        self.assertIn("10-K/A", {statement.form for statement in history.get_statements_for_form("10-K")})
+        self.assertNotIn("10-K/A", {statement.form for statement in history.get_statements_for_form("10-K", exact=True)})
+        self.assertListEqual([statement.form for statement in history.get_statements_for_form("10-K/A")], ["10-K/A"])
+        self.assertEqual(len(history.get_statements_for_form("10-K")),
+                         len(history.get_statements_for_form("10-K", exact=True)) + len(history.get_statements_for_form("10-K/A")))
+        self.assertListEqual(history.get_statements_for_form("20-F"), [])
+
+    def test_statement_from_facts(self):
+        facts = CompanyFacts(COMPANY_FACTS_DATA).get_concept("us_gaap", "Assets").get_unit("USD")
+        statement = Statement({"USD": facts[0]})
+        self.assertEqual((statement.form, statement.filed, statement.end), (facts[0].form, facts[0].filed, facts[0].end))
+        self.assertListEqual(statement.list_concepts(), ["Assets"])
+        self.assertEqual(statement.get_facts_for_unit("Assets", "USD"), facts[0])
+
+    def test_statement_history_point_in_time(self):
+        history = CompanyFacts(COMPANY_FACTS_DATA).get_statement_history()
+        statements = history.get_all_statements()
+        by_filed = sorted(statements, key=lambda statement: (statement.filed, statement.end))
+
+        latest = history.get_latest_statements(3)
+        self.assertListEqual(latest, by_filed[::-1][:3])
+        self.assertIs(history.get_statement_as_of(date(2021, 12, 31)), by_filed[-1])
+        self.assertIsNone(history.get_statement_as_of("00/01/01"))
+
+        as_of = history.get_statement_as_of("20/12/31", form="10-Q")
+        known = [statement for statement in by_filed if statement.form == "10-Q" and statement.filed <= "2020-12-31"]
+        self.assertIs(as_of, known[-1])
+        self.assertListEqual(history.get_latest_statements(100, as_of=date(2020, 12, 31), form="10-Q"), known[::-1])
+        self.assertListEqual(history.get_latest_statements(form="S-1"), [])
+
+        ended = history.get_statements_for_date_range(date(2020, 1, 1), date(2021, 1, 1), date_field=StatementHistory.END)
+        self.assertListEqual(sorted(ended, key=id), sorted([statement for statement in statements if "2020-01-01" < statement.end < "2021-01-01"], key=id))
+        self.assertRaises(AssertionError, history.get_statements_for_date_range, "20/01/01", date_field="start")
+
+
+class CompanyFactsStreamParserTest(unittest.TestCase):
+    def __get_stream(self):
+        return io.BytesIO(json.dumps(COMPANY_FACTS_DATA).encode())
+
+    def test_iter_units(self):
+        units = list(CompanyFactsStreamParser(self.__get_stream(), chunk_size=100).iter_units())
+        expected_units = [(taxonomy, concept_name, unit)
+                          for taxonomy, concepts in COMPANY_FACTS_DATA["facts"].items()
+                          for concept_name, concept in concepts.items()
+                          for unit in concept["units"]]
+        self.assertListEqual([(unit.taxonomy, unit.concept_name, unit.unit) for unit in units], expected_units)
+
+        assets = units[[unit.concept_name for unit in units].index("Assets")]
+        self.assertEqual(assets.cik, "0000789019")
+        self.assertEqual(assets.entity_name, "MICROSOFT CORPORATION")
+        self.assertEqual(assets.label, COMPANY_FACTS_DATA["facts"]["us-gaap"]["Assets"]["label"])
+        self.assertListEqual(assets.facts, [Fact(fact, "Assets", "USD") for fact in COMPANY_FACTS_DATA["facts"]["us-gaap"]["Assets"]["units"]["USD"]])
+
+    def test_iter_units_w_allowlist(self):
+        parser = CompanyFactsStreamParser(self.__get_stream(), concepts=["Assets", "dei:EntityCommonStockSharesOutstanding", "us-gaap:NotAConcept"])
+        self.assertListEqual([unit.concept_name for unit in parser.iter_units()], ["EntityCommonStockSharesOutstanding", "Assets"])
+        parser = CompanyFactsStreamParser(self.__get_stream(), concepts=["us-gaap:EntityCommonStockSharesOutstanding"])
+        self.assertListEqual(list(parser.iter_units()), [])
+
+    def test_iter_units_w_units_before_label(self):
+        data = copy.deepcopy(COMPANY_FACTS_DATA)
+        assets = data["facts"]["us-gaap"]["Assets"]
+        data["facts"]["us-gaap"]["Assets"] = {"units": assets["units"], "label": assets["label"], "description": assets["description"]}
+        parser = CompanyFactsStreamParser(io.BytesIO(json.dumps(data).encode()), concepts=["Assets"], chunk_size=100)
+        units = list(parser.iter_units())
+        self.assertListEqual([unit.unit for unit in units], list(assets["units"]))
+        self.assertEqual((units[0].label, units[0].description), (assets["label"], assets["description"]))
+
+    def test_parse(self):
+        expected = CompanyFacts(COMPANY_FACTS_DATA)
+        actual = CompanyFactsStreamParser(self.__get_stream(), concepts=["Assets", "Revenues"], chunk_size=50).parse()
+        self.assertEqual(actual.cik, expected.cik)
+        self.assertListEqual(actual.list_taxonomies(), ["us_gaap"])
+        self.assertListEqual(actual.list_concepts("us_gaap"), ["Assets", "Revenues"])
+        self.assertListEqual(actual.get_concept("us_gaap", "Revenues").get_unit("USD"), expected.get_concept("us_gaap", "Revenues").get_unit("USD"))
+        self.assertEqual(CompanyFactsStreamParser(self.__get_stream()).parse(columnar=True).get_concept("us_gaap", "Assets").get_unit("USD").latest_value(),
+                         expected.get_concept("us_gaap", "Assets").get_unit("USD")[-1].value)
+
+
+if __name__ == '__main__':
+    unittest.main()
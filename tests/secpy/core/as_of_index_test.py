@@ -0,0 +1,75 @@
+import json
+import os
+import unittest
+from datetime import date
+
+import numpy as np
+
+from secpy.company_facts import CompanyFacts, Fact
+from secpy.core.as_of_index import AsOfIndex
+from secpy.core.fact_table import FactTable
+
+with open(os.path.join(os.path.dirname(__file__), "..", "..", "resources", "company_facts.json"), "r") as f:
+    COMPANY_FACTS_DATA = json.load(f)
+
+ASSETS_DATA = COMPANY_FACTS_DATA["facts"]["us-gaap"]["Assets"]["units"]["USD"]
+
+
+def naive_value_as_of(facts, as_of):
+    known = [fact for fact in facts if fact.filed <= as_of]
+    if not known:
+        return None
+    latest_end = max(fact.end for fact in known)
+    return max((fact for fact in known if fact.end == latest_end), key=lambda fact: fact.filed).value
+
+
+class AsOfIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.facts = [Fact(fact, "Assets", "USD") for fact in ASSETS_DATA]
+        self.dates = ["2019-01-01", "2020-07-29", "2020-07-30", "2020-12-31", "2021-01-26", "2021-05-01", "2022-01-01"]
+
+    def test_value_as_of(self):
+        for index in [AsOfIndex(self.facts), AsOfIndex(FactTable(ASSETS_DATA, "Assets", "USD"))]:
+            for as_of in self.dates:
+                self.assertEqual(index.value_as_of(as_of), naive_value_as_of(self.facts, as_of))
+            self.assertIsInstance(index.value_as_of("2022-01-01"), int)
+            self.assertEqual(index.value_as_of(date(2021, 1, 26)), naive_value_as_of(self.facts, "2021-01-26"))
+
+    def test_values_as_of(self):
+        index = AsOfIndex(self.facts)
+        expected = [naive_value_as_of(self.facts, as_of) for as_of in self.dates]
+        actual = index.values_as_of(np.array(self.dates, dtype="datetime64[D]"))
+        # nothing was filed before 2020-07-30
+        self.assertTrue(np.isnan(actual[:2]).all())
+        self.assertListEqual(actual[2:].tolist(), expected[2:])
+
+    def test_fact_as_of(self):
+        index = AsOfIndex(self.facts)
+        fact = index.fact_as_of("2021-05-01")
+        self.assertIn(fact, self.facts)
+        self.assertEqual((fact.end, fact.filed), ("2021-03-31", "2021-04-27"))
+        self.assertIsNone(index.fact_as_of("2000-01-01"))
+
+    def test_form_filter(self):
+        index = AsOfIndex(self.facts, form="10-K")
+        ten_ks = [fact for fact in self.facts if fact.form == "10-K"]
+        for as_of in self.dates:
+            self.assertEqual(index.value_as_of(as_of), naive_value_as_of(ten_ks, as_of))
+        self.assertEqual(len(AsOfIndex(self.facts, form="8-K")), 0)
+        self.assertIsNone(AsOfIndex(self.facts, form="8-K").value_as_of("2022-01-01"))
+
+    def test_series_as_of(self):
+        end, value = AsOfIndex(self.facts).series_as_of("2021-01-01")
+        self.assertListEqual(end.astype(str).tolist(), ["2019-06-30", "2020-06-30", "2020-09-30"])
+        self.assertListEqual(value.tolist(), [286556000000, 301311000000, 285449000000])
+
+    def test_company_facts_as_of(self):
+        company_facts = CompanyFacts(COMPANY_FACTS_DATA, columnar=True)
+        index = company_facts.get_as_of_index("us_gaap", "Assets", "USD")
+        self.assertIs(company_facts.get_as_of_index("us_gaap", "Assets", "USD"), index)
+        self.assertEqual(company_facts.get_value_as_of("us_gaap", "Assets", "USD", "2021-05-01"), naive_value_as_of(self.facts, "2021-05-01"))
+        self.assertEqual(len(company_facts.get_value_as_of("us_gaap", "Assets", "USD", self.dates)), len(self.dates))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+
+from secpy.core.async_network_client import AsyncNetworkClient
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.rate_limiter import TokenBucketRateLimiter
+
+
+def mock_response(body):
+    response = MagicMock()
+    response.raise_for_status = MagicMock()
+    response.read = AsyncMock(return_value=json.dumps(body).encode())
+    context_manager = MagicMock()
+    context_manager.__aenter__ = AsyncMock(return_value=response)
+    context_manager.__aexit__ = AsyncMock(return_value=False)
+    return context_manager
+
+
+class AsyncNetworkClientTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        TokenBucketRateLimiter.reset_shared()
+
+    def tearDown(self):
+        TokenBucketRateLimiter.reset_shared()
+
+    @patch("secpy.core.async_network_client.aiohttp.ClientSession.get")
+    async def test_make_request_json(self, mock_get):
+        mock_get.return_value = mock_response({"cik": 320193})
+        async with AsyncNetworkClient("test-agent") as nwc:
+            actual = await nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193")
+        self.assertEqual(actual, {"cik": 320193})
+        self.assertEqual(mock_get.call_args[0][0], "https://data.sec.gov/submissions/CIK0000320193.json")
+
+    @patch("secpy.core.async_network_client.aiohttp.ClientSession.get")
+    async def test_concurrent_requests_share_rate_limiter(self, mock_get):
+        mock_get.side_effect = lambda *args, **kwargs: mock_response({})
+        async with AsyncNetworkClient("test-agent") as nwc:
+            self.assertIs(nwc._rate_limiter.parent, TokenBucketRateLimiter.shared())
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            await asyncio.gather(*[nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193") for _ in range(6)])
+            self.assertGreaterEqual(loop.time() - start, 0.45)
+        self.assertEqual(mock_get.call_count, 6)
+
+    async def test_invalid_cik(self):
+        async with AsyncNetworkClient("test-agent") as nwc:
+            with self.assertRaises(AssertionError):
+                await nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="123")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import threading
+import time
+import unittest
+
+from secpy.core.batch_executor import BatchExecutor
+
+
+class BatchExecutorTest(unittest.TestCase):
+    def test_run(self):
+        results = list(BatchExecutor(max_workers=4).run(lambda x: x * 2, range(20)))
+        self.assertEqual(sorted(result.item for result in results), list(range(20)))
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual({result.item: result.result for result in results}, {i: i * 2 for i in range(20)})
+
+    def test_run_reports_errors_per_item(self):
+        def func(x):
+            if x % 3 == 0:
+                raise ValueError(x)
+            return x
+
+        results = {result.item: result for result in BatchExecutor(max_workers=2).run(func, range(9))}
+        for i in range(9):
+            if i % 3 == 0:
+                self.assertFalse(results[i].ok)
+                self.assertIsInstance(results[i].exception, ValueError)
+                self.assertIsNone(results[i].result)
+            else:
+                self.assertTrue(results[i].ok)
+                self.assertEqual(results[i].result, i)
+
+    def test_run_yields_as_completed(self):
+        def func(x):
+            time.sleep(0.2 if x == 0 else 0)
+            return x
+
+        results = [result.item for result in BatchExecutor(max_workers=2).run(func, range(3))]
+        self.assertEqual(results[-1], 0)
+
+    def test_run_bounds_items_in_flight(self):
+        lock = threading.Lock()
+        consumed = []
+
+        def items():
+            for i in range(100):
+                with lock:
+                    consumed.append(i)
+                yield i
+
+        generator = BatchExecutor(max_workers=2).run(lambda x: x, items())
+        next(generator)
+        self.assertLessEqual(len(consumed), 6)
+        generator.close()
+
+    def test_invalid_max_workers(self):
+        self.assertRaises(AssertionError, BatchExecutor, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
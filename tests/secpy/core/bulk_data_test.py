@@ -1,8 +1,17 @@
+import json
+import shutil
+import tempfile
 import unittest
 import os
+from unittest.mock import patch
 
-from secpy.core.bulk_data import BulkDataFileObject
-from tests.testutils.mock_utils import mock_company_tickers_exchange, RESOURCES
+from secpy.company_facts import CompanyFactsBulkEndpoint
+from secpy.bulk_data_store import BulkDataStore
+from secpy.core.bulk_data import BulkDataEndpoint, BulkDataFileObject, BulkDataSyncResult
+from secpy.core.resumable_downloader import ResumableDownloader
+from secpy.core.utils.network_client_opts import NetworkClientOpts
+from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap, ExchangeEnum
+from tests.testutils.mock_utils import mock_company_tickers_exchange, mock_shared_company_tickers_exchange, RESOURCES
 from zipfile import ZipFile
 
 
@@ -16,6 +25,7 @@ class BulkDataFileObjectTest(unittest.TestCase):
                                         "bulk_submissions.zip")
 
     bulk_data_archive_test_path = os.path.join(RESOURCES, "bulk_submissions.zip")
+    company_tickers_exchange = company_tickers_exchange
 
     def test_bulk_data_file_object_mappings(self):
         bulk_data_file_object = BulkDataFileObject(self.bulk_data_archive_test_path, self.company_tickers_exchange)
@@ -43,5 +53,224 @@ class BulkDataFileObjectTest(unittest.TestCase):
         self.assertTrue(bulk_data_file_object.archive_exists)
 
 
+def get_entity_name(company_facts):
+    return company_facts.entity_name
+
+
+def is_abbott(company_facts):
+    return company_facts.cik == "0000001800"
+
+
+def count_companies(accumulator, company_facts):
+    return accumulator + 1
+
+
+def add(a, b):
+    return a + b
+
+
+class BulkDataEndpointTest(unittest.TestCase):
+    bulk_data_archive_test_path = os.path.join(RESOURCES, "bulk_submissions.zip")
+
+    def setUp(self):
+        mock_shared_company_tickers_exchange()
+        self.bulk_company_facts = CompanyFactsBulkEndpoint("/", existing_archive=self.bulk_data_archive_test_path)
+
+    def tearDown(self):
+        TickerCompanyExchangeMap.reset_shared()
+
+    def test_for_each_company(self):
+        expected_entity_names = self.bulk_company_facts.for_each_company(get_entity_name)
+        self.assertEqual(len(expected_entity_names), 5)
+        self.assertListEqual(self.bulk_company_facts.for_each_company(get_entity_name, processes=2, chunksize=2), expected_entity_names)
+
+    def test_filter_companies(self):
+        actual_company_facts = list(self.bulk_company_facts.filter_companies(is_abbott, processes=2))
+        self.assertEqual([company_facts.entity_name for company_facts in actual_company_facts], ["ABBOTT LABORATORIES"])
+
+    def test_invalid_json_decoder(self):
+        with patch("secpy.core.bulk_data.NetworkClientOpts", wraps=NetworkClientOpts) as mock_network_client_opts:
+            CompanyFactsBulkEndpoint("/", existing_archive=self.bulk_data_archive_test_path)
+        mock_network_client_opts.get_json_decoder.assert_called_once_with(None)
+        self.assertRaises(AssertionError, CompanyFactsBulkEndpoint, "/", existing_archive=self.bulk_data_archive_test_path, json_decoder="orjson")
+
+    def test_filter_companies_lazy(self):
+        bulk_company_facts = CompanyFactsBulkEndpoint("/", existing_archive=self.bulk_data_archive_test_path, lazy=True)
+        actual_company_facts = list(bulk_company_facts.filter_companies(is_abbott, processes=2))
+        self.assertEqual(len(actual_company_facts), 1)
+        self.assertTrue(actual_company_facts[0].lazy)
+        self.assertListEqual(actual_company_facts[0].get_concept("us_gaap", "Assets").list_units(), ["USD"])
+
+    def test_iter_companies(self):
+        all_companies = self.bulk_company_facts.iter_companies()
+        self.assertNotIsInstance(all_companies, list)
+        self.assertEqual([company_facts.cik for company_facts in all_companies], ["0000001750", "0000001800", "0000001961", "0000002034", "0000002098"])
+
+        def get_ciks(**kwargs):
+            return [company_facts.cik for company_facts in self.bulk_company_facts.iter_companies(**kwargs)]
+
+        self.assertEqual(get_ciks(ciks=[1800, "0000002034"]), ["0000001800", "0000002034"])
+        self.assertEqual(get_ciks(tickers=["ACU"], ciks=["1750"]), ["0000001750", "0000002098"])
+        self.assertEqual(get_ciks(exchanges=[ExchangeEnum.NYSE]), ["0000001750", "0000001800", "0000002098"])
+        self.assertEqual(get_ciks(exchanges=[ExchangeEnum.OTC, ExchangeEnum.NASDAQ]), ["0000001961"])
+        self.assertEqual(get_ciks(ciks=[1961, 1800], exchanges=[ExchangeEnum.NYSE]), ["0000001800"])
+        self.assertEqual(get_ciks(ciks=[]), [])
+        self.assertRaises(KeyError, get_ciks, tickers=["NOT_A_TICKER"])
+
+    def test_iter_companies_only_reads_selected_files(self):
+        with patch.object(BulkDataFileObject, "get_file", wraps=self.bulk_company_facts.bulk_data_file_object.get_file) as mock_get_file:
+            list(self.bulk_company_facts.iter_companies(tickers=["ABT"]))
+        mock_get_file.assert_called_once_with("CIK0000001800.json")
+
+    def test_iter_concept_facts(self):
+        concept_facts = list(self.bulk_company_facts.iter_concept_facts(["us-gaap:Assets"], exchanges=[ExchangeEnum.NYSE]))
+        self.assertListEqual(sorted({unit.cik for unit in concept_facts}), ["0000001750", "0000001800", "0000002098"])
+        expected = self.bulk_company_facts.get_data_for_ticker_from_archive("ABT").get_concept("us_gaap", "Assets").get_unit("USD")
+        abbott_assets = [unit for unit in concept_facts if unit.cik == "0000001800"]
+        self.assertEqual(len(abbott_assets), 1)
+        self.assertListEqual(abbott_assets[0].facts, expected)
+
+    def test_iter_partial_company_facts(self):
+        partial_company_facts = list(self.bulk_company_facts.iter_partial_company_facts(["Assets", "LiabilitiesCurrent"], tickers=["ABT"]))
+        self.assertEqual(len(partial_company_facts), 1)
+        self.assertEqual(partial_company_facts[0].entity_name, "ABBOTT LABORATORIES")
+        self.assertListEqual(partial_company_facts[0].list_concepts("us_gaap"), ["Assets", "LiabilitiesCurrent"])
+
+    def test_reduce_companies(self):
+        self.assertEqual(self.bulk_company_facts.reduce_companies(count_companies, 0, add, processes=2, chunksize=2), 5)
+
+
+class BulkDataSyncTest(unittest.TestCase):
+    bulk_data_archive_test_path = os.path.join(RESOURCES, "bulk_submissions.zip")
+
+    def setUp(self):
+        mock_shared_company_tickers_exchange()
+        self.temp_dir = tempfile.mkdtemp()
+        self.archive_path = os.path.join(self.temp_dir, "companyfacts.zip")
+        with ZipFile(self.bulk_data_archive_test_path) as zip_file:
+            self.members = {filename: json.loads(zip_file.read(filename)) for filename in zip_file.namelist()}
+
+    def tearDown(self):
+        TickerCompanyExchangeMap.reset_shared()
+        shutil.rmtree(self.temp_dir)
+
+    def __write_archive(self, members):
+        path = os.path.join(self.temp_dir, "{}.zip".format(len(os.listdir(self.temp_dir))))
+        with ZipFile(path, "w") as zip_file:
+            for filename, data in members.items():
+                zip_file.writestr(filename, json.dumps(data))
+        return path
+
+    def __get_next_archive(self):
+        next_members = dict(self.members)
+        del next_members["CIK0000001961.json"]
+        modified = dict(next_members["CIK0000001800.json"], entityName="ABBOTT LABORATORIES INC")
+        next_members["CIK0000001800.json"] = modified
+        next_members["CIK0000009999.json"] = dict(self.members["CIK0000001961.json"], cik=9999)
+        return self.__write_archive(next_members)
+
+    def __sync(self, source_archive, store=None):
+        bulk_company_facts = CompanyFactsBulkEndpoint("/")
+
+        def mock_download(endpoint, target_path, **kwargs):
+            shutil.copy(source_archive, target_path)
+
+        with patch.object(bulk_company_facts, "_validate_path_and_download_file", side_effect=mock_download):
+            return bulk_company_facts, bulk_company_facts.sync_bulk_data(self.archive_path, store)
+
+    def test_sync_bulk_data_against_archive(self):
+        first_archive = self.__write_archive(self.members)
+        _, result = self.__sync(first_archive)
+        self.assertEqual(result.added_ciks, ["0000001750", "0000001800", "0000001961", "0000002034", "0000002098"])
+        self.assertEqual(result.modified_ciks, [])
+        self.assertTrue(os.path.exists(self.archive_path))
+        self.assertFalse(os.path.exists(self.archive_path + ".download"))
+
+        _, result = self.__sync(first_archive)
+        self.assertFalse(result.has_changes())
+
+        bulk_company_facts, result = self.__sync(self.__get_next_archive())
+        self.assertEqual(result.added_ciks, ["0000009999"])
+        self.assertEqual(result.modified_ciks, ["0000001800"])
+        self.assertEqual(result.removed_ciks, ["0000001961"])
+        self.assertEqual(result.changed_ciks, ["0000001800", "0000009999"])
+        self.assertEqual(bulk_company_facts.get_data_for_ticker_from_archive("ABT").entity_name, "ABBOTT LABORATORIES INC")
+
+    def test_sync_bulk_data_against_store(self):
+        with BulkDataStore(os.path.join(self.temp_dir, "secpy.db")) as store:
+            _, result = self.__sync(self.__write_archive(self.members), store)
+            self.assertEqual(len(result.added_ciks), 5)
+            self.assertEqual(len(store.list_ciks()), 5)
+
+            # the store is compared against, so a missing archive doesn't cause a full reload
+            os.remove(self.archive_path)
+            with patch.object(store, "ingest_company_facts", wraps=store.ingest_company_facts) as mock_ingest:
+                _, result = self.__sync(self.__get_next_archive(), store)
+            mock_ingest.assert_called_once()
+            self.assertEqual(mock_ingest.call_args[0][1], {"0000001800", "0000009999"})
+            self.assertEqual(store.list_ciks(), ["0000001750", "0000001800", "0000002034", "0000002098", "0000009999"])
+            self.assertEqual(store.get_company_facts("1800").entity_name, "ABBOTT LABORATORIES INC")
+
+    def __download(self, bulk_company_facts, **kwargs):
+        with patch.object(bulk_company_facts, "_validate_path_and_download_file",
+                          side_effect=lambda endpoint, target_path, **_: shutil.copy(self.bulk_data_archive_test_path, target_path)):
+            return bulk_company_facts.download_bulk_data(**kwargs)
+
+    def test_download_bulk_data_from_two_instances(self):
+        first = self.__download(CompanyFactsBulkEndpoint("/"))
+        second = self.__download(CompanyFactsBulkEndpoint("/"))
+        first_path = first.bulk_data_file_object.archive_path
+        second_path = second.bulk_data_file_object.archive_path
+        self.assertNotEqual(first_path, second_path)
+        self.assertTrue(first.bulk_data_file_object.archive_exists())
+        self.assertEqual(first.get_data_for_ticker_from_archive("ABT").cik, second.get_data_for_ticker_from_archive("ABT").cik)
+
+        del second
+        self.assertFalse(os.path.exists(second_path))
+        self.assertTrue(os.path.exists(first_path))
+        del first
+        self.assertFalse(os.path.exists(first_path))
+
+    def test_download_bulk_data_failure_removes_temp_archive(self):
+        bulk_company_facts = CompanyFactsBulkEndpoint("/")
+        target_paths = []
+
+        def mock_download(endpoint, target_path, **kwargs):
+            target_paths.append(target_path)
+            with open(target_path + ResumableDownloader.PART_SUFFIX, "wb") as file:
+                file.write(b"partial")
+            raise IOError("Connection broken")
+
+        with patch.object(bulk_company_facts, "_validate_path_and_download_file", side_effect=mock_download):
+            self.assertRaises(IOError, bulk_company_facts.download_bulk_data)
+        self.assertFalse(os.path.exists(target_paths[0]))
+        self.assertFalse(os.path.exists(target_paths[0] + ResumableDownloader.PART_SUFFIX))
+
+    def test_download_bulk_data_to_archive_path(self):
+        bulk_company_facts = self.__download(CompanyFactsBulkEndpoint("/"), archive_path=self.archive_path)
+        self.assertEqual(bulk_company_facts.bulk_data_file_object.archive_path, self.archive_path)
+        del bulk_company_facts
+        self.assertTrue(os.path.exists(self.archive_path))
+
+    def test_endpoint_wo_store_methods_cannot_be_instantiated(self):
+        class IncompleteBulkEndpoint(BulkDataEndpoint):
+            def _get_parser(self):
+                return dict
+
+            def _ingest_archive(self, store, archive_path, ciks=None):
+                return 0
+
+        self.assertRaises(TypeError, IncompleteBulkEndpoint, "/")
+
+    def test_sync_result_from_member_signatures(self):
+        previous = {"CIK0000000001.json": (1, 10), "CIK0000000001-submissions-001.json": (2, 20), "CIK0000000002.json": (3, 30)}
+        current = {"CIK0000000001.json": (1, 10), "CIK0000000001-submissions-001.json": (4, 20), "CIK0000000002.json": (3, 30),
+                   "README.txt": (5, 50)}
+        result = BulkDataSyncResult.from_member_signatures(previous, current)
+        self.assertEqual((result.added_ciks, result.modified_ciks, result.removed_ciks), ([], ["0000000001"], []))
+        del current["CIK0000000001-submissions-001.json"]
+        self.assertEqual(BulkDataSyncResult.from_member_signatures(previous, current).modified_ciks, ["0000000001"])
+
+
 if __name__ == '__main__':
     unittest.main()
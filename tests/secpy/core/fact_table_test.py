@@ -0,0 +1,96 @@
+import json
+import os
+import unittest
+
+import numpy as np
+
+from secpy.company_facts import CompanyFacts, Fact
+from secpy.core.fact_table import FactTable
+from tests.testutils.mock_utils import RESOURCES
+
+with open(os.path.join(RESOURCES, "company_facts.json"), "r") as f:
+    COMPANY_FACTS_DATA = json.load(f)
+
+ASSETS_DATA = COMPANY_FACTS_DATA["facts"]["us-gaap"]["Assets"]["units"]["USD"]
+EPS_DATA = COMPANY_FACTS_DATA["facts"]["us-gaap"]["EarningsPerShareBasic"]["units"]["USD/shares"]
+FACT_ATTRIBUTES = ["concept_name", "unit", "start", "end", "value", "accn", "fiscal_year", "fiscal_period", "form", "filed", "frame"]
+
+
+class FactTableTest(unittest.TestCase):
+    def assertRowsMatchFacts(self, rows, facts):
+        self.assertEqual(len(rows), len(facts))
+        for row, fact in zip(rows, facts):
+            for attribute in FACT_ATTRIBUTES:
+                self.assertEqual(getattr(row, attribute), getattr(fact, attribute), attribute)
+
+    def test_rows_match_facts(self):
+        for data, unit in [(ASSETS_DATA, "USD"), (EPS_DATA, "USD/shares")]:
+            table = FactTable(data, "Concept", unit)
+            facts = [Fact(fact_data, "Concept", unit) for fact_data in data]
+            self.assertRowsMatchFacts(list(table), facts)
+            self.assertEqual(table[-1].value, facts[-1].value)
+            self.assertEqual(table[0].get_form_frame(), facts[0].get_form_frame())
+        self.assertIsInstance(FactTable(ASSETS_DATA, "Assets", "USD")[0].value, int)
+        self.assertRaises(IndexError, FactTable(ASSETS_DATA, "Assets", "USD").__getitem__, len(ASSETS_DATA))
+
+    def test_columns(self):
+        table = FactTable(ASSETS_DATA, "Assets", "USD")
+        self.assertEqual(table.value.dtype, np.float64)
+        self.assertEqual(table.fiscal_year.dtype, np.int32)
+        self.assertEqual(table.end.dtype, np.dtype("datetime64[D]"))
+        self.assertTrue(np.isnat(table.start).all())
+        self.assertEqual(len(table.form_categories), 2)
+        self.assertListEqual(list(table.form), [fact["form"] for fact in ASSETS_DATA])
+        self.assertListEqual(list(table.frame), [fact.get("frame") for fact in ASSETS_DATA])
+
+    def test_filter(self):
+        table = FactTable(ASSETS_DATA, "Assets", "USD")
+        ten_k = table.filter(form="10-K")
+        self.assertListEqual([row.accn for row in ten_k], [fact["accn"] for fact in ASSETS_DATA if fact["form"] == "10-K"])
+        self.assertEqual(len(table.filter(form="8-K")), 0)
+        self.assertEqual(len(table.filter(fiscal_period="Q2", fiscal_year=2021)), 2)
+        self.assertEqual(len(table.filter(has_frame=True)), 5)
+        self.assertEqual(len(table.filter(has_frame=False)), 5)
+        self.assertListEqual([row.end for row in table.filter(start_date="2020-09-30", end_date="2020-12-31")], ["2020-09-30", "2020-12-31"])
+        self.assertEqual(len(table.filter(filed_after="2021-01-01", filed_before="2021-04-27")), 4)
+
+    def test_sort_by(self):
+        table = FactTable(ASSETS_DATA, "Assets", "USD")
+        by_value = table.sort_by("value", descending=True)
+        self.assertListEqual([row.value for row in by_value], sorted([fact["val"] for fact in ASSETS_DATA], reverse=True))
+        by_end_filed = table.sort_by("end", "filed")
+        self.assertListEqual([(row.end, row.filed) for row in by_end_filed],
+                             sorted((fact["end"], fact["filed"]) for fact in ASSETS_DATA))
+        for column in ["form", "fiscal_period", "accn", "frame"]:
+            self.assertRaises(AssertionError, table.sort_by, column)
+
+    def test_accn(self):
+        table = FactTable(ASSETS_DATA, "Assets", "USD")
+        self.assertEqual(table.accn.dtype, object)
+        self.assertListEqual(table.accn.tolist(), [fact["accn"] for fact in ASSETS_DATA])
+        self.assertListEqual([row.accn for row in table[::-1]], [fact["accn"] for fact in ASSETS_DATA][::-1])
+
+    def test_latest(self):
+        table = FactTable(ASSETS_DATA, "Assets", "USD")
+        self.assertEqual(table.latest().end, "2021-06-30")
+        self.assertEqual(table.latest_value(), 333779000000)
+        self.assertEqual(table.latest(filed_before="2021-02-01").end, "2020-12-31")
+        self.assertIsNone(table.latest(form="8-K"))
+
+    def test_columnar_company_facts(self):
+        company_facts = CompanyFacts(COMPANY_FACTS_DATA, columnar=True)
+        assets = company_facts.taxonomies.us_gaap.Assets.units.USD
+        self.assertIsInstance(assets, FactTable)
+        self.assertEqual(assets[0].value, 286556000000)
+
+        lazy_company_facts = CompanyFacts(COMPANY_FACTS_DATA, lazy=True, columnar=True)
+        self.assertIsInstance(lazy_company_facts.get_concept("us_gaap", "Assets").get_unit("USD"), FactTable)
+
+        eager_statements = CompanyFacts(COMPANY_FACTS_DATA).get_statement_history().get_all_statements()
+        columnar_statements = company_facts.get_statement_history().get_all_statements()
+        self.assertListEqual([(statement.form, statement.filed, statement.end) for statement in columnar_statements],
+                             [(statement.form, statement.filed, statement.end) for statement in eager_statements])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import json
+import os
+import unittest
+
+from secpy.core.json_decoder import JsonDecoder
+from secpy.core.network_client import NetworkClient
+from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
+
+RESOURCES = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+
+
+class JsonDecoderTest(unittest.TestCase):
+    def setUp(self):
+        JsonDecoder.reset_shared()
+
+    def tearDown(self):
+        JsonDecoder.reset_shared()
+
+    def test_default_backend_is_fastest_available(self):
+        available = JsonDecoder.get_available_backends()
+        self.assertEqual(available[-1], "json")
+        self.assertEqual(JsonDecoder().backend, available[0])
+
+    def test_backends_decode_fixtures_identically(self):
+        for filename in ("company_facts.json", "submissions.json", "company_tickers_exchange.json"):
+            with open(os.path.join(RESOURCES, filename), "rb") as f:
+                content = f.read()
+            expected = json.loads(content)
+            for backend in JsonDecoder.get_available_backends():
+                with self.subTest(filename=filename, backend=backend):
+                    decoder = JsonDecoder(backend)
+                    self.assertEqual(decoder.loads(content), expected)
+                    self.assertEqual(decoder.loads(content.decode("utf-8")), expected)
+
+    def test_invalid_document(self):
+        for backend in JsonDecoder.get_available_backends():
+            with self.subTest(backend=backend):
+                self.assertRaises(ValueError, JsonDecoder(backend).loads, b'{"cik": ')
+
+    def test_invalid_backend(self):
+        self.assertRaises(AssertionError, JsonDecoder, "yaml")
+
+    def test_shared(self):
+        self.assertIs(JsonDecoder.shared(), JsonDecoder.shared())
+
+    def test_clients_require_a_json_decoder(self):
+        self.assertRaises(AssertionError, NetworkClient, "test-agent", json_decoder="orjson")
+        self.assertRaises(AssertionError, TickerCompanyExchangeMap, "test-agent", json_decoder="orjson")
+        decoder = JsonDecoder("json")
+        self.assertIs(NetworkClient("test-agent", json_decoder=decoder)._json_decoder, decoder)
+
+
+if __name__ == '__main__':
+    unittest.main()
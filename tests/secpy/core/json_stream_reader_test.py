@@ -0,0 +1,48 @@
+import io
+import json
+import unittest
+
+from secpy.core.json_stream_reader import JsonStreamReader
+
+DOCUMENT = {
+    "name": "a \"quoted\" name w/ {braces} and [brackets] \\ and unicode é中",
+    "skipped": {"nested": [1, 2.5, {"deep": ["]", "}"]}], "empty": {}, "values": [True, False, None]},
+    "numbers": [1234567890123, -1.5e-3, 0],
+    "empty_object": {},
+    "last": 42
+}
+
+
+class JsonStreamReaderTest(unittest.TestCase):
+    def __get_reader(self, chunk_size, binary=True):
+        text = json.dumps(DOCUMENT, indent=2, ensure_ascii=False)
+        stream = io.BytesIO(text.encode("utf-8")) if binary else io.StringIO(text)
+        return JsonStreamReader(stream, chunk_size=chunk_size)
+
+    def test_read_and_skip(self):
+        # every chunk size splits the document at different points, ie in the middle of strings, escapes and numbers
+        for chunk_size in [1, 2, 3, 7, 64, 4096]:
+            for binary in [True, False]:
+                reader = self.__get_reader(chunk_size, binary)
+                actual = {}
+                for key in reader.iter_object():
+                    if key == "skipped":
+                        reader.skip_value()
+                    elif key == "empty_object":
+                        actual[key] = list(reader.iter_object())
+                    else:
+                        actual[key] = reader.read_value()
+                self.assertEqual(actual, {"name": DOCUMENT["name"], "numbers": DOCUMENT["numbers"], "empty_object": [], "last": 42},
+                                 "chunk_size={}, binary={}".format(chunk_size, binary))
+                self.assertEqual(reader.peek(), "")
+
+    def test_invalid_documents(self):
+        self.assertRaises(ValueError, lambda: list(JsonStreamReader(io.StringIO('{"a" 1}')).iter_object()))
+        self.assertRaises(ValueError, lambda: list(JsonStreamReader(io.StringIO('[1, 2]')).iter_object()))
+        reader = JsonStreamReader(io.StringIO('{"a": [1, 2'), chunk_size=2)
+        next(reader.iter_object())
+        self.assertRaises(ValueError, reader.skip_value)
+
+
+if __name__ == '__main__':
+    unittest.main()
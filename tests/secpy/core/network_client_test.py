@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import patch, Mock
+
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.network_client import NetworkClient
+
+
+class NetworkClientTest(unittest.TestCase):
+    def setUp(self):
+        NetworkClient.reset_shared_state()
+
+    def tearDown(self):
+        NetworkClient.reset_shared_state()
+
+    def test_shared_session_per_user_agent(self):
+        nwc1 = NetworkClient("test-agent-1")
+        nwc2 = NetworkClient("test-agent-1")
+        nwc3 = NetworkClient("test-agent-2")
+        self.assertIs(nwc1._session, nwc2._session)
+        self.assertIsNot(nwc1._session, nwc3._session)
+        self.assertEqual(nwc3._session.headers["User-Agent"], "test-agent-2")
+
+    def test_shared_rate_limiter(self):
+        nwc1 = NetworkClient("test-agent-1")
+        nwc2 = NetworkClient("test-agent-2", max_requests_per_sec=5)
+        self.assertIs(nwc1._rate_limiter.parent, nwc2._rate_limiter.parent)
+        # a slower client doesn't lower the rate of the other clients in the process
+        self.assertEqual(nwc1._rate_limiter.max_calls_per_sec, 10)
+        self.assertEqual(nwc2._rate_limiter.max_calls_per_sec, 5)
+        self.assertEqual(NetworkClient("test-agent-3")._rate_limiter.max_calls_per_sec, 10)
+
+    def test_invalid_max_requests_per_sec(self):
+        self.assertRaises(AssertionError, NetworkClient, "test-agent", max_requests_per_sec=11)
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_make_request_json(self, mock_get):
+        mock_get.return_value = Mock(ok=True, content=b'{"cik": 320193}')
+        nwc = NetworkClient("test-agent")
+        actual = nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193")
+        self.assertEqual(actual, {"cik": 320193})
+        self.assertEqual(mock_get.call_args[0][0], "https://data.sec.gov/submissions/CIK0000320193.json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from secpy.company_facts import CompanyFacts
+from secpy.core.json_decoder import JsonDecoder
+from secpy.core.parallel_bulk_processor import ParallelBulkProcessor
+from tests.testutils.mock_utils import RESOURCES
+
+BULK_ARCHIVE = os.path.join(RESOURCES, "bulk_submissions.zip")
+FILENAMES = [file.filename for file in ZipFile(BULK_ARCHIVE).filelist]
+
+
+def get_cik(company_facts):
+    return company_facts.cik
+
+
+def has_ticker_like_name(company_facts):
+    return company_facts.entity_name.startswith("A")
+
+
+def count_concepts(accumulator, company_facts):
+    return accumulator + sum(len(company_facts.list_concepts(taxonomy)) for taxonomy in company_facts.list_taxonomies())
+
+
+def add(a, b):
+    return a + b
+
+
+class ParallelBulkProcessorTest(unittest.TestCase):
+    def setUp(self):
+        with ZipFile(BULK_ARCHIVE) as zip_file:
+            self.company_facts = [CompanyFacts(json.loads(zip_file.read(filename))) for filename in FILENAMES]
+
+    def test_map(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=2, chunksize=2)
+        self.assertListEqual(list(processor.map(get_cik, FILENAMES)), [get_cik(company_facts) for company_facts in self.company_facts])
+        self.assertListEqual(sorted(processor.map(get_cik, FILENAMES, ordered=False)), sorted(get_cik(company_facts) for company_facts in self.company_facts))
+
+    def test_filter(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=2, chunksize=1)
+        actual_ciks = [company_facts.cik for company_facts in processor.filter(has_ticker_like_name, FILENAMES)]
+        expected_ciks = [company_facts.cik for company_facts in self.company_facts if has_ticker_like_name(company_facts)]
+        self.assertListEqual(actual_ciks, expected_ciks)
+
+    def test_reduce(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=2, chunksize=2)
+        expected = 0
+        for company_facts in self.company_facts:
+            expected = count_concepts(expected, company_facts)
+        self.assertEqual(processor.reduce(count_concepts, 0, add, FILENAMES), expected)
+        self.assertEqual(processor.reduce(count_concepts, 0, add, []), 0)
+
+    def test_close_early(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=1, chunksize=1)
+        results = processor.map(get_cik, FILENAMES)
+        self.assertEqual(next(results), self.company_facts[0].cik)
+        results.close()
+
+    def test_bounded_chunks_in_flight(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=1, chunksize=1)
+        with patch.object(ProcessPoolExecutor, "submit", autospec=True, side_effect=ProcessPoolExecutor.submit) as mock_submit:
+            results = processor.map(get_cik, FILENAMES)
+            self.assertEqual(next(results), self.company_facts[0].cik)
+            # 2 chunks per process are submitted up front and one more once the first result is consumed
+            self.assertEqual(mock_submit.call_count, 3)
+            self.assertListEqual(list(results), [get_cik(company_facts) for company_facts in self.company_facts[1:]])
+        self.assertEqual(mock_submit.call_count, len(FILENAMES))
+
+    def test_json_decoder(self):
+        processor = ParallelBulkProcessor(BULK_ARCHIVE, CompanyFacts, processes=2, chunksize=2, json_decoder=JsonDecoder("json"))
+        self.assertEqual(processor.json_decoder.backend, "json")
+        self.assertListEqual(list(processor.map(get_cik, FILENAMES)), [get_cik(company_facts) for company_facts in self.company_facts])
+
+    def test_invalid_args(self):
+        self.assertRaises(AssertionError, ParallelBulkProcessor, BULK_ARCHIVE, CompanyFacts, processes=0)
+        self.assertRaises(AssertionError, ParallelBulkProcessor, BULK_ARCHIVE, CompanyFacts, chunksize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
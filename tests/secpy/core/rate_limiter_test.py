@@ -0,0 +1,64 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from secpy.core.rate_limiter import TokenBucketRateLimiter
+
+
+class TokenBucketRateLimiterTest(unittest.TestCase):
+    def test_reserve_spaces_out_calls(self):
+        rate_limiter = TokenBucketRateLimiter(10)
+        waits = [rate_limiter.reserve() for _ in range(5)]
+        self.assertEqual(waits[0], 0.0)
+        for i in range(1, 5):
+            self.assertAlmostEqual(waits[i], i / 10, delta=0.02)
+
+    def test_burst(self):
+        rate_limiter = TokenBucketRateLimiter(10, burst=3)
+        waits = [rate_limiter.reserve() for _ in range(4)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 0.1, delta=0.02)
+
+    def test_parent_bounds_children(self):
+        parent = TokenBucketRateLimiter(10)
+        slow, fast = TokenBucketRateLimiter(5, parent=parent), TokenBucketRateLimiter(10, parent=parent)
+        self.assertEqual(slow.reserve(), 0.0)
+        # fast is only held back by the parent, slow by its own rate
+        self.assertAlmostEqual(fast.reserve(), 0.1, delta=0.02)
+        self.assertAlmostEqual(slow.reserve(), 0.2, delta=0.02)
+        self.assertAlmostEqual(fast.reserve(), 0.3, delta=0.02)
+        self.assertEqual(parent.max_calls_per_sec, 10)
+
+    def test_shared(self):
+        TokenBucketRateLimiter.reset_shared()
+        shared = TokenBucketRateLimiter.shared()
+        self.assertIs(shared, TokenBucketRateLimiter.shared())
+        self.assertEqual(shared.max_calls_per_sec, TokenBucketRateLimiter.SHARED_MAX_CALLS_PER_SEC)
+        TokenBucketRateLimiter.reset_shared()
+
+    def test_acquire_across_threads(self):
+        rate_limiter = TokenBucketRateLimiter(50)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: rate_limiter.acquire(), range(11)))
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_acquire_async(self):
+        rate_limiter = TokenBucketRateLimiter(50)
+
+        async def acquire_all():
+            await asyncio.gather(*[rate_limiter.acquire_async() for _ in range(11)])
+
+        start = time.monotonic()
+        asyncio.run(acquire_all())
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_invalid_args(self):
+        self.assertRaises(AssertionError, TokenBucketRateLimiter, 0)
+        self.assertRaises(AssertionError, TokenBucketRateLimiter, 10, 0)
+        self.assertRaises(AssertionError, TokenBucketRateLimiter, 10, 1, 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.network_client import NetworkClient
+from secpy.core.response_cache import ResponseCache
+
+SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    @staticmethod
+    def get_entry_sizes(cache_dir):
+        return [os.path.getsize(os.path.join(cache_dir, filename)) for filename in os.listdir(cache_dir)]
+
+    def test_put_and_get(self):
+        cache = ResponseCache(self.cache_dir.name)
+        cache.put(SUBMISSIONS_URL, b'{"cik": 320193}', etag='"abc"')
+
+        entry = ResponseCache(self.cache_dir.name).get(SUBMISSIONS_URL)
+        self.assertEqual(entry.body, b'{"cik": 320193}')
+        self.assertEqual(entry.conditional_headers(), {"If-None-Match": '"abc"'})
+        self.assertIsNone(cache.get("https://data.sec.gov/submissions/CIK0000789019.json"))
+
+    def test_entries_are_compressed(self):
+        cache = ResponseCache(self.cache_dir.name)
+        body = b'{"facts": ' + b'"x"' * 10000 + b"}"
+        cache.put(SUBMISSIONS_URL, body)
+        filenames = os.listdir(self.cache_dir.name)
+        self.assertEqual(len(filenames), 1)
+        self.assertFalse(filenames[0].endswith(".gz"))
+        with open(os.path.join(self.cache_dir.name, filenames[0]), "rb") as f:
+            compressed = f.read()
+        self.assertLess(len(compressed), len(body))
+        # the first 8 bytes of an entry are its uncompressed stored_at
+        self.assertTrue(gzip.decompress(compressed[8:]).endswith(body))
+
+    def test_is_fresh(self):
+        cache = ResponseCache(self.cache_dir.name, ttls={EndpointEnum.SUBMISSIONS_CIK: 0})
+        entry = cache.put(SUBMISSIONS_URL, b"{}")
+        self.assertFalse(cache.is_fresh(EndpointEnum.SUBMISSIONS_CIK, entry))
+        self.assertTrue(cache.is_fresh(EndpointEnum.COMPANY_FACTS, entry))
+        self.assertFalse(cache.is_cacheable(EndpointEnum.COMPANY_TICKER_EXCHANGE))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(self.cache_dir.name, compression_level=0)
+        urls = ["https://data.sec.gov/submissions/CIK000000000{}.json".format(i) for i in range(3)]
+        for url in urls:
+            cache.put(url, b"x" * 1000)
+            time.sleep(0.01)
+        cache.get(urls[0])
+        time.sleep(0.01)
+
+        # room for every entry but urls[1], the least recently used one, once the new entry is added
+        new_url = "https://data.sec.gov/submissions/CIK0000000009.json"
+        with tempfile.TemporaryDirectory() as other_dir:
+            ResponseCache(other_dir, compression_level=0).put(new_url, b"x" * 1000)
+            new_entry_size = self.get_entry_sizes(other_dir)[0]
+        entry_sizes = self.get_entry_sizes(self.cache_dir.name)
+        self.assertEqual(len(set(entry_sizes)), 1)
+        cache.max_size = sum(entry_sizes) - entry_sizes[0] + new_entry_size
+        cache.put(new_url, b"x" * 1000)
+        self.assertEqual(cache.size(), cache.max_size)
+        self.assertIsNotNone(cache.get(urls[0]))
+        self.assertIsNone(cache.get(urls[1]))
+        self.assertIsNotNone(cache.get(urls[2]))
+
+    def test_eviction_counts_entries_of_other_caches(self):
+        # another cache on the same directory stands in for another process
+        cache = ResponseCache(self.cache_dir.name, compression_level=0)
+        other_cache = ResponseCache(self.cache_dir.name, compression_level=0)
+        urls = ["https://data.sec.gov/submissions/CIK000000000{}.json".format(i) for i in range(4)]
+        other_cache.put(urls[0], b"x" * 1000)
+        time.sleep(0.01)
+        entry_size = self.get_entry_sizes(self.cache_dir.name)[0]
+        cache.max_size = 2 * entry_size + entry_size // 2
+        for url in urls[1:3]:
+            cache.put(url, b"x" * 1000)
+            time.sleep(0.01)
+        # cache_dir isn't rescanned while the entries tracked by this cache fit in max_size
+        self.assertEqual(cache.size(), 2 * entry_size)
+
+        cache.put(urls[3], b"x" * 1000)
+        self.assertEqual(cache.size(), 2 * entry_size)
+        self.assertIsNone(other_cache.get(urls[0]))
+        self.assertIsNone(other_cache.get(urls[1]))
+        self.assertIsNotNone(other_cache.get(urls[2]))
+
+    def test_refresh_in_place(self):
+        cache = ResponseCache(self.cache_dir.name)
+        entry = cache.put(SUBMISSIONS_URL, b'{"cik": 320193}', etag='"abc"')
+        path = os.path.join(self.cache_dir.name, os.listdir(self.cache_dir.name)[0])
+        with open(path, "rb") as f:
+            before = f.read()
+        entry.stored_at -= 1000
+
+        refreshed = cache.refresh(entry)
+        with open(path, "rb") as f:
+            after = f.read()
+        self.assertGreater(refreshed.stored_at, time.time() - 100)
+        self.assertEqual(after[8:], before[8:])
+        reloaded = ResponseCache(self.cache_dir.name).get(SUBMISSIONS_URL)
+        self.assertEqual((reloaded.body, reloaded.etag, reloaded.stored_at), (entry.body, '"abc"', refreshed.stored_at))
+
+    def test_refresh_evicted_entry(self):
+        cache = ResponseCache(self.cache_dir.name)
+        entry = cache.put(SUBMISSIONS_URL, b"{}")
+        cache.clear()
+        cache.refresh(entry)
+        self.assertEqual(cache.get(SUBMISSIONS_URL).body, b"{}")
+
+    def test_clear(self):
+        cache = ResponseCache(self.cache_dir.name)
+        cache.put(SUBMISSIONS_URL, b"{}")
+        cache.clear()
+        self.assertEqual(cache.size(), 0)
+        self.assertIsNone(cache.get(SUBMISSIONS_URL))
+
+
+class NetworkClientResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        NetworkClient.reset_shared_state()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+        NetworkClient.reset_shared_state()
+
+    @staticmethod
+    def mock_response(status_code=200, content=b'{"cik": 320193}', headers=None):
+        return Mock(ok=True, status_code=status_code, content=content, headers=headers or {})
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_fresh_entry_is_served_from_cache(self, mock_get):
+        mock_get.return_value = self.mock_response()
+        nwc = NetworkClient("test-agent", cache=ResponseCache(self.cache_dir.name))
+        self.assertEqual(nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193"), {"cik": 320193})
+        self.assertEqual(nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193"), {"cik": 320193})
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_stale_entry_is_revalidated(self, mock_get):
+        cache = ResponseCache(self.cache_dir.name, ttls={EndpointEnum.SUBMISSIONS_CIK: 0})
+        nwc = NetworkClient("test-agent", cache=cache)
+        mock_get.return_value = self.mock_response(headers={"ETag": '"abc"'})
+        nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193")
+
+        mock_get.return_value = self.mock_response(status_code=304, content=b"")
+        self.assertEqual(nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193"), {"cik": 320193})
+        self.assertEqual(mock_get.call_args[1]["headers"]["If-None-Match"], '"abc"')
+
+        mock_get.return_value = self.mock_response(content=b'{"cik": 789019}')
+        self.assertEqual(nwc.make_request_json(EndpointEnum.SUBMISSIONS_CIK, CIK="0000320193"), {"cik": 789019})
+        self.assertEqual(mock_get.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import re
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from secpy.core.resumable_downloader import IncompleteDownloadError, RangeNotHonouredError, ResumableDownloader
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers, body=b"", fail_after=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.__body = body
+        self.__fail_after = fail_after
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.__body), chunk_size):
+            if self.__fail_after is not None and i >= self.__fail_after:
+                raise requests.exceptions.ChunkedEncodingError("Connection broken")
+            yield self.__body[i:i + chunk_size]
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class FakeServer:
+    __RANGE_REGEX = re.compile(r"bytes=(\d+)-(\d*)")
+
+    def __init__(self, content, etag='"v1"', accepts_ranges=True, send_content_length=True):
+        """
+        Serves content the way a web server handling Range/If-Range requests would, optionally breaking the first responses off early
+        """
+        self.content = content
+        self.etag = etag
+        self.accepts_ranges = accepts_ranges
+        self.send_content_length = send_content_length
+        self.fail_after = []
+        self.requests = []
+        self.__lock = threading.Lock()
+
+    def head(self, url, **kwargs):
+        headers = {"ETag": self.etag, "content-length": str(len(self.content))}
+        if self.accepts_ranges:
+            headers["Accept-Ranges"] = "bytes"
+        return FakeResponse(200, headers)
+
+    def get(self, url, headers=None, **kwargs):
+        with self.__lock:
+            self.requests.append(headers)
+            fail_after = self.fail_after.pop(0) if self.fail_after else None
+        range_match = self.__RANGE_REGEX.match(headers.get("Range", ""))
+        if range_match and self.accepts_ranges and headers.get("If-Range", self.etag) == self.etag:
+            start = int(range_match.group(1))
+            end = int(range_match.group(2)) if range_match.group(2) else len(self.content) - 1
+            if start >= len(self.content):
+                return FakeResponse(416, {"Content-Range": "bytes */{}".format(len(self.content))})
+            body = self.content[start:end + 1]
+            response_headers = {"ETag": self.etag, "content-length": str(len(body)),
+                                "Content-Range": "bytes {}-{}/{}".format(start, end, len(self.content))}
+            return FakeResponse(206, response_headers, body, fail_after)
+        response_headers = {"ETag": self.etag}
+        if self.send_content_length:
+            response_headers["content-length"] = str(len(self.content))
+        return FakeResponse(200, response_headers, self.content, fail_after)
+
+
+@patch("backoff._sync.time.sleep", Mock())
+class ResumableDownloaderTest(unittest.TestCase):
+    URL = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.temp_dir, "submissions.zip")
+        self.content = os.urandom(10000)
+        self.server = FakeServer(self.content)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def __get_downloader(self, max_retries=5):
+        return ResumableDownloader(self.server, Mock(), {"User-Agent": "test-agent"}, max_retries)
+
+    def __read_file(self):
+        with open(self.file_path, "rb") as file:
+            return file.read()
+
+    def test_download(self):
+        self.assertEqual(self.__get_downloader().download(self.URL, self.file_path, chunk_size=1000, disable_progress_bar=True), 10000)
+        self.assertEqual(self.__read_file(), self.content)
+        self.assertListEqual(os.listdir(self.temp_dir), ["submissions.zip"])
+        self.assertEqual(self.server.requests[0]["Accept-Encoding"], "identity")
+
+    def test_download_resumes_after_failure(self):
+        self.server.fail_after = [3000, 2000]
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=1000, disable_progress_bar=True)
+        self.assertEqual(self.__read_file(), self.content)
+        self.assertNotIn("Range", self.server.requests[0])
+        self.assertEqual(self.server.requests[1]["Range"], "bytes=3000-")
+        self.assertEqual(self.server.requests[1]["If-Range"], '"v1"')
+        self.assertEqual(self.server.requests[2]["Range"], "bytes=5000-")
+
+    def test_download_resumes_from_previous_call(self):
+        self.server.fail_after = [4000]
+        self.assertRaises(requests.exceptions.ChunkedEncodingError,
+                          self.__get_downloader(max_retries=1).download, self.URL, self.file_path, 1000, 1, True)
+        self.assertFalse(os.path.exists(self.file_path))
+        self.assertEqual(os.path.getsize(self.file_path + ResumableDownloader.PART_SUFFIX), 4000)
+
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=1000, disable_progress_bar=True)
+        self.assertEqual(self.server.requests[-1]["Range"], "bytes=4000-")
+        self.assertEqual(self.__read_file(), self.content)
+
+    def test_download_restarts_when_file_changed(self):
+        self.server.fail_after = [4000]
+        self.assertRaises(requests.exceptions.ChunkedEncodingError,
+                          self.__get_downloader(max_retries=1).download, self.URL, self.file_path, 1000, 1, True)
+        self.server.content = os.urandom(12000)
+        self.server.etag = '"v2"'
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=1000, disable_progress_bar=True)
+        self.assertEqual(self.__read_file(), self.server.content)
+
+    def test_download_without_content_length(self):
+        self.server.send_content_length = False
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=1000, disable_progress_bar=True)
+        self.assertEqual(self.__read_file(), self.content)
+
+    def test_download_incomplete(self):
+        truncated_response = FakeResponse(200, {"content-length": "20000"}, self.content)
+        server = Mock()
+        server.get.return_value = truncated_response
+        downloader = ResumableDownloader(server, Mock(), {}, max_retries=2)
+        self.assertRaises(IncompleteDownloadError, downloader.download, self.URL, self.file_path, 1000, 1, True)
+        self.assertFalse(os.path.exists(self.file_path))
+
+    def test_download_segments(self):
+        self.server.fail_after = [1000]
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=500, segments=4, disable_progress_bar=True)
+        self.assertEqual(self.__read_file(), self.content)
+        ranges = sorted(headers["Range"] for headers in self.server.requests)
+        self.assertIn("bytes=0-2499", ranges)
+        self.assertIn("bytes=7500-9999", ranges)
+        self.assertEqual(len(ranges), 5)
+        self.assertListEqual(os.listdir(self.temp_dir), ["submissions.zip"])
+
+    def test_download_segments_when_file_changed(self):
+        # the file changes between the HEAD request and the range requests, so the server sends the whole new file back
+        self.server.head = Mock(return_value=FakeResponse(200, {"ETag": '"v0"', "content-length": "10000", "Accept-Ranges": "bytes"}))
+        downloader = self.__get_downloader()
+        self.assertRaises(RangeNotHonouredError, downloader.download, self.URL, self.file_path, 500, 4, True)
+        # not retried
+        self.assertEqual(len(self.server.requests), 4)
+
+    def test_discard(self):
+        self.server.fail_after = [1000, 1000]
+        self.assertRaises(requests.exceptions.ChunkedEncodingError,
+                          self.__get_downloader(max_retries=1).download, self.URL, self.file_path, 500, 4, True)
+        self.assertGreater(len(os.listdir(self.temp_dir)), 1)
+        ResumableDownloader.discard(self.file_path)
+        self.assertListEqual(os.listdir(self.temp_dir), [])
+
+    def test_download_segments_falls_back_to_single_stream(self):
+        self.server.accepts_ranges = False
+        self.__get_downloader().download(self.URL, self.file_path, chunk_size=500, segments=4, disable_progress_bar=True)
+        self.assertEqual(self.__read_file(), self.content)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_invalid_args(self):
+        self.assertRaises(AssertionError, self.__get_downloader().download, self.URL, self.file_path, 0)
+        self.assertRaises(AssertionError, self.__get_downloader().download, self.URL, self.file_path, 1000, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
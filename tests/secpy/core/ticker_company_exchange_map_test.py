@@ -1,36 +1,149 @@
 import unittest
 from unittest.mock import patch, Mock
 import os
-import json
+import tempfile
 
-from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap, CTEObject
+from secpy.core.endpoint_enum import EndpointEnum
+from secpy.core.response_cache import ResponseCache
+from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap, CTEObject, ExchangeEnum
+from secpy.secpy_client import SECPyClient
 
 MOCK_CTE_DATA = os.path.join(os.path.dirname(__file__), "..", "..", "resources", "company_tickers_exchange.json")
 
 
 class TickerCompanyExchangeMapTest(unittest.TestCase):
 
-    @patch("secpy.core.network_client.requests.get")
+    @patch("secpy.core.network_client.requests.Session.get")
     def test_lookup_ticker(self, mock_get):
-        with open(MOCK_CTE_DATA, "r") as f:
-            mock_get.return_value = Mock(ok=True)
-            mock_get.return_value.json.return_value = json.load(f)
+        with open(MOCK_CTE_DATA, "rb") as f:
+            mock_get.return_value = Mock(ok=True, content=f.read())
         ticker_company_exchange_map = TickerCompanyExchangeMap("/")
         actual_cte_object = ticker_company_exchange_map.lookup_ticker("MSFT")
         expected_cte_object = CTEObject([789019, "MICROSOFT CORP", "MSFT", "Nasdaq"])
         self.assertEqual(actual_cte_object, expected_cte_object)
 
-    @patch("secpy.core.network_client.requests.get")
+    @patch("secpy.core.network_client.requests.Session.get")
     def test_lookup_cik(self, mock_get):
-        with open(MOCK_CTE_DATA, "r") as f:
-            mock_get.return_value = Mock(ok=True)
-            mock_get.return_value.json.return_value = json.load(f)
+        with open(MOCK_CTE_DATA, "rb") as f:
+            mock_get.return_value = Mock(ok=True, content=f.read())
 
         ticker_company_exchange_map = TickerCompanyExchangeMap("/")
         actual_cte_object = ticker_company_exchange_map.lookup_cik("0000789019")
         expected_cte_object = CTEObject([789019, "MICROSOFT CORP", "MSFT", "Nasdaq"])
         self.assertEqual(actual_cte_object, expected_cte_object)
 
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_lookup_cik_unknown(self, mock_get):
+        with open(MOCK_CTE_DATA, "rb") as f:
+            mock_get.return_value = Mock(ok=True, content=f.read())
+
+        ticker_company_exchange_map = TickerCompanyExchangeMap("/")
+        self.assertEqual(ticker_company_exchange_map.lookup_cik("0000000000"), TickerCompanyExchangeMap.UNKNOWN)
+        self.assertEqual(ticker_company_exchange_map.lookup_tickers_for_cik("0000000000"), [])
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_lookup_cik_with_several_tickers(self, mock_get):
+        with open(MOCK_CTE_DATA, "rb") as f:
+            mock_get.return_value = Mock(ok=True, content=f.read())
+
+        ticker_company_exchange_map = TickerCompanyExchangeMap("/")
+        actual_cte_object = ticker_company_exchange_map.lookup_cik("0000019617")
+        expected_cte_object = CTEObject([19617, "JPMORGAN CHASE & CO", "JPM", "NYSE"])
+        self.assertEqual(actual_cte_object, expected_cte_object)
+
+        actual_tickers = [cte_object.ticker for cte_object in ticker_company_exchange_map.lookup_tickers_for_cik("0000019617")]
+        expected_tickers = ["JPM", "JPM-PD", "JPM-PC", "JPM-PL", "JPM-PM", "AMJ", "JPM-PK", "JPM-PJ"]
+        self.assertListEqual(actual_tickers, expected_tickers)
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_filter_companies_by_exchange(self, mock_get):
+        with open(MOCK_CTE_DATA, "rb") as f:
+            mock_get.return_value = Mock(ok=True, content=f.read())
+
+        ticker_company_exchange_map = TickerCompanyExchangeMap("/")
+        cboe_companies = ticker_company_exchange_map.filter_companies_by_exchange(ExchangeEnum.CBOE)
+        self.assertEqual(len(cboe_companies), 16)
+        self.assertTrue(all(cte_object.exchange == ExchangeEnum.CBOE.value for cte_object in cboe_companies.values()))
+        self.assertNotIn("MSFT", cboe_companies)
+        self.assertIn("MSFT", ticker_company_exchange_map.filter_companies_by_exchange(ExchangeEnum.NASDAQ))
+
+
+class TickerCompanyExchangeMapCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        with open(MOCK_CTE_DATA, "rb") as f:
+            self.cte_content = f.read()
+        TickerCompanyExchangeMap.reset_shared()
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+        TickerCompanyExchangeMap.reset_shared()
+
+    def mock_response(self, status_code=200, headers=None):
+        return Mock(ok=True, status_code=status_code, content=self.cte_content, headers=headers or {})
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_cached_on_disk(self, mock_get):
+        mock_get.return_value = self.mock_response(headers={"ETag": "\"abc\""})
+        TickerCompanyExchangeMap("/", cache_dir=self.cache_dir.name).lookup_ticker("MSFT")
+        self.assertIsNotNone(ResponseCache(self.cache_dir.name).get(EndpointEnum.COMPANY_TICKER_EXCHANGE.value))
+
+        actual_cte_object = TickerCompanyExchangeMap("/", cache_dir=self.cache_dir.name).lookup_ticker("MSFT")
+        self.assertEqual(actual_cte_object, CTEObject([789019, "MICROSOFT CORP", "MSFT", "Nasdaq"]))
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_stale_cache_is_revalidated(self, mock_get):
+        mock_get.return_value = self.mock_response(headers={"ETag": "\"abc\"", "Last-Modified": "Mon, 07 Feb 2022 22:57:00 GMT"})
+        TickerCompanyExchangeMap("/", cache_dir=self.cache_dir.name, cache_ttl=0).lookup_ticker("MSFT")
+
+        mock_get.return_value = self.mock_response(status_code=304)
+        actual_cte_object = TickerCompanyExchangeMap("/", cache_dir=self.cache_dir.name, cache_ttl=0).lookup_ticker("MSFT")
+        self.assertEqual(actual_cte_object, CTEObject([789019, "MICROSOFT CORP", "MSFT", "Nasdaq"]))
+        self.assertEqual(mock_get.call_count, 2)
+        conditional_headers = mock_get.call_args[1]["headers"]
+        self.assertEqual(conditional_headers["If-None-Match"], "\"abc\"")
+        self.assertEqual(conditional_headers["If-Modified-Since"], "Mon, 07 Feb 2022 22:57:00 GMT")
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_cached_in_client_response_cache(self, mock_get):
+        mock_get.return_value = self.mock_response()
+        cache = ResponseCache(self.cache_dir.name, ttls={EndpointEnum.COMPANY_TICKER_EXCHANGE: 60})
+        TickerCompanyExchangeMap("/", cache=cache).lookup_ticker("MSFT")
+        TickerCompanyExchangeMap("/", cache=cache).lookup_ticker("MSFT")
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_shared(self, mock_get):
+        mock_get.return_value = self.mock_response()
+        shared = TickerCompanyExchangeMap.shared("/", cache_dir=self.cache_dir.name)
+        self.assertIs(shared, TickerCompanyExchangeMap.shared("/", cache_dir=self.cache_dir.name))
+        shared.lookup_ticker("MSFT")
+        TickerCompanyExchangeMap.shared("/", cache_dir=self.cache_dir.name).lookup_ticker("AAPL")
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_shared_is_keyed_on_args(self, mock_get):
+        mock_get.return_value = self.mock_response()
+        shared = TickerCompanyExchangeMap.shared("/")
+        self.assertIsNot(shared, TickerCompanyExchangeMap.shared("/", cache_dir=self.cache_dir.name))
+        self.assertIsNot(shared, TickerCompanyExchangeMap.shared("/", max_retries=2))
+        self.assertIsNot(shared, TickerCompanyExchangeMap.shared("other-agent"))
+        # nothing is written to disk unless a cache_dir is given
+        shared.lookup_ticker("MSFT")
+        self.assertListEqual(os.listdir(self.cache_dir.name), [])
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_client_ticker_company_exchange_map(self, mock_get):
+        mock_get.return_value = self.mock_response()
+        client = SECPyClient("/", ticker_cache_dir=self.cache_dir.name)
+        ticker_company_exchange_map = client.ticker_company_exchange_map()
+        self.assertIs(ticker_company_exchange_map, client.submissions()._ticker_cte_map)
+        ticker_company_exchange_map.lookup_ticker("MSFT")
+        self.assertIsNotNone(ResponseCache(self.cache_dir.name).get(EndpointEnum.COMPANY_TICKER_EXCHANGE.value))
+        self.assertIsNot(client.ticker_company_exchange_map(max_retries=2), ticker_company_exchange_map)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from secpy.core.json_decoder import JsonDecoder
+from secpy.core.utils.network_client_opts import NetworkClientOpts
+
+
+class NetworkClientOptsTest(unittest.TestCase):
+    def test_get_headers(self):
+        self.assertDictEqual(NetworkClientOpts.get_headers("test-agent"), {"User-Agent": "test-agent"})
+        self.assertRaises(AssertionError, NetworkClientOpts.get_headers, "")
+        self.assertRaises(AssertionError, NetworkClientOpts.get_headers, None)
+
+    def test_validate_max_requests_per_sec(self):
+        self.assertEqual(NetworkClientOpts.validate_max_requests_per_sec(10), 10)
+        for invalid in (0, 11, 2.5):
+            self.assertRaises(AssertionError, NetworkClientOpts.validate_max_requests_per_sec, invalid)
+
+    def test_validate_max_retries(self):
+        self.assertEqual(NetworkClientOpts.validate_max_retries(1), 1)
+        self.assertRaises(AssertionError, NetworkClientOpts.validate_max_retries, 0)
+
+    def test_get_json_decoder(self):
+        self.assertIs(NetworkClientOpts.get_json_decoder(None), JsonDecoder.shared())
+        decoder = JsonDecoder("json")
+        self.assertIs(NetworkClientOpts.get_json_decoder(decoder), decoder)
+        self.assertRaises(AssertionError, NetworkClientOpts.get_json_decoder, "json")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -58,6 +58,20 @@ class PeriodFormatOptsTest(unittest.TestCase):
         expected_period_format = "CY2022"
         self.assertEqual(actual_period_format, expected_period_format)
 
+    def test_get_period_range(self):
+        self.assertListEqual(PeriodFormatOpts.get_period_range(2010, 2012), ["CY2010", "CY2011", "CY2012"])
+        quarterly = PeriodFormatOpts.get_period_range(2010, 2024, quarterly=True)
+        self.assertEqual(len(quarterly), 60)
+        self.assertEqual((quarterly[0], quarterly[-1]), ("CY2010Q1", "CY2024Q4"))
+        instantaneous = PeriodFormatOpts.get_period_range(2022, 2022, quarterly=True, use_instantaneous=True)
+        self.assertListEqual(instantaneous, ["CY2022Q1I", "CY2022Q2I", "CY2022Q3I", "CY2022Q4I"])
+        for period in quarterly + instantaneous:
+            self.assertTrue(PeriodFormatOpts.validate_period_format_arg(period))
+
+    def test_get_period_range_on_invalid_args(self):
+        self.assertRaises(AssertionError, PeriodFormatOpts.get_period_range, 2024, 2010)
+        self.assertRaises(AssertionError, PeriodFormatOpts.get_period_range, 2010, 2024, use_instantaneous=True)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,20 @@
+import unittest
+
+from secpy.core.utils.zip_opts import ZipOpts
+
+
+class ZipOptsTest(unittest.TestCase):
+    def test_parse_cik_from_member_name(self):
+        self.assertEqual(ZipOpts.parse_cik_from_member_name("CIK0000789019.json"), "0000789019")
+        self.assertEqual(ZipOpts.parse_cik_from_member_name("CIK0000789019-submissions-001.json"), "0000789019")
+        self.assertIsNone(ZipOpts.parse_cik_from_member_name("README.txt"))
+        self.assertIsNone(ZipOpts.parse_cik_from_member_name("CIK789019.json"))
+
+    def test_is_submissions_page_member(self):
+        self.assertTrue(ZipOpts.is_submissions_page_member("CIK0000789019-submissions-001.json"))
+        self.assertFalse(ZipOpts.is_submissions_page_member("CIK0000789019.json"))
+        self.assertFalse(ZipOpts.is_submissions_page_member("README.txt"))
+
+
+if __name__ == '__main__':
+    unittest.main()
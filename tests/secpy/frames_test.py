@@ -0,0 +1,155 @@
+import json
+import unittest
+from unittest.mock import patch, Mock
+
+import numpy as np
+import requests
+
+from secpy.frames import Frames, CompanyFrame, FramesEndpoint, FramesPanel
+from tests.testutils.mock_utils import mock_shared_company_tickers_exchange
+
+
+def make_frames_data(values, period="CY2021Q4I", tag="Assets"):
+    return {
+        "taxonomy": "us-gaap",
+        "tag": tag,
+        "ccp": period,
+        "uom": "USD",
+        "label": tag,
+        "description": "",
+        "pts": len(values),
+        "data": [{"accn": "0000000000-21-{:06d}".format(cik),
+                  "cik": cik,
+                  "entityName": "COMPANY {}".format(cik),
+                  "loc": "US-WA" if cik % 2 else "US-NY",
+                  "end": "2021-12-31" if cik % 3 else "2021-09-30",
+                  "val": val}
+                 for cik, val in values.items()]
+    }
+
+
+ASSETS = {1750: 500, 1800: 300, 1961: 900, 2034: 300, 2098: 100}
+LIABILITIES = {1800: 150, 2098: 60, 1750: 250, 320193: 1000}
+
+
+class FramesTest(unittest.TestCase):
+    def setUp(self):
+        self.frames = Frames(make_frames_data(ASSETS))
+
+    def test_frames(self):
+        self.assertEqual(len(self.frames), 5)
+        self.assertListEqual(self.frames.cik.tolist(), list(ASSETS.keys()))
+        self.assertEqual(self.frames.val.dtype, np.float64)
+        company_frame = self.frames[1]
+        self.assertEqual(company_frame, CompanyFrame(make_frames_data(ASSETS)["data"][1]))
+        self.assertIsInstance(company_frame.val, int)
+        self.assertListEqual(self.frames.data, [CompanyFrame(obj) for obj in make_frames_data(ASSETS)["data"]])
+
+    def test_rank_and_quantile(self):
+        self.assertListEqual(self.frames.rank().tolist(), [2, 3.5, 1, 3.5, 5])
+        self.assertListEqual(self.frames.rank(ascending=True).tolist(), [4, 2.5, 5, 2.5, 1])
+        self.assertListEqual(self.frames.rank(pct=True).tolist(), [0.4, 0.7, 0.2, 0.7, 1])
+        self.assertEqual(self.frames.quantile(0.5), 300)
+        self.assertListEqual(self.frames.quantile([0, 1]).tolist(), [100, 900])
+        self.assertListEqual(self.frames.quantile_bucket(5).tolist(), [3, 1, 4, 1, 0])
+
+    def test_top_n(self):
+        self.assertListEqual(self.frames.top_n(2).cik.tolist(), [1961, 1750])
+        self.assertListEqual(self.frames.top_n(2, ascending=True).cik.tolist(), [2098, 1800])
+        self.assertEqual(len(self.frames.top_n(10)), 5)
+        self.assertEqual(len(self.frames.top_n(0)), 0)
+        self.assertEqual((self.frames.pts, self.frames.top_n(2).pts), (5, 2))
+        self.assertListEqual(self.frames.sort_by_value().val.tolist(), sorted(ASSETS.values(), reverse=True))
+
+    def test_filter(self):
+        self.assertListEqual(self.frames.filter(min_val=300, max_val=500).cik.tolist(), [1750, 1800, 2034])
+        self.assertListEqual(self.frames.filter(ciks=["0000001800", 2098]).cik.tolist(), [1800, 2098])
+        self.assertListEqual(self.frames.filter(locs=["US-NY"]).cik.tolist(), [1750, 1800, 2034, 2098])
+        self.assertListEqual(self.frames.filter(end_before="2021-10-01").cik.tolist(), [cik for cik in ASSETS if cik % 3 == 0])
+        self.assertEqual(self.frames.filter(min_val=1000).tag, "Assets")
+        self.assertEqual(self.frames.filter(min_val=300, max_val=500).pts, 3)
+
+    def test_join(self):
+        assets, liabilities = self.frames.join(Frames(make_frames_data(LIABILITIES, tag="Liabilities")))
+        self.assertListEqual(assets.cik.tolist(), [1750, 1800, 2098])
+        self.assertListEqual(liabilities.cik.tolist(), [1750, 1800, 2098])
+        self.assertListEqual((liabilities.val / assets.val).tolist(), [0.5, 0.5, 0.6])
+        self.assertEqual(liabilities.tag, "Liabilities")
+
+        aligned = Frames.align([self.frames, Frames(make_frames_data(LIABILITIES)), Frames(make_frames_data({2098: 1, 1961: 2}))])
+        self.assertListEqual([frames.cik.tolist() for frames in aligned], [[2098]] * 3)
+        self.assertListEqual(self.frames.get_positions([2098, 1, 1750]).tolist(), [4, -1, 0])
+
+
+def mock_error_response(status_code):
+    response = Mock(ok=False, status_code=status_code)
+    response.raise_for_status.side_effect = requests.exceptions.HTTPError(response=response)
+    return response
+
+
+def mock_frames_response(url):
+    # .../frames/us-gaap/<tag>/USD/<period>.json
+    tag, period = url.split("/")[-3], url.split("/")[-1][:-len(".json")]
+    if period == "CY2020Q4I":
+        return mock_error_response(404)
+    values = ASSETS if tag == "Assets" else LIABILITIES
+    year, quarter = int(period[2:6]), int(period[7])
+    content = json.dumps(make_frames_data({cik: val * year * quarter for cik, val in values.items()}, period, tag))
+    return Mock(ok=True, content=content.encode("utf-8"))
+
+
+class FramesEndpointTest(unittest.TestCase):
+    def setUp(self):
+        mock_shared_company_tickers_exchange()
+        self.frames_endpoint = FramesEndpoint("/")
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_get_frames(self, mock_get):
+        mock_get.side_effect = lambda url, **kwargs: mock_frames_response(url)
+        frames = self.frames_endpoint.get_frames("us-gaap", "Assets", "USD", "CY2021Q4I")
+        self.assertEqual(len(frames), len(ASSETS))
+        self.assertEqual(mock_get.call_args[0][0], "https://data.sec.gov/api/xbrl/frames/us-gaap/Assets/USD/CY2021Q4I.json")
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_get_frames_panel(self, mock_get):
+        mock_get.side_effect = lambda url, **kwargs: mock_frames_response(url)
+        panels = self.frames_endpoint.get_frames_panel(["Assets", ("us-gaap", "Liabilities", "USD")], 2020, 2021,
+                                                       quarterly=True, use_instantaneous=True, max_workers=4)
+        self.assertEqual(mock_get.call_count, 16)
+        self.assertListEqual(sorted(panels), [("us-gaap", "Assets", "USD"), ("us-gaap", "Liabilities", "USD")])
+
+        assets = panels[("us-gaap", "Assets", "USD")]
+        self.assertIsInstance(assets, FramesPanel)
+        self.assertListEqual(assets.periods, ["CY2020Q1I", "CY2020Q2I", "CY2020Q3I", "CY2020Q4I",
+                                              "CY2021Q1I", "CY2021Q2I", "CY2021Q3I", "CY2021Q4I"])
+        self.assertListEqual(assets.missing_periods, ["CY2020Q4I"])
+        self.assertListEqual(assets.ciks.tolist(), sorted(ASSETS))
+        self.assertEqual(assets.shape, (len(ASSETS), 8))
+        self.assertTrue(np.isnan(assets.get_period("CY2020Q4I")).all())
+        self.assertListEqual(assets.get_period("CY2021Q2I").tolist(), [ASSETS[cik] * 2021 * 2 for cik in sorted(ASSETS)])
+        self.assertEqual(assets.get_cik(1961)[0], 900 * 2020)
+        self.assertEqual(assets.get_cik("0000001961")[-1], 900 * 2021 * 4)
+        self.assertRaises(KeyError, assets.get_cik, 320193)
+        self.assertEqual(panels[("us-gaap", "Liabilities", "USD")].get_cik(320193)[4], 1000 * 2021)
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_get_frames_panel_same_concept_in_several_units(self, mock_get):
+        mock_get.side_effect = lambda url, **kwargs: mock_frames_response(url)
+        panels = self.frames_endpoint.get_frames_panel(["Assets", ("us-gaap", "Assets", "EUR")], 2021, 2021, quarterly=True)
+        self.assertListEqual(sorted(panels), [("us-gaap", "Assets", "EUR"), ("us-gaap", "Assets", "USD")])
+        self.assertEqual(panels[("us-gaap", "Assets", "EUR")].unit, "EUR")
+        self.assertEqual(mock_get.call_count, 8)
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_get_frames_panel_raises_on_failed_request(self, mock_get):
+        mock_get.return_value = mock_error_response(403)
+        self.assertRaises(requests.exceptions.HTTPError, self.frames_endpoint.get_frames_panel, ["Assets"], 2021, 2021)
+
+    def test_panel_wo_frames(self):
+        panel = FramesPanel("us-gaap", "Assets", "USD", ["CY2021"], {})
+        self.assertEqual(panel.shape, (0, 1))
+        self.assertListEqual(panel.missing_periods, ["CY2021"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import copy
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+import numpy as np
+
+from secpy.bulk_data_store import BulkDataStore
+from secpy.company_facts import CompanyFactsBulkEndpoint
+from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
+from secpy.frames import Frames
+from secpy.local_frames import LocalFramesEngine
+from tests.testutils.mock_utils import RESOURCES, mock_shared_company_tickers_exchange
+
+with open(os.path.join(RESOURCES, "company_facts.json"), "r") as f:
+    MSFT_DATA = json.load(f)
+
+# a second company w/ the same facts as MSFT at twice the value
+OTHER_DATA = copy.deepcopy(MSFT_DATA)
+OTHER_DATA["cik"] = 1750
+OTHER_DATA["entityName"] = "AAR CORP"
+for concepts in OTHER_DATA["facts"].values():
+    for concept in concepts.values():
+        for facts in concept["units"].values():
+            for fact in facts:
+                fact["val"] *= 2
+
+MSFT_ASSETS = {fact["frame"]: fact for fact in MSFT_DATA["facts"]["us-gaap"]["Assets"]["units"]["USD"] if "frame" in fact}
+
+
+class LocalFramesEngineTest(unittest.TestCase):
+    def setUp(self):
+        mock_shared_company_tickers_exchange()
+        self.temp_dir = tempfile.mkdtemp()
+        archive_path = os.path.join(self.temp_dir, "companyfacts.zip")
+        with ZipFile(archive_path, "w") as zip_file:
+            zip_file.writestr("CIK0000789019.json", json.dumps(MSFT_DATA))
+            zip_file.writestr("CIK0000001750.json", json.dumps(OTHER_DATA))
+        self.archive_engine = LocalFramesEngine(CompanyFactsBulkEndpoint("/", existing_archive=archive_path))
+        self.store = BulkDataStore(os.path.join(self.temp_dir, "secpy.db"))
+        self.store.put_company_facts(MSFT_DATA)
+        self.store.put_company_facts(OTHER_DATA)
+        self.store_engine = LocalFramesEngine(self.store)
+
+    def tearDown(self):
+        self.store.close()
+        TickerCompanyExchangeMap.reset_shared()
+        shutil.rmtree(self.temp_dir)
+
+    def test_compute_frames(self):
+        frames = self.archive_engine.compute_frames(["Assets", "dei:EntityCommonStockSharesOutstanding"])
+        self.assertSetEqual({key[:3] for key in frames}, {("us-gaap", "Assets", "USD"),
+                                                          ("dei", "EntityCommonStockSharesOutstanding", "shares")})
+        self.assertSetEqual({key[3] for key in frames if key[1] == "Assets"}, set(MSFT_ASSETS))
+
+        period, expected = "CY2021Q2I", MSFT_ASSETS["CY2021Q2I"]
+        assets = frames[("us-gaap", "Assets", "USD", period)]
+        self.assertIsInstance(assets, Frames)
+        self.assertEqual((assets.taxonomy, assets.tag, assets.uom, assets.ccp, assets.pts), ("us-gaap", "Assets", "USD", period, 2))
+        self.assertEqual(assets.label, MSFT_DATA["facts"]["us-gaap"]["Assets"]["label"])
+        self.assertListEqual(assets.cik.tolist(), [1750, 789019])
+        self.assertListEqual(assets.val.tolist(), [expected["val"] * 2, expected["val"]])
+        msft = assets[1]
+        self.assertEqual((msft.accn, msft.entity_name, msft.end, msft.val), (expected["accn"], "MICROSOFT CORPORATION", expected["end"], expected["val"]))
+        self.assertIsInstance(msft.val, int)
+        self.assertListEqual(assets.top_n(1).cik.tolist(), [1750])
+
+    def test_compute_frames_w_filters(self):
+        frames = self.archive_engine.compute_frames(["us-gaap:Assets", "EntityCommonStockSharesOutstanding"],
+                                                    periods=["CY2021Q1I", "CY2021Q2I"], units=["USD"], ciks=["0000789019"])
+        self.assertSetEqual(set(frames), {("us-gaap", "Assets", "USD", "CY2021Q1I"), ("us-gaap", "Assets", "USD", "CY2021Q2I")})
+        self.assertTrue(all(frame.cik.tolist() == [789019] for frame in frames.values()))
+
+    def test_store_matches_archive(self):
+        concepts = ["Assets", "dei:EntityCommonStockSharesOutstanding"]
+        from_archive = self.archive_engine.compute_frames(concepts)
+        from_store = self.store_engine.compute_frames(concepts)
+        self.assertSetEqual(set(from_store), set(from_archive))
+        for key, frames in from_archive.items():
+            with self.subTest(key=key):
+                self.assertListEqual(from_store[key].data, frames.data)
+                self.assertEqual((from_store[key].label, from_store[key].description), (frames.label, frames.description))
+                self.assertIsNotNone(frames.label)
+
+        filtered = self.store_engine.compute_frames(concepts, periods=["CY2021Q1I", "CY2021Q2I"], units=["USD"])
+        self.assertSetEqual(set(filtered), {("us-gaap", "Assets", "USD", "CY2021Q1I"), ("us-gaap", "Assets", "USD", "CY2021Q2I")})
+        self.assertListEqual(filtered[("us-gaap", "Assets", "USD", "CY2021Q2I")].data, from_archive[("us-gaap", "Assets", "USD", "CY2021Q2I")].data)
+        self.assertEqual(self.store_engine.get_frames("us-gaap", "Assets", "USD", "CY2021Q2I").label,
+                         MSFT_DATA["facts"]["us-gaap"]["Assets"]["label"])
+
+    def test_get_frames(self):
+        for engine in (self.archive_engine, self.store_engine):
+            frames = engine.get_frames("us-gaap", "Assets", "USD", "CY2021Q2", use_instantaneous=True)
+            self.assertListEqual(frames.val.tolist(), [MSFT_ASSETS["CY2021Q2I"]["val"] * 2, MSFT_ASSETS["CY2021Q2I"]["val"]])
+            missing = engine.get_frames("us-gaap", "Assets", "USD", "CY2010Q1I")
+            self.assertEqual((len(missing), missing.ccp), (0, "CY2010Q1I"))
+
+    def test_get_frames_panel(self):
+        panels = self.store_engine.get_frames_panel(["Assets"], 2020, 2021, quarterly=True, use_instantaneous=True)
+        self.assertListEqual(list(panels), [("us-gaap", "Assets", "USD")])
+        panel = panels[("us-gaap", "Assets", "USD")]
+        self.assertListEqual(panel.ciks.tolist(), [1750, 789019])
+        self.assertListEqual(panel.missing_periods, [period for period in panel.periods if period not in MSFT_ASSETS])
+        expected = [MSFT_ASSETS[period]["val"] if period in MSFT_ASSETS else np.nan for period in panel.periods]
+        np.testing.assert_array_equal(panel.get_cik(789019), expected)
+        np.testing.assert_array_equal(panel.get_cik(1750), np.array(expected) * 2)
+
+    def test_get_frames_panel_same_concept_in_several_units(self):
+        panels = self.store_engine.get_frames_panel(["Assets", ("us-gaap", "Assets", "EUR")], 2021, 2021, quarterly=True,
+                                                    use_instantaneous=True)
+        self.assertSetEqual(set(panels), {("us-gaap", "Assets", "USD"), ("us-gaap", "Assets", "EUR")})
+        self.assertListEqual(panels[("us-gaap", "Assets", "EUR")].missing_periods, panels[("us-gaap", "Assets", "EUR")].periods)
+        self.assertListEqual(panels[("us-gaap", "Assets", "USD")].ciks.tolist(), [1750, 789019])
+
+    def test_invalid_source(self):
+        self.assertRaises(AssertionError, LocalFramesEngine, "companyfacts.zip")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import json
+import os
+import copy
+import threading
+import unittest
+from unittest.mock import patch, Mock
+
+import numpy as np
+
+from secpy.submissions import Submissions, Filing, Address, FilingTable
+from tests.testutils.mock_utils import RESOURCES
+
+with open(os.path.join(RESOURCES, "submissions.json"), "r") as f:
+    SUBMISSIONS_DATA = json.load(f)
+
+with open(os.path.join(RESOURCES, "submissions_page.json"), "rb") as f:
+    SUBMISSIONS_PAGE_CONTENT = f.read()
+
+RECENT_DATA = SUBMISSIONS_DATA["filings"]["recent"]
+PAGE_DATA = json.loads(SUBMISSIONS_PAGE_CONTENT)
+
+
+class SubmissionsTest(unittest.TestCase):
+    def test_submissions(self):
+        submissions = Submissions(SUBMISSIONS_DATA)
+        self.assertEqual(submissions.cik, "0000789019")
+        self.assertEqual(submissions.name, "MICROSOFT CORP")
+        self.assertEqual(submissions.addresses["business"].city, "REDMOND")
+        self.assertEqual(len(submissions.filings.recent_files), len(RECENT_DATA["accessionNumber"]))
+        self.assertEqual(len(submissions.filings.historical_files), 1)
+
+    def test_filing(self):
+        filing = Submissions(SUBMISSIONS_DATA).filings.recent_files[0]
+        self.assertEqual(filing.accession_number, RECENT_DATA["accessionNumber"][0])
+        self.assertEqual(filing.form, RECENT_DATA["form"][0])
+        self.assertEqual(filing.primary_document_link,
+                         "https://www.sec.gov/Archives/edgar/data/789019/{}/{}".format(RECENT_DATA["accessionNumber"][0].replace("-", ""),
+                                                                                      RECENT_DATA["primaryDocument"][0]))
+        self.assertFalse(hasattr(filing, "__dict__"))
+
+    def test_filing_equality(self):
+        filing_data = {k: v[0] for k, v in RECENT_DATA.items()}
+        filing = Filing(filing_data, "0000789019")
+        self.assertEqual(filing, Filing(filing_data, "0000789019"))
+        self.assertEqual(hash(filing), hash(Filing(filing_data, "0000789019")))
+        self.assertNotEqual(filing, Filing(filing_data, "0000000001"))
+        self.assertIn("accession_number={!r}".format(filing_data["accessionNumber"]), repr(filing))
+
+    def test_filing_table_rows_match_filings(self):
+        filings = Submissions(SUBMISSIONS_DATA).filings.recent_files
+        self.assertIsInstance(filings, FilingTable)
+        expected = [Filing({k: v[i] for k, v in RECENT_DATA.items()}, "0000789019") for i in range(len(filings))]
+        self.assertListEqual(filings.to_filings(), expected)
+        self.assertEqual(filings[-1].to_filing(), expected[-1])
+        self.assertEqual(filings[3], filings[3])
+        self.assertRaises(IndexError, filings.__getitem__, len(filings))
+
+    def test_filter_by_form(self):
+        filings = Submissions(SUBMISSIONS_DATA).filings
+        actual = filings.filter_by_form("10-K")
+        expected_accession_numbers = [accn for accn, form in zip(RECENT_DATA["accessionNumber"], RECENT_DATA["form"]) if form == "10-K"]
+        self.assertTrue(len(expected_accession_numbers) > 0)
+        self.assertListEqual([filing.accession_number for filing in actual], expected_accession_numbers)
+        self.assertEqual(len(filings.recent_files.filter_by_form(["10-K", "10-Q"])),
+                         sum(form in ("10-K", "10-Q") for form in RECENT_DATA["form"]))
+        self.assertEqual(len(filings.filter_by_form("S-1")), 0)
+
+    def test_filter_by_filing_date_and_xbrl(self):
+        filings = Submissions(SUBMISSIONS_DATA).filings.recent_files
+        actual = filings.filter_by_filing_date("2021-01-01", "2021-12-31").filter_xbrl()
+        expected = [accn for accn, filing_date, is_xbrl in zip(RECENT_DATA["accessionNumber"], RECENT_DATA["filingDate"], RECENT_DATA["isXBRL"])
+                    if "2021-01-01" <= filing_date <= "2021-12-31" and is_xbrl]
+        self.assertListEqual([filing.accession_number for filing in actual], expected)
+        self.assertEqual(actual.get_column(Filing.FilingSchemaEnum.FILING_DATE.value).dtype, np.dtype("datetime64[D]"))
+        # views of views resolve to rows of the original columns
+        self.assertListEqual([filing.accession_number for filing in actual[1:]], expected[1:])
+
+    def test_get_by_accession_number(self):
+        filings = Submissions(SUBMISSIONS_DATA).filings
+        accession_number = RECENT_DATA["accessionNumber"][5]
+        self.assertEqual(filings.get_by_accession_number(accession_number).form, RECENT_DATA["form"][5])
+        self.assertIn(accession_number, filings.recent_files)
+        self.assertIsNone(filings.get_by_accession_number("0000000000-00-000000"))
+        ten_ks = filings.filter_by_form("10-K")
+        self.assertIsNone(ten_ks.get_by_accession_number(RECENT_DATA["accessionNumber"][1]))
+        self.assertEqual(ten_ks.get_by_accession_number(ten_ks[0].accession_number), ten_ks[0])
+
+    def test_query(self):
+        filings = Submissions(SUBMISSIONS_DATA).filings
+        rows = list(zip(RECENT_DATA["accessionNumber"], RECENT_DATA["form"], RECENT_DATA["filingDate"]))
+        actual = filings.query(form=["10-K", "10-Q"], start_date="2020-06-01", end_date="2021-12-31")
+        expected = [accn for accn, form, filing_date in rows if form in ("10-K", "10-Q") and "2020-06-01" <= filing_date <= "2021-12-31"]
+        self.assertTrue(len(expected) > 0)
+        self.assertListEqual([filing.accession_number for filing in actual], expected)
+
+        actual = filings.query(start_date="2021-01-01")
+        self.assertListEqual([filing.accession_number for filing in actual], [accn for accn, _, filing_date in rows if filing_date >= "2021-01-01"])
+        ten_k = next(accn for accn, form, _ in rows if form == "10-K")
+        eight_k = next(accn for accn, form, _ in rows if form == "8-K")
+        actual = filings.query(form="10-K", accession_numbers=[ten_k, eight_k])
+        self.assertListEqual([filing.accession_number for filing in actual], [ten_k])
+        self.assertEqual(len(filings.query()), len(rows))
+        self.assertEqual(len(filings.query(form="S-1", start_date="2020-01-01")), 0)
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_load_all(self, mock_get):
+        mock_get.return_value = Mock(ok=True, content=SUBMISSIONS_PAGE_CONTENT)
+        filings = Submissions(SUBMISSIONS_DATA).filings
+        all_filings = filings.load_all("test-agent")
+        # the first filing of the page repeats the last recent filing
+        self.assertEqual(len(all_filings), len(RECENT_DATA["accessionNumber"]) + len(PAGE_DATA["accessionNumber"]) - 1)
+        self.assertEqual(len({filing.accession_number for filing in all_filings}), len(all_filings))
+        filing_dates = [filing.filing_date for filing in all_filings]
+        self.assertListEqual(filing_dates, sorted(filing_dates, reverse=True))
+        self.assertIsNotNone(all_filings.get_by_accession_number(PAGE_DATA["accessionNumber"][-1]))
+        self.assertEqual(mock_get.call_args[0][0], "https://data.sec.gov/submissions/CIK0000789019-submissions-001.json")
+
+        self.assertIs(filings.load_all("test-agent"), all_filings)
+        mock_get.assert_called_once()
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_lookups_search_all_filings_after_load_all(self, mock_get):
+        mock_get.return_value = Mock(ok=True, content=SUBMISSIONS_PAGE_CONTENT)
+        filings = Submissions(SUBMISSIONS_DATA).filings
+        oldest = PAGE_DATA["accessionNumber"][-1]
+        self.assertIsNone(filings.get_by_accession_number(oldest))
+        self.assertEqual(len(filings.query(accession_numbers=[oldest])), 0)
+
+        filings.load_all("test-agent")
+        self.assertEqual(filings.get_by_accession_number(oldest).form, PAGE_DATA["form"][-1])
+        self.assertListEqual([filing.accession_number for filing in filings.query(accession_numbers=[oldest])], [oldest])
+        self.assertIn(oldest, [filing.accession_number for filing in filings.filter_by_form(PAGE_DATA["form"][-1])])
+
+    @patch("secpy.core.network_client.requests.Session.get")
+    def test_load_all_pages_concurrently(self, mock_get):
+        data = copy.deepcopy(SUBMISSIONS_DATA)
+        page_file = data["filings"]["files"][0]
+        data["filings"]["files"] = [dict(page_file, name="CIK0000789019-submissions-00{}.json".format(i)) for i in range(1, 5)]
+        # every page request waits for the other three, so the pages can only be loaded if they are requested at the same time
+        barrier = threading.Barrier(4, timeout=5)
+
+        def get_page(*args, **kwargs):
+            barrier.wait()
+            return Mock(ok=True, content=SUBMISSIONS_PAGE_CONTENT)
+
+        mock_get.side_effect = get_page
+        all_filings = Submissions(data).filings.load_all("test-agent", max_workers=4)
+        self.assertEqual(mock_get.call_count, 4)
+        # every page holds the same filings, which are only kept once
+        self.assertEqual(len(all_filings), len(RECENT_DATA["accessionNumber"]) + len(PAGE_DATA["accessionNumber"]) - 1)
+
+    def test_load_all_wo_historical_files(self):
+        data = copy.deepcopy(SUBMISSIONS_DATA)
+        data["filings"]["files"] = []
+        filings = Submissions(data).filings
+        self.assertListEqual(filings.load_all("test-agent").to_filings(), filings.recent_files.to_filings())
+
+    def test_address_equality(self):
+        addresses = Submissions(SUBMISSIONS_DATA).addresses
+        self.assertEqual(addresses["business"], addresses["mailing"])
+        self.assertEqual(addresses["business"], Address(SUBMISSIONS_DATA["addresses"]["business"]))
+        self.assertNotEqual(addresses["business"], "ONE MICROSOFT WAY")
+
+
+if __name__ == '__main__':
+    unittest.main()
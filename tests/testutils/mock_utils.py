@@ -1,19 +1,31 @@
 from unittest.mock import Mock, patch
 import os.path
-import json
 
 from secpy.core.ticker_company_exchange_map import TickerCompanyExchangeMap
 
 RESOURCES = os.path.join(os.path.dirname(__file__), "..", "resources")
 
 
-@patch("secpy.core.network_client.requests.get")
+@patch("secpy.core.network_client.requests.Session.get")
 def mock_company_tickers_exchange(mock_get):
     mock_cte_path = os.path.join(RESOURCES, "company_tickers_exchange.json")
-    with open(mock_cte_path, "r") as f:
-        mock_get.return_value = Mock(ok=True)
-        mock_get.return_value.json.return_value = json.load(f)
+    with open(mock_cte_path, "rb") as f:
+        mock_get.return_value = Mock(ok=True, content=f.read())
         ticker_company_exchange_map = TickerCompanyExchangeMap("/")
         ticker_company_exchange_map.list_ciks()
         return ticker_company_exchange_map
 
+
+@patch("secpy.core.network_client.requests.Session.get")
+def mock_shared_company_tickers_exchange(mock_get):
+    """
+    Replaces the process-wide TickerCompanyExchangeMap used by endpoint objects w/ one built from the mock
+    company_tickers_exchange.json that isn't cached on disk
+    """
+    mock_cte_path = os.path.join(RESOURCES, "company_tickers_exchange.json")
+    with open(mock_cte_path, "rb") as f:
+        mock_get.return_value = Mock(ok=True, content=f.read())
+        TickerCompanyExchangeMap.reset_shared()
+        ticker_company_exchange_map = TickerCompanyExchangeMap.shared("/", cache_dir=None)
+        ticker_company_exchange_map.list_ciks()
+        return ticker_company_exchange_map